@@ -0,0 +1,34 @@
+import time
+
+class AIScheduler:
+    """Spreads agent decisions across ticks within a time budget.
+
+    Agents are serviced round-robin, carrying on from where the previous
+    tick stopped, until every agent has decided or budget_ms has elapsed.
+    At least one agent decides per tick so the rotation always progresses.
+    With max_decisions set the budget is a fixed number of decisions
+    instead, so a run plays out the same on every machine (GameEnv uses
+    this). Kinematics are not scheduled here and still run every tick.
+    """
+    def __init__(self, budget_ms=1.0, max_decisions=None):
+        self.budget_ms = budget_ms
+        self.max_decisions = max_decisions  # None to use budget_ms
+        self.cursor = 0
+        self.serviced = 0  # Agents that decided on the last tick
+        self.deferred = 0  # Agents left waiting on the last tick
+
+    def run(self, agents, decide):
+        """Call decide(agent) for as many agents as the budget allows"""
+        count = len(agents)
+        limit = count if self.max_decisions is None else min(count, max(1, self.max_decisions))
+        serviced = 0
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        while serviced < limit:
+            self.cursor %= count
+            decide(agents[self.cursor])
+            self.cursor += 1
+            serviced += 1
+            if self.max_decisions is None and time.perf_counter() >= deadline:
+                break
+        self.serviced = serviced
+        self.deferred = count - serviced
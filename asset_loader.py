@@ -1,38 +1,198 @@
+import logging
 import pygame
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from sprite_factory import sprite_factory
+from asset_manifest import AssetManifest
+
+log = logging.getLogger(__name__)
+
+# Images every level may use, relative to the game directory
+COMMON_ASSETS = [
+    "assets/character/player.png",
+    "assets/tools/axe.png",
+    "assets/tools/pickaxe.png",
+    "assets/tools/hammer.png",
+]
+
+# Images to have ready before a level starts, by level number
+LEVEL_ASSETS = {
+    1: ["assets/world/tree.png", "assets/world/stone.png"],
+    2: ["assets/world/tree.png", "assets/world/stone.png"],
+}
 
 class AssetLoader:
-    def __init__(self):
-        self.assets = {}
+    """Loads images in the background within a memory budget.
+
+    PNGs are decoded on a worker thread; update(), called on the main thread
+    between frames, converts them to the display format and adds them to
+    assets. Paths that don't exist or fail to decode are remembered so they
+    are never looked up again. assets is kept in least recently used order
+    and the oldest unpinned images are dropped when the decoded size goes
+    over budget_bytes. Pinned images (the current level's prefetch list)
+    are never dropped. watch() polls the asset directories for edited
+    images and reloads the ones in use the same way.
+    """
+    def __init__(self, budget_bytes=64 * 1024 * 1024, max_per_frame=4):
+        self.assets = OrderedDict()  # Path -> image, least recently used first
+        self.sizes = {}  # Path -> decoded bytes
+        self.missing = set()  # Paths known not to load
+        self.pinned = set()
+        self.pending = set()  # Paths queued or being decoded
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.max_per_frame = max_per_frame  # Decoded images converted per update()
+        self.requests = queue.Queue()
+        self.decoded = queue.Queue()  # (path, image or None) from the worker
+        self.worker = None
+        self.manifest = None
+        self.changes = queue.Queue()  # (path, still exists) from the watcher
+        self.stale = set()  # Paths edited again while being decoded
+
+    def work(self):
+        """Worker thread: decode requested files"""
+        while True:
+            path = self.requests.get()
+            image = None
+            if os.path.exists(path):
+                try:
+                    image = pygame.image.load(path)
+                except pygame.error as e:
+                    log.warning("Failed to load image %s: %s", path, e)
+            self.decoded.put((path, image))
+
+    def request(self, path, reload=False):
+        """Queue path for decoding unless it is loaded, known missing or already queued"""
+        if path in self.pending or (not reload and (path in self.assets or path in self.missing)):
+            return
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.work, daemon=True)
+            self.worker.start()
+        self.pending.add(path)
+        self.requests.put(path)
+
+    def prefetch(self, paths, pin=False):
+        for path in paths:
+            if pin:
+                self.pinned.add(path)
+            self.request(path)
+
+    def prefetch_level(self, level):
+        """Pin the level's images (and the common ones), releasing the previous level's"""
+        self.pinned.clear()
+        self.prefetch(COMMON_ASSETS + LEVEL_ASSETS.get(level, []), pin=True)
+        self.evict()
+
+    def watch(self, interval=1.0):
+        """Poll the asset directories every interval seconds on a background thread"""
+        if self.manifest is None:
+            self.manifest = AssetManifest()
+            threading.Thread(target=self.poll, args=(interval,), daemon=True).start()
+
+    def poll(self, interval):
+        """Watcher thread: report files whose contents changed since the last scan"""
+        self.manifest.scan()  # What is there at startup is loaded on request as usual
+        while True:
+            time.sleep(interval)
+            changed, removed = self.manifest.scan()
+            for path in changed:
+                self.changes.put((path, True))
+            for path in removed:
+                self.changes.put((path, False))
+
+    def update(self):
+        """Add decoded images to the cache; call on the main thread between frames"""
+        # Edited images that are in use are decoded again, new ones can now be found
+        while True:
+            try:
+                path, exists = self.changes.get_nowait()
+            except queue.Empty:
+                break
+            self.missing.discard(path)
+            if not exists:
+                if path in self.assets:
+                    del self.assets[path]
+                    self.used_bytes -= self.sizes.pop(path)
+                self.missing.add(path)
+            elif path in self.pending:
+                self.stale.add(path)
+            elif path in self.assets or path in self.pinned:
+                self.request(path, reload=True)
         
-    def load_image(self, path):
-        """Load an image, returning None if the file doesn't exist."""
+        for _ in range(self.max_per_frame):
+            try:
+                path, image = self.decoded.get_nowait()
+            except queue.Empty:
+                break
+            self.pending.discard(path)
+            if image is None:
+                self.missing.add(path)
+            else:
+                self.store(path, sprite_factory.finalize(image))
+            if path in self.stale:
+                self.stale.discard(path)
+                self.request(path, reload=True)
+
+    def store(self, path, image):
+        if path in self.assets:
+            self.used_bytes -= self.sizes[path]
+        self.assets[path] = image
+        self.assets.move_to_end(path)
+        self.sizes[path] = image.get_width() * image.get_height() * image.get_bytesize()
+        self.used_bytes += self.sizes[path]
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used unpinned images until within budget"""
+        for path in list(self.assets):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            if path not in self.pinned:
+                del self.assets[path]
+                self.used_bytes -= self.sizes.pop(path)
+
+    def load_image(self, path, block=False):
+        """The image at path, or None if it doesn't exist or isn't loaded yet.
+
+        Missing images are requested from the worker; with block=True the
+        image is loaded on the calling thread instead.
+        """
         if path in self.assets:
+            self.assets.move_to_end(path)
             return self.assets[path]
-            
+        if path in self.missing:
+            return None
+        if not block:
+            self.request(path)
+            return None
+        image = None
         if os.path.exists(path):
             try:
-                image = pygame.image.load(path).convert_alpha()
-                self.assets[path] = image
-                return image
-            except pygame.error:
-                print(f"Failed to load image: {path}")
-                return None
-        return None
-    
+                image = sprite_factory.finalize(pygame.image.load(path))
+            except pygame.error as e:
+                log.warning("Failed to load image %s: %s", path, e)
+        if image is None:
+            self.missing.add(path)
+            return None
+        self.store(path, image)
+        return image
+
     def get_character_sprite(self, path="assets/character/player.png"):
         """Try to load character sprite, return None if it doesn't exist."""
         return self.load_image(path)
-    
+
     def get_tool_sprite(self, tool_name):
         """Try to load a tool sprite, return None if it doesn't exist."""
         path = f"assets/tools/{tool_name}.png"
         return self.load_image(path)
-    
+
     def get_world_sprite(self, element_name):
         """Try to load a world element sprite, return None if it doesn't exist."""
         path = f"assets/world/{element_name}.png"
         return self.load_image(path)
 
 # Create a global instance
-asset_loader = AssetLoader() 
\ No newline at end of file
+asset_loader = AssetLoader()
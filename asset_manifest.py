@@ -0,0 +1,51 @@
+import hashlib
+import os
+
+# Directories artists drop images into, as described in the README
+ASSET_DIRECTORIES = ["assets/character", "assets/tools", "assets/world"]
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+class AssetManifest:
+    """Size, modification time and content hash of every PNG in the asset directories.
+
+    scan() compares the directories with the manifest. A file is only
+    hashed again when its size or mtime changed, and only counts as
+    changed when its hash differs, so touching a file doesn't reload it.
+    """
+    def __init__(self, directories=ASSET_DIRECTORIES):
+        self.directories = directories
+        self.entries = {}  # Path -> {"size", "mtime", "hash"}
+
+    def files(self):
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                continue
+            for root, _, names in os.walk(directory):
+                for name in names:
+                    if name.lower().endswith(".png"):
+                        yield os.path.join(root, name).replace(os.sep, "/")
+
+    def scan(self):
+        """Update the manifest, returning the (changed, removed) paths"""
+        changed = []
+        seen = set()
+        for path in self.files():
+            seen.add(path)
+            try:
+                stat = os.stat(path)
+                entry = self.entries.get(path)
+                if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                    continue
+                digest = file_hash(path)
+            except OSError:
+                continue  # Removed or still being written, picked up on a later scan
+            if not entry or entry["hash"] != digest:
+                changed.append(path)
+            self.entries[path] = {"size": stat.st_size, "mtime": stat.st_mtime, "hash": digest}
+        removed = [path for path in self.entries if path not in seen]
+        for path in removed:
+            del self.entries[path]
+        return changed, removed
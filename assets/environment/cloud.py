@@ -1,166 +1,131 @@
 import pygame
 import random
+import numpy
+from collections import OrderedDict
+from sprite_factory import sprite_factory
 
-def create_cloud_sprite(variation=0):
+# Fixed pixel size for consistency
+PIXEL_SIZE = 6
+
+# Metaballs sitting on the flat cloud bottom for each variation:
+# (position across the width, height as a fraction of the sprite height)
+CLOUD_SHAPES = [
+    # Classic cumulus cloud shape - puffy with flat bottom
+    [(0.1, 0.4), (0.3, 0.8), (0.5, 0.95), (0.7, 0.75), (0.9, 0.5)],
+    # Wider, flatter cloud with multiple bumps
+    [(0.1, 0.6), (0.3, 0.85), (0.5, 0.9), (0.7, 0.8), (0.9, 0.55)],
+    # Smaller, more compact cloud with a rounded top
+    [(0.5, 0.7)]
+]
+
+# Blob falloff is (1 - d^2 / r^2)^2, so a lone blob ends where it drops
+# below the threshold, at FIELD_REACH of its radius
+FIELD_THRESHOLD = 0.2
+FIELD_REACH = (1 - FIELD_THRESHOLD ** 0.5) ** 0.5
+
+# Finished sprites by (variation, seed, scale), least recently used first.
+# Unseeded sprites are never cached and the oldest entries are dropped past
+# CLOUD_CACHE_SIZE, since every unseeded create_cloud_variations call picks
+# new seeds.
+CLOUD_CACHE_SIZE = 64
+_cloud_cache = OrderedDict()
+
+def cloud_mask(variation, width, height, rng):
+    """
+    Boolean (columns, rows) grid of the cells a cloud covers.
+    The metaball field is evaluated at every cell centre at once and
+    thresholded, so the shape is always aligned to the pixel grid.
+    """
+    columns = width // PIXEL_SIZE
+    rows = height // PIXEL_SIZE
+    bottom_y = (rows - 1) * PIXEL_SIZE  # The bottom row is left empty
+    x = (numpy.arange(columns) + 0.5) * PIXEL_SIZE
+    y = (numpy.arange(rows) + 0.5) * PIXEL_SIZE
+
+    blobs = CLOUD_SHAPES[variation % len(CLOUD_SHAPES)]
+    # Bumps are narrower than tall; the single-blob cloud stretches across the whole width
+    stretch = width / 2 / (height * blobs[0][1]) if len(blobs) == 1 else 0.6
+    field = numpy.zeros((columns, rows))
+    for position, blob_height in blobs:
+        center_x = (position + rng.uniform(-0.04, 0.04)) * width
+        # Scaled so a lone blob reaches blob_height above the bottom at the threshold
+        radius = blob_height * rng.uniform(0.85, 1.05) * height / FIELD_REACH
+        dx = (x[:, None] - center_x) / stretch
+        dy = y[None, :] - bottom_y
+        field += numpy.maximum(1 - (dx ** 2 + dy ** 2) / radius ** 2, 0) ** 2
+
+    mask = field >= FIELD_THRESHOLD
+    mask[:, y > bottom_y] = False
+    return mask
+
+def create_cloud_sprite(variation=0, seed=None, scale=1.0):
     """
     Creates a 16-bit style cloud sprite as a pygame Surface.
     Returns the sprite ready to use in the game.
-    
+
     variation: 0-2 to determine the cloud shape pattern
+    seed: picks the exact shape and colour; sprites with a seed are cached
+    scale: size multiplier, the pixel grid stays PIXEL_SIZE at every scale
     """
-    # Create a transparent surface for the cloud
+    key = (variation, seed, scale)
+    if seed is not None and key in _cloud_cache:
+        _cloud_cache.move_to_end(key)
+        return _cloud_cache[key]
+    rng = numpy.random.default_rng(seed)
+
     # More consistent sizes
-    width = 96 + random.randint(-8, 8)  # Less random width variation
-    height = 48 + random.randint(-4, 4)  # Less random height variation
-    
-    cloud = pygame.Surface((width, height), pygame.SRCALPHA)
-    
+    width = int((96 + rng.integers(-8, 9)) * scale)  # Less random width variation
+    height = int((48 + rng.integers(-4, 5)) * scale)  # Less random height variation
+
     # Define colors with minimal randomness
-    red_value = random.randint(245, 255)
-    cloud_color = (red_value, 90 + random.randint(0, 20), 110)  # More consistent red cloud color
-    highlight_color = (255, 150 + random.randint(0, 20), 150)  # More consistent highlight
-    
-    # Fixed pixel size for consistency
-    pixel_size = 6
-    
-    # Different cloud patterns based on variation
-    if variation == 0:
-        # Classic cumulus cloud shape - puffy with flat bottom
-        pixels = []
-        
-        # Flat bottom
-        bottom_y = height - pixel_size
-        
-        # Top curved part
-        for x in range(0, width, pixel_size):
-            # Calculate height at this x position (higher in middle, lower at edges)
-            rel_x = x / width  # 0 to 1
-            
-            # Classic cloud shape function (higher in middle)
-            if rel_x < 0.2:
-                # Left side rises
-                column_height = height * 0.4
-            elif rel_x < 0.4:
-                # Left bump
-                column_height = height * 0.8
-            elif rel_x < 0.6:
-                # Middle bump (highest)
-                column_height = height * 0.95
-            elif rel_x < 0.8:
-                # Right bump
-                column_height = height * 0.75
-            else:
-                # Right side falls
-                column_height = height * 0.5
-                
-            # Add pixels for this column
-            for y in range(bottom_y - int(column_height), bottom_y, pixel_size):
-                pixels.append((x, y))
-    
-    elif variation == 1:
-        # Wider, flatter cloud with multiple bumps
-        pixels = []
-        
-        # Flat bottom
-        bottom_y = height - pixel_size
-        
-        # Define bump positions and heights
-        bumps = [
-            (0.1, 0.6),   # (position, height) - position is percentage across width
-            (0.3, 0.85),  # height is percentage of total height
-            (0.5, 0.9),
-            (0.7, 0.8),
-            (0.9, 0.55)
-        ]
-        
-        # Draw columns based on proximity to bumps
-        for x in range(0, width, pixel_size):
-            rel_x = x / width
-            
-            # Find height based on proximity to bumps
-            max_height = 0
-            for bump_pos, bump_height in bumps:
-                # Calculate influence based on distance to this bump
-                distance = abs(rel_x - bump_pos)
-                if distance < 0.2:  # Only bumps influence within 20% of width
-                    # Height falls off with distance
-                    influence = 1 - (distance / 0.2)
-                    height_at_bump = height * bump_height * influence
-                    max_height = max(max_height, height_at_bump)
-            
-            # Ensure there's always some height
-            column_height = max(max_height, height * 0.3)
-                
-            # Add pixels for this column
-            for y in range(bottom_y - int(column_height), bottom_y, pixel_size):
-                pixels.append((x, y))
-    
-    else:
-        # Smaller, more compact cloud
-        pixels = []
-        
-        # Flat bottom with rounded top
-        bottom_y = height - pixel_size
-        
-        # Draw a simple rounded shape
-        for x in range(0, width, pixel_size):
-            rel_x = x / width
-            
-            # Parabolic top (rounded)
-            # Formula: height * (1 - 4 * (x - 0.5)²)
-            column_height = height * 0.7 * (1 - 4 * (rel_x - 0.5) * (rel_x - 0.5))
-            column_height = max(column_height, height * 0.2)  # Ensure minimum height
-                
-            # Add pixels for this column
-            for y in range(bottom_y - int(column_height), bottom_y, pixel_size):
-                pixels.append((x, y))
-    
-    # Reduce randomness for more consistent cloud shapes
-    final_pixels = pixels
-    
-    # Generate highlights consistently on top part of cloud
-    highlight_pixels = []
-    for px, py in final_pixels:
-        # Highlights consistently on top part and left edge
-        if py < (height * 0.4) or px < (width * 0.25):
-            highlight_pixels.append((px, py))
-    
-    # Draw base of cloud
-    for px, py in final_pixels:
-        pygame.draw.rect(cloud, cloud_color, (px, py, pixel_size, pixel_size))
-    
-    # Add highlights
-    for px, py in highlight_pixels:
-        pygame.draw.rect(cloud, highlight_color, (px, py, pixel_size, pixel_size))
-        
+    red_value = rng.integers(245, 256)
+    cloud_color = (red_value, 90 + rng.integers(0, 21), 110)  # More consistent red cloud color
+    highlight_color = (255, 150 + rng.integers(0, 21), 150)  # More consistent highlight
+
+    mask = cloud_mask(variation, width, height, rng)
+    columns, rows = mask.shape
+
+    # Highlights consistently on top part and left edge
+    highlight = numpy.zeros_like(mask)
+    highlight[:, (numpy.arange(rows) * PIXEL_SIZE) < height * 0.4] = True
+    highlight[(numpy.arange(columns) * PIXEL_SIZE) < width * 0.25, :] = True
+    highlight &= mask
+
+    # Expand cells to pixels and write them straight into the surface
+    colors = numpy.zeros((columns, rows, 3), dtype=numpy.uint8)
+    colors[mask] = cloud_color
+    colors[highlight] = highlight_color
+    cells = numpy.ones((PIXEL_SIZE, PIXEL_SIZE), dtype=numpy.uint8)
+    cloud = pygame.Surface((width, height), pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(cloud)
+    alpha = pygame.surfarray.pixels_alpha(cloud)
+    for channel in range(3):
+        pixels[:columns * PIXEL_SIZE, :rows * PIXEL_SIZE, channel] = numpy.kron(colors[:, :, channel], cells)
+    alpha[:columns * PIXEL_SIZE, :rows * PIXEL_SIZE] = numpy.kron(mask.astype(numpy.uint8) * 255, cells)
+    del pixels, alpha  # Unlock the surface
+    cloud = sprite_factory.finalize(cloud)
+
+    if seed is not None:
+        _cloud_cache[key] = cloud
+        if len(_cloud_cache) > CLOUD_CACHE_SIZE:
+            _cloud_cache.popitem(last=False)
     return cloud
 
 # Generate different cloud variations
-def create_cloud_variations(world_width, screen_height):
+def create_cloud_variations(world_width, screen_height, count=12, seed=None):
     """
-    Creates cloud sprites with consistent shapes.
+    Creates count cloud sprites, cycling through the variations and scales.
     Accepts world_width and screen_height but may not use them directly yet.
+    Sprites come from the cache, so passing the same seed again costs nothing.
+    Without a seed a random one is picked and the sprites are cached under it.
     Returns a list of cloud sprites.
     """
+    if seed is None:
+        seed = random.randrange(1 << 30)
+    scales = (1.0, 0.8, 1.2)
     clouds = []
-    
-    # Create each variation type exactly twice
-    for variation in range(3):
-        for _ in range(2):
-            cloud = create_cloud_sprite(variation)
-            clouds.append(cloud)
-    
-    # Only add one set of scaled variations for consistency
-    base_clouds = clouds[:3]  # Take one of each variation type
-    
-    for cloud in base_clouds:
-        # Scale consistently
-        smaller_cloud = pygame.transform.scale(cloud, 
-                         (int(cloud.get_width() * 0.8), int(cloud.get_height() * 0.8)))
-        clouds.append(smaller_cloud)
-        
-        larger_cloud = pygame.transform.scale(cloud, 
-                         (int(cloud.get_width() * 1.2), int(cloud.get_height() * 1.2)))
-        clouds.append(larger_cloud)
-    
-    return clouds 
\ No newline at end of file
+    for i in range(count):
+        variation = i % len(CLOUD_SHAPES)
+        scale = scales[(i // len(CLOUD_SHAPES)) % len(scales)]
+        clouds.append(create_cloud_sprite(variation, seed + i, scale))
+    return clouds
@@ -0,0 +1,83 @@
+import math
+import random
+import pygame
+from assets.environment.cloud import create_cloud_variations
+from sprite_factory import sprite_factory
+
+class ParallaxLayer:
+    """A background layer baked once into a strip that wraps around horizontally.
+
+    The strip is at least as wide as the screen, so any scroll position is
+    covered by at most two blits.
+    """
+    def __init__(self, strip, y=0, parallax=0.0, drift=0.0):
+        self.strip = strip
+        self.y = y
+        self.parallax = parallax  # Fraction of the camera movement the layer follows
+        self.drift = drift  # Pixels per second the layer scrolls on its own
+
+    def draw(self, screen, camera_x, time):
+        width = self.strip.get_width()
+        offset = int(camera_x * self.parallax + time * self.drift) % width
+        screen.blit(self.strip, (-offset, self.y))
+        if width - offset < screen.get_width():
+            screen.blit(self.strip, (width - offset, self.y))
+
+class ParallaxBackground:
+    """Sky gradient, far mountains and drifting clouds, drawn back to front"""
+    # Per-level colours: sky top, sky horizon, mountains
+    PALETTES = {
+        1: ((70, 130, 200), (135, 206, 235), (120, 130, 170)),
+        2: ((60, 110, 150), (150, 200, 190), (70, 110, 80))
+    }
+
+    def __init__(self, screen_size, level=1, strip_width=1600):
+        width, height = screen_size
+        sky_top, sky_horizon, mountain_color = self.PALETTES.get(level, self.PALETTES[2])
+        strip_width = max(strip_width, width)
+        self.layers = [
+            ParallaxLayer(self.bake_sky(width, height, sky_top, sky_horizon)),
+            ParallaxLayer(self.bake_mountains(strip_width, 220, mountain_color), y=height - 320, parallax=0.3),
+            ParallaxLayer(self.bake_clouds(strip_width, 200, seed=level * 1000), y=10, parallax=0.1, drift=6)
+        ]
+
+    def bake_sky(self, width, height, top, horizon):
+        sky = pygame.Surface((width, height))
+        for y in range(height):
+            blend = y / (height - 1)
+            color = [int(top[i] + (horizon[i] - top[i]) * blend) for i in range(3)]
+            pygame.draw.line(sky, color, (0, y), (width - 1, y))
+        return sprite_factory.finalize(sky)
+
+    def bake_mountains(self, width, height, color):
+        """Ridge line made of a few sine waves whose periods divide the strip, so it tiles"""
+        strip = pygame.Surface((width, height), pygame.SRCALPHA)
+        waves = [(random.randint(2, 3), random.uniform(0, 2 * math.pi), 0.35),
+                 (random.randint(5, 7), random.uniform(0, 2 * math.pi), 0.15),
+                 (random.randint(11, 15), random.uniform(0, 2 * math.pi), 0.05)]
+        points = [(0, height)]
+        for x in range(0, width + 1, 8):
+            ridge = sum(amplitude * math.sin(2 * math.pi * cycles * x / width + phase)
+                        for cycles, phase, amplitude in waves)
+            points.append((x, height * (0.45 - ridge * 0.6)))
+        points.append((width, height))
+        pygame.draw.polygon(strip, color, points)
+        return sprite_factory.finalize(strip)
+
+    def bake_clouds(self, width, height, count=16, seed=None):
+        """Every cloud is unique; a fixed seed lets rebuilt levels reuse the cached sprites"""
+        strip = pygame.Surface((width, height), pygame.SRCALPHA)
+        sprites = create_cloud_variations(width, height, count, seed)
+        random.shuffle(sprites)
+        for i, sprite in enumerate(sprites):
+            x = int((i + random.uniform(0, 0.6)) * width / count)
+            y = random.randint(0, height - sprite.get_height())
+            # Clouds crossing the right edge continue on the left so the strip tiles
+            strip.blit(sprite, (x, y))
+            if x + sprite.get_width() > width:
+                strip.blit(sprite, (x - width, y))
+        return sprite_factory.finalize(strip)
+
+    def draw(self, screen, camera_x, time):
+        for layer in self.layers:
+            layer.draw(screen, camera_x, time)
@@ -0,0 +1,174 @@
+import os
+import weakref
+import pygame
+from sprite_factory import sprite_factory
+
+def parse_size(text):
+    """'1600x1200' -> (1600, 1200)"""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+def size_setting(size, variable):
+    """The size argument, else the environment variable (e.g. "1600x1200"), else None"""
+    if size is None and os.environ.get(variable):
+        try:
+            size = parse_size(os.environ[variable])
+        except ValueError:
+            print(f"Ignoring invalid {variable}: {os.environ[variable]}")
+    return size
+
+def window_size_setting(window_size=None):
+    """The window_size argument, else GAME_WINDOW_SIZE, else None"""
+    return size_setting(window_size, "GAME_WINDOW_SIZE")
+
+def world_size_setting(world_size=None):
+    """The world_size argument, else GAME_CANVAS_SIZE (e.g. "400x300"), else None"""
+    return size_setting(world_size, "GAME_CANVAS_SIZE")
+
+def create_display(canvas_size, window_size=None, backend=None, world_size=None):
+    """Display for the backend argument, else GAME_RENDERER ("surface" or "texture")"""
+    backend = backend or os.environ.get("GAME_RENDERER", "surface")
+    if backend == "texture":
+        try:
+            return TextureDisplay(canvas_size, window_size, world_size)
+        except (ImportError, RuntimeError) as e:  # pygame.error and SDL errors
+            print(f"Texture renderer unavailable, using surfaces: {e}")
+    elif backend != "surface":
+        print(f"Unknown renderer {backend}, using surfaces")
+    return Display(canvas_size, window_size, world_size)
+
+class Display:
+    """Window that shows a fixed-resolution canvas.
+
+    The world pass is drawn into world_canvas, which can be smaller than
+    the canvas (GAME_CANVAS_SIZE, e.g. 400x300) to cut its fill cost;
+    compose() scales it onto the canvas once per frame. The HUD is then
+    drawn into canvas at the game's own resolution, and present() scales
+    that into the window with one transform.scale, so the window can be any
+    size without the game drawing more pixels. Where sizes match the same
+    surface is used and nothing is scaled.
+    """
+    def __init__(self, canvas_size, window_size=None, world_size=None):
+        self.canvas_size = tuple(canvas_size)
+        self.window_size = tuple(window_size_setting(window_size) or canvas_size)
+        self.window = pygame.display.set_mode(self.window_size)
+        if self.window_size == self.canvas_size:
+            self.canvas = self.window
+        else:
+            self.canvas = pygame.Surface(self.canvas_size).convert()
+        self.create_world_canvas(world_size)
+
+    def create_world_canvas(self, world_size):
+        self.world_size = tuple(world_size_setting(world_size) or self.canvas_size)
+        if self.world_size == self.canvas_size:
+            self.world_canvas = self.canvas
+        else:
+            self.world_canvas = pygame.Surface(self.world_size, 0, self.canvas)
+
+    def set_caption(self, title):
+        pygame.display.set_caption(title)
+
+    def draw_world(self, queue):
+        """Draw the queued world pass and scale it up onto the canvas"""
+        queue.flush(self.world_canvas)
+        self.compose()
+
+    def draw_screen(self, queue):
+        """Draw the queued screen-space pass (HUD, overlays) over it"""
+        queue.flush(self.canvas)
+
+    def compose(self):
+        """Scale the world pass up onto the canvas, before the HUD is drawn"""
+        if self.world_canvas is not self.canvas:
+            pygame.transform.scale(self.world_canvas, self.canvas_size, self.canvas)
+
+    def present(self):
+        if self.canvas is not self.window:
+            pygame.transform.scale(self.canvas, self.window_size, self.window)
+        pygame.display.flip()
+
+    def to_canvas(self, pos):
+        """Window position (e.g. the mouse) in canvas pixels"""
+        return (pos[0] * self.canvas_size[0] // self.window_size[0],
+                pos[1] * self.canvas_size[1] // self.window_size[1])
+
+class TextureDisplay(Display):
+    """Display that draws through an SDL renderer instead of the window surface.
+
+    When compositing, each surface the queues draw is uploaded to a texture
+    once and kept for as long as the surface lives; the layers are replayed
+    as Renderer.blit and fill_rect calls and the renderer scales the result
+    to the window. Finalized sprites, HUD overlays and overlay pieces are
+    long-lived, so a normal frame uploads only text and rotated tools that
+    are rebuilt every frame. canvas is not drawn in this mode.
+
+    This is the default on an accelerated renderer. With only SDL's
+    software renderer (e.g. headless) it falls back to compositing canvas
+    on the CPU and uploading it as one streaming texture per frame;
+    GAME_TEXTURE_COMPOSITE=1 or 0 overrides the choice. There is no display
+    surface, so sprites are converted to the canvas format instead.
+    """
+    def __init__(self, canvas_size, window_size=None, world_size=None, composite=None):
+        from pygame._sdl2.video import Window, Renderer, Texture
+        from pygame._sdl2.sdl2 import error as SDLError
+        self.Texture = Texture
+        self.canvas_size = tuple(canvas_size)
+        self.window_size = tuple(window_size_setting(window_size) or canvas_size)
+        self.window = Window(size=self.window_size)
+        try:
+            self.renderer = Renderer(self.window, accelerated=1)
+            accelerated = True
+        except SDLError:
+            self.renderer = Renderer(self.window, accelerated=0)  # SDL's software renderer
+            accelerated = False
+        if composite is None and os.environ.get("GAME_TEXTURE_COMPOSITE"):
+            composite = os.environ["GAME_TEXTURE_COMPOSITE"] == "1"
+        self.composite = accelerated if composite is None else composite
+
+        self.canvas = pygame.Surface(self.canvas_size)
+        sprite_factory.use_format(self.canvas)
+        if self.composite:
+            # Draw code works in canvas pixels, the renderer scales them to the window
+            self.renderer.logical_size = self.canvas_size
+            self.textures = weakref.WeakKeyDictionary()  # Surface -> its texture
+            self.world_size = self.canvas_size
+            self.world_canvas = self.canvas
+        else:
+            self.create_world_canvas(world_size)
+            self.frame_texture = Texture(self.renderer, self.canvas_size, streaming=True)
+            self.target = pygame.Rect((0, 0), self.window_size)
+
+    def set_caption(self, title):
+        self.window.title = title
+
+    def texture(self, surface):
+        """surface's texture, uploaded the first time it is drawn"""
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = self.textures[surface] = self.Texture.from_surface(self.renderer, surface)
+        # Per-surface alpha (e.g. fading notifications) can change after the upload
+        alpha = surface.get_alpha()
+        alpha = 255 if alpha is None else alpha
+        if texture.alpha != alpha:
+            texture.blend_mode = 1  # SDL_BLENDMODE_BLEND
+            texture.alpha = alpha
+        return texture
+
+    def draw_world(self, queue):
+        if not self.composite:
+            return super().draw_world(queue)
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        queue.flush_textures(self.renderer, self.texture)
+
+    def draw_screen(self, queue):
+        if not self.composite:
+            return super().draw_screen(queue)
+        queue.flush_textures(self.renderer, self.texture)
+
+    def present(self):
+        if not self.composite:
+            # Software fallback: the canvas was composited on the CPU
+            self.frame_texture.update(self.canvas)
+            self.renderer.blit(self.frame_texture, self.target)
+        self.renderer.present()
@@ -0,0 +1,122 @@
+from collections import deque
+import numpy
+
+UNREACHABLE = -1
+
+class FlowField:
+    """Shared pursuit field over the terrain, toward a single target.
+
+    A cell is walkable when it is empty with solid ground under it. Walkers
+    move to a neighbouring column by walking level, stepping up one tile or
+    dropping to the first ground below. One breadth-first search from the
+    target gives every walkable cell its distance and the direction (-1, 0
+    or 1) of its next move, so each enemy only does an O(1) lookup.
+
+    The move graph is only rebuilt when the terrain changes and the search
+    is only rerun, at most every interval ticks, when the target changed cell.
+    """
+    def __init__(self, terrain, interval=15):
+        self.terrain = terrain
+        self.interval = interval
+        self.terrain_version = None
+        self.target = None
+        self.distance = numpy.full(terrain.grid.shape, UNREACHABLE, dtype=numpy.int16)
+        self.direction = numpy.zeros(terrain.grid.shape, dtype=numpy.int8)
+        self.searches = 0  # Number of times the field was recomputed
+
+    def rebuild_graph(self):
+        """Rasterize walkable cells and the moves between them"""
+        grid = self.terrain.grid
+        solid_below = numpy.ones(grid.shape, dtype=bool)  # Below the grid counts as solid
+        solid_below[:, :-1] = grid[:, 1:] > 0
+        self.walkable = (grid == 0) & solid_below
+        self.standing_rows = [numpy.flatnonzero(column) for column in self.walkable]
+
+        # Reverse edges: for each cell, the cells that can move into it
+        self.moves = {}
+        self.arrivals = {}
+        for column, rows in enumerate(self.standing_rows):
+            for row in rows:
+                cell = (column, int(row))
+                self.moves[cell] = [move for move in (self.successor(column - 1, row), self.successor(column + 1, row))
+                                    if move is not None]
+                self.arrivals.setdefault(cell, [])
+        for cell, moves in self.moves.items():
+            for move in moves:
+                self.arrivals[move].append(cell)
+        self.terrain_version = self.terrain.version
+
+    def successor(self, column, row):
+        """Cell reached by walking from row into column, or None if blocked"""
+        if column < 0 or column >= self.terrain.columns:
+            return None
+        if self.terrain.grid[column, row]:
+            # Step up onto a one-tile ledge
+            if row > 0 and self.walkable[column, row - 1]:
+                return (column, row - 1)
+            return None
+        # Walk level or drop to the first ground below
+        rows = self.standing_rows[column]
+        index = numpy.searchsorted(rows, row)
+        if index < len(rows):
+            return (column, int(rows[index]))
+        return None
+
+    def cell_below(self, x, width, bottom):
+        """Walkable cell a body of the given feet position stands in, or None"""
+        terrain = self.terrain
+        column = int((x + width / 2 - terrain.origin_x) // terrain.tile_size)
+        row = int((bottom - 1 - terrain.origin_y) // terrain.tile_size)
+        if column < 0 or column >= terrain.columns:
+            return None
+        # In mid-air, use the ground it will land on
+        rows = self.standing_rows[column]
+        index = numpy.searchsorted(rows, max(row, 0))
+        if index < len(rows):
+            return (column, int(rows[index]))
+        return None
+
+    def update(self, tick, x, width, bottom):
+        """Recompute the field toward a target body if due and anything changed"""
+        if self.terrain_version != self.terrain.version:
+            self.rebuild_graph()
+            self.target = None
+        elif tick % self.interval:
+            return
+
+        target = self.cell_below(x, width, bottom)
+        if target == self.target:
+            return
+        self.target = target
+        self.search()
+
+    def search(self):
+        self.searches += 1
+        self.distance.fill(UNREACHABLE)
+        self.direction.fill(0)
+        if self.target is None:
+            return
+
+        # Breadth-first search outward from the target along reversed moves
+        self.distance[self.target] = 0
+        queue = deque([self.target])
+        while queue:
+            cell = queue.popleft()
+            next_distance = self.distance[cell] + 1
+            for source in self.arrivals[cell]:
+                if self.distance[source] == UNREACHABLE:
+                    self.distance[source] = next_distance
+                    self.direction[source] = 1 if cell[0] > source[0] else -1
+                    queue.append(source)
+
+    def steer(self, x, width, bottom):
+        """Return (direction, distance in moves) toward the target for a body.
+
+        Distance is UNREACHABLE when no path exists from where the body stands.
+        """
+        terrain = self.terrain
+        column = int((x + width / 2 - terrain.origin_x) // terrain.tile_size)
+        row = int((bottom - 1 - terrain.origin_y) // terrain.tile_size)
+        if 0 <= column < terrain.columns and 0 <= row < terrain.rows:
+            return int(self.direction[column, row]), int(self.distance[column, row])
+        return 0, UNREACHABLE
@@ -2,16 +2,41 @@ import pygame
 import random
 import sys
 import math
+import numpy
 from tools import Axe, Pickaxe, Hammer, Sword, BuildingSystem
-from sprites import Character, Princess, Food, Crab, KingCrab, Fish, Dinosaur
+from sprites import Character, Princess, Crab, KingCrab, Fish, Dinosaur
 from tool_sprites import AxeSprite, PickaxeSprite, HammerSprite, SwordSprite
-from particles import ParticleSystem
+from particles import ParticleSystem, Particle
 from sound_manager import SoundManager
 from ui import Tooltip, NotificationSystem
-from assets.environment.cloud import create_cloud_variations
+from save_manager import SaveManager
+from timers import TimerWheel
+from hud import HUD
+from display import create_display
+from overlays import OverlayManager
+from terrain import Terrain, is_terrain_tile
+from lod import SimulationLOD
+from flowfield import FlowField
+from ai import AIScheduler
+from school import FishSchool
+from pools import ObjectPool
+from inventory import FoodInventory
+from background import ParallaxBackground
+import render_queue
+from sprite_factory import sprite_factory
+from asset_loader import asset_loader
+
+def enemy_name(enemy_obj):
+    """Name of an enemy for notifications"""
+    if isinstance(enemy_obj, KingCrab):
+        return "King Crab"
+    if isinstance(enemy_obj, Dinosaur):
+        return "Dinosaur"
+    return "Crab"
 
 class Game:
-    def __init__(self):
+    def __init__(self, render_fps=60, autosave=True, window_size=None, renderer=None, world_size=None,
+                 deterministic=False):
         # Initialize Pygame
         pygame.init()
         pygame.mixer.init()
@@ -28,14 +53,34 @@ class Game:
         self.WORLD_WIDTH = 1600  # Wider world for scrolling
         self.SWIM_SPEED = 3  # Swimming speed in water
         
+        # Balance tuning
+        self.TREE_CRAB_CHANCE = 0.3  # Chance a crab appears when chopping a tree
+        self.STONE_CRAB_CHANCE = 0.4  # Chance a crab appears when mining a stone
+        self.XP_GROWTH = 1.5  # Each level requires this much more XP than the last
+        self.ENEMY_CHASE_RANGE = 12  # Moves along the terrain within which enemies chase the player
+        self.AI_BUDGET_MS = 1.0  # Time per tick that enemy decisions may take
+        self.AI_DECISIONS_PER_TICK = 8  # Decisions per tick instead, when deterministic
+        self.deterministic = deterministic  # Same results on every machine, for bots and tests
+        self.ENEMY_SIGHT_RANGE = 400  # Pixels within which enemies can notice the player
+        self.AGGRO_MEMORY = 120  # Ticks an enemy keeps chasing after losing sight of the player
+        self.WATER_TILES_PER_FISH = 4  # Lake size per fish in the school
+        
+        # Timing - all frame counts in the game are simulation ticks at this rate
+        self.FIXED_DT = 1 / 60  # Seconds per simulation tick
+        self.MAX_STEPS_PER_FRAME = 5  # Catch-up cap so slow frames can't spiral
+        self.RENDER_FPS = render_fps  # Independent of the simulation rate (30, 60, 144...)
+        self.tick_count = 0
+        self.render_time = 0.0  # Interpolated simulation time in seconds, for animation
+        
         # Level system
         self.current_level = 1
         self.level_transition_active = False
-        self.transition_timer = 0
+        self.transition_timer = None
         self.transition_delay = 180  # 3 seconds at 60fps
         
         # Camera/Scrolling
         self.camera_x = 0
+        self.prev_camera_x = 0
         
         # Colors
         self.SKY_BLUE = (135, 206, 235)
@@ -46,16 +91,44 @@ class Game:
         self.INVENTORY_BG = (50, 50, 50, 180)
         self.SELECTED_ITEM = (255, 255, 255, 100)
         
-        # Set up display
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        pygame.display.set_caption("Chase Run Swim Jump")
+        # Set up display - the game draws into screen, which is scaled to the window
+        # by either surface blits or an SDL renderer (GAME_RENDERER=texture). The
+        # world pass may render at a lower resolution (GAME_CANVAS_SIZE) and be scaled up
+        self.display = create_display((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), window_size, renderer, world_size)
+        self.screen = self.display.canvas
+        self.render_queue = render_queue.RenderQueue(self.screen.get_size(), self.display.world_size)
+        self.screen_queue = render_queue.RenderQueue(self.screen.get_size())  # HUD and overlays
+        self.display.set_caption("Chase Run Swim Jump")
         self.clock = pygame.time.Clock()
         
-        # Initialize game components
+        # Central timer wheel, advanced once per simulation tick
+        self.timers = TimerWheel()
+        
+        # Off-screen entities are simulated less often
+        self.lod = SimulationLOD(self)
+        
+        # Frequently spawned objects are recycled instead of rebuilt
+        self.pools = {
+            "crab": ObjectPool(Crab),
+            "king_crab": ObjectPool(KingCrab),
+            "dinosaur": ObjectPool(Dinosaur),
+            "fish": ObjectPool(lambda x, y: Fish(self, x, y)),
+            "particle": ObjectPool(Particle)
+        }
+        
+        # Initialize game components, with the level's images decoding in the background
+        asset_loader.prefetch_level(self.current_level)
         self.player = Player(self)
         self.world = World(self, self.current_level)
-        self.tooltip = Tooltip()
-        self.notification_system = NotificationSystem()
+        self.tooltip = Tooltip(self.timers)
+        self.notification_system = NotificationSystem(self.timers)
+        self.hud = HUD(self)
+        self.overlays = OverlayManager(self)
+        
+        # Ring drawn around the closest interactive object
+        marker = pygame.Surface((11, 11), pygame.SRCALPHA)
+        pygame.draw.circle(marker, (255, 255, 255), (5, 5), 5, 1)
+        self.interaction_marker = sprite_factory.finalize(marker)
         
         # Initialize princess NPC
         self.princess = PrincessNPC(self)
@@ -70,9 +143,16 @@ class Game:
         
         # Death and respawn related
         self.death_screen_active = False
-        self.respawn_timer = 0
+        self.respawn_timer = None
         self.respawn_delay = 180  # 3 seconds at 60fps
         
+        # Autosave (disabled for headless sessions such as bots)
+        self.save_manager = SaveManager(self) if autosave else None
+        if self.save_manager:
+            if self.save_manager.has_save():
+                self.load_game()
+            self.timers.schedule(self.save_manager.autosave_interval, self.autosave)
+        
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -116,10 +196,7 @@ class Game:
                         if closest_object:
                             self.player.interact(self.world, closest_object)
                         else:
-                            # Only show notification if cooldown has expired
-                            if self.player.last_interaction_notification <= 0:
-                                self.notification_system.add_notification("Nothing to interact with nearby")
-                                self.player.last_interaction_notification = self.player.notification_cooldown
+                            self.player.notify_nothing_to_interact()
                 elif event.key == pygame.K_h:
                     self.tooltip.toggle_help()
                 elif event.key == pygame.K_1:
@@ -146,7 +223,7 @@ class Game:
                         # OLD LOGIC (now in else block):
                         else:
                             # Get the object under the mouse (using world coordinates)
-                            mouse_pos = pygame.mouse.get_pos()
+                            mouse_pos = self.display.to_canvas(pygame.mouse.get_pos())
                             world_mouse_x = mouse_pos[0] + int(self.camera_x)
                             world_mouse_y = mouse_pos[1]
                             clicked_object = None
@@ -174,7 +251,9 @@ class Game:
                                 self.player.interact(self.world)
                             # If not sword, not building, and no object clicked, then nothing happens
                             # (Removed the unnecessary notification here)
-        # Get keyboard state for movement
+    
+    def handle_movement(self):
+        """Apply held movement keys, once per simulation tick"""
         keys = pygame.key.get_pressed()
         if not self.player.show_inventory:  # Only allow movement when inventory is closed
             dx = 0
@@ -185,31 +264,36 @@ class Game:
             if dx != 0:
                 self.player.move(dx)
     
+    def save_previous_state(self):
+        """Remember positions before a tick so drawing can interpolate between ticks"""
+        self.prev_camera_x = self.camera_x
+        self.player.prev_x = self.player.x
+        self.player.prev_y = self.player.y
+        self.princess.prev_x = self.princess.x
+        for enemy in self.world.enemies:
+            enemy["prev_x"] = enemy["x"]
+            enemy["prev_y"] = enemy["y"]
+    
+    def step(self):
+        """Advance the simulation by one fixed tick"""
+        self.save_previous_state()
+        self.timers.advance()  # Fires any due timers (cooldowns, respawn, transitions...)
+        self.lod.begin_tick()
+        self.handle_movement()
+        self.update()
+        self.tick_count += 1
+    
     def update(self):
         # Check if player died
         if self.player.health <= 0 and not self.death_screen_active:
             self.handle_player_death()
             
-        # Handle respawn timer if death screen is active
-        if self.death_screen_active:
-            self.respawn_timer += 1
-            if self.respawn_timer >= self.respawn_delay:
-                self.respawn_player()
-        # Handle level transition if active
-        elif self.level_transition_active:
-            self.transition_timer += 1
-            if self.transition_timer >= self.transition_delay:
-                self.load_next_level()
-        else:
+        # Respawn and level loading are scheduled on the timer wheel
+        if not (self.death_screen_active or self.level_transition_active):
             # Only update game if player is alive and not transitioning
             self.player.update()
             self.world.update()
-            self.tooltip.update()
-            self.notification_system.update()
-            self.princess.update(self.world)
-            
-            # Check for player collision with enemies
-            self.player.check_enemy_collisions(self.world)
+            self.princess.update(self.world, self.lod.steps(self.princess.x, self.princess.width))
             
             # Update camera position based on player position
             player_center_x = self.player.x + self.player.width // 2
@@ -232,7 +316,9 @@ class Game:
     def start_level_transition(self):
         """Start transition to the next level"""
         self.level_transition_active = True
-        self.transition_timer = 0
+        # Decode the next level's images while the transition screen is up
+        asset_loader.prefetch_level(self.current_level + 1)
+        self.transition_timer = self.timers.schedule(self.transition_delay, self.load_next_level)
         self.notification_system.add_notification("Level Complete! Loading next level...", 180)
                     
     def load_next_level(self):
@@ -243,137 +329,208 @@ class Game:
         # Reset camera
         self.camera_x = 0
         
-        # Reset player position (but keep stats)
-        self.player.x = 100
-        ground_height = self.SCREEN_HEIGHT - 100
-        self.player.y = ground_height - self.player.height
+        # Pin this level's images (usually already decoded during the transition)
+        asset_loader.prefetch_level(self.current_level)
         
-        # Create a new world for this level
+        # Create a new world for this level, recycling the old one's pooled objects
+        self.world.release()
         self.world = World(self, self.current_level)
         
+        # Reset player position onto the new terrain (but keep stats)
+        self.player.x = 100
+        self.player.y = self.world.terrain.surface_y(self.player.x, self.player.width) - self.player.height
+        self.save_previous_state()  # Don't interpolate across the level change
+        
+        # A new level needs a fresh base snapshot
+        if self.save_manager:
+            self.save_manager.save_base()
+        
         # Show level notification
         if self.current_level == 2:
             self.notification_system.add_notification("Level 2: Dinosaur Jungle", 180)
             self.notification_system.add_notification("Find the lake to swim and catch fish!", 180)
         
-    def draw(self):
-        self.screen.fill(self.SKY_BLUE)
-        self.world.draw(self.screen, int(self.camera_x))
-        self.princess.draw(self.screen, int(self.camera_x))
+    def draw(self, alpha=1.0):
+        # alpha is how far we are between the last two simulation ticks (0-1)
+        self.render_time = (self.tick_count - 1 + alpha) * self.FIXED_DT
+        camera_x = int(self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha)
+        
+        # The world pass is queued by layer and submitted with one blits call per layer
+        queue = self.render_queue
+        self.world.background.draw(queue.layer(render_queue.BACKGROUND), camera_x, self.render_time)
+        self.world.draw(queue, camera_x, alpha=alpha)
+        self.princess.draw(queue.layer(render_queue.PRINCESS), camera_x, alpha)
         
         # Draw player if not in death screen
         if not self.death_screen_active:
-            self.player.draw(self.screen, int(self.camera_x))
-            
-        self.tooltip.draw(self.screen)
-        self.notification_system.draw(self.screen)
+            self.player.draw(queue.layer(render_queue.PLAYER), camera_x, alpha)
+        self.display.draw_world(queue)
         
-        # Draw player experience bar
-        self.player.draw_experience_bar(self.screen)
+        # Screen-space drawing is queued in order on its own unscaled queue
+        screen = self.screen_queue.layer(render_queue.SCREEN)
+            
+        # Inventory, health, experience and controls come from one cached overlay,
+        # hidden with the player while the death screen is up
+        if not self.death_screen_active:
+            self.hud.draw(screen)
+            
+            # Draw tool inventory if open
+            if self.player.show_inventory:
+                self.player.draw_tool_inventory(screen)
+            
+        self.tooltip.draw(screen)
+        self.notification_system.draw(screen)
         
         # Draw death screen if active
         if self.death_screen_active:
-            self.draw_death_screen()
+            self.draw_death_screen(screen)
         
         # Draw level transition screen if active
         if self.level_transition_active:
-            self.draw_transition_screen()
-        
-        # Draw tool help text (varies depending on selected tool)
-        if not self.player.show_inventory and not self.level_transition_active:
-            font = pygame.font.Font(None, 20)
-            tool_info = ""
-            if self.player.current_tool == "axe":
-                tool_info = "Axe: Left-click trees to gather wood"
-            elif self.player.current_tool == "pickaxe":
-                tool_info = "Pickaxe: Left-click stones to gather stone"
-            elif self.player.current_tool == "sword":
-                tool_info = "Sword: Left-click or press F to attack nearby enemies"
-            elif self.player.building_system.building_mode:
-                tool_info = "Building Mode: Left-click to place building"
-                
-            if tool_info:
-                text = font.render(tool_info, True, (255, 255, 255))
-                text_bg = pygame.Surface((text.get_width() + 10, text.get_height() + 6), pygame.SRCALPHA)
-                text_bg.fill((0, 0, 0, 180))
-                self.screen.blit(text_bg, (10, self.SCREEN_HEIGHT - 30))
-                self.screen.blit(text, (15, self.SCREEN_HEIGHT - 27))
-                
-            # Additional controls reminder
-            controls = "WASD: Move | SPACE: Jump | E: Eat | I: Inventory | 1-3: Tools | F: Interact"
-            controls_text = font.render(controls, True, (255, 255, 255))
-            controls_bg = pygame.Surface((controls_text.get_width() + 10, controls_text.get_height() + 6), pygame.SRCALPHA)
-            controls_bg.fill((0, 0, 0, 120))
-            self.screen.blit(controls_bg, (10, self.SCREEN_HEIGHT - 60))
-            self.screen.blit(controls_text, (15, self.SCREEN_HEIGHT - 57))
-            
-            # Display current level
-            level_text = font.render(f"Level {self.current_level}", True, (255, 255, 255))
-            level_bg = pygame.Surface((level_text.get_width() + 10, level_text.get_height() + 6), pygame.SRCALPHA)
-            level_bg.fill((0, 0, 0, 180))
-            self.screen.blit(level_bg, (self.SCREEN_WIDTH - level_text.get_width() - 20, 10))
-            self.screen.blit(level_text, (self.SCREEN_WIDTH - level_text.get_width() - 15, 13))
+            self.draw_transition_screen(screen)
         
         # Draw interaction indicators
         closest_object = self.player.get_closest_interactive_object(self.world)
         if closest_object:
-            pygame.draw.circle(self.screen, (255, 255, 255, 100), 
-                            (closest_object["rect"].centerx - int(self.camera_x), closest_object["rect"].centery), 
-                            5, 1)
+            radius = self.interaction_marker.get_width() // 2
+            screen.blit(self.interaction_marker,
+                        (closest_object["rect"].centerx - camera_x - radius, closest_object["rect"].centery - radius))
         
-        pygame.display.flip()
+        self.display.draw_screen(self.screen_queue)
+        self.display.present()
         
-    def draw_transition_screen(self):
+    def draw_controls(self, surface):
+        """Draw the tool hint, controls reminder and level badge (cached by the HUD)"""
+        # Draw tool help text (varies depending on selected tool)
+        font = pygame.font.Font(None, 20)
+        tool_info = ""
+        if self.player.current_tool == "axe":
+            tool_info = "Axe: Left-click trees to gather wood"
+        elif self.player.current_tool == "pickaxe":
+            tool_info = "Pickaxe: Left-click stones to gather stone"
+        elif self.player.current_tool == "sword":
+            tool_info = "Sword: Left-click or press F to attack nearby enemies"
+        elif self.player.building_system.building_mode:
+            tool_info = "Building Mode: Left-click to place building"
+            
+        if tool_info:
+            text = font.render(tool_info, True, (255, 255, 255))
+            text_bg = pygame.Surface((text.get_width() + 10, text.get_height() + 6), pygame.SRCALPHA)
+            text_bg.fill((0, 0, 0, 180))
+            surface.blit(text_bg, (10, self.SCREEN_HEIGHT - 30))
+            surface.blit(text, (15, self.SCREEN_HEIGHT - 27))
+            
+        # Additional controls reminder
+        controls = "WASD: Move | SPACE: Jump | E: Eat | I: Inventory | 1-3: Tools | F: Interact"
+        controls_text = font.render(controls, True, (255, 255, 255))
+        controls_bg = pygame.Surface((controls_text.get_width() + 10, controls_text.get_height() + 6), pygame.SRCALPHA)
+        controls_bg.fill((0, 0, 0, 120))
+        surface.blit(controls_bg, (10, self.SCREEN_HEIGHT - 60))
+        surface.blit(controls_text, (15, self.SCREEN_HEIGHT - 57))
+        
+        # Display current level
+        level_text = font.render(f"Level {self.current_level}", True, (255, 255, 255))
+        level_bg = pygame.Surface((level_text.get_width() + 10, level_text.get_height() + 6), pygame.SRCALPHA)
+        level_bg.fill((0, 0, 0, 180))
+        surface.blit(level_bg, (self.SCREEN_WIDTH - level_text.get_width() - 20, 10))
+        surface.blit(level_text, (self.SCREEN_WIDTH - level_text.get_width() - 15, 13))
+        
+    def draw_transition_screen(self, screen):
         """Draw the level transition screen"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))  # Dark overlay
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay and text are cached by the overlay manager
+        screen.blit(self.overlays.tint((0, 0, 0, 150)), (0, 0))  # Dark overlay
         
         # Draw level complete message
-        font = pygame.font.Font(None, 64)
-        text = font.render(f"Level {self.current_level} Complete!", True, (255, 255, 255))
+        text = self.overlays.text(f"Level {self.current_level} Complete!", 64)
         text_rect = text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 - 30))
-        self.screen.blit(text, text_rect)
+        screen.blit(text, text_rect)
         
         # Draw next level message
-        next_level_font = pygame.font.Font(None, 36)
-        next_level_text = next_level_font.render(f"Loading Level {self.current_level + 1}...", True, (255, 255, 255))
+        next_level_text = self.overlays.text(f"Loading Level {self.current_level + 1}...", 36)
         next_level_rect = next_level_text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 30))
-        self.screen.blit(next_level_text, next_level_rect)
+        screen.blit(next_level_text, next_level_rect)
         
         # Draw loading bar
         bar_width = 300
         bar_height = 20
         border = 2
-        progress = min(1.0, self.transition_timer / self.transition_delay)
+        progress = 1.0 - self.timers.remaining(self.transition_timer) / self.transition_delay
         
         # Border
-        pygame.draw.rect(self.screen, (255, 255, 255), 
-                      (self.SCREEN_WIDTH // 2 - bar_width // 2 - border, 
-                       self.SCREEN_HEIGHT // 2 + 80 - border,
-                       bar_width + border * 2, bar_height + border * 2))
+        screen.fill((255, 255, 255), 
+                    (self.SCREEN_WIDTH // 2 - bar_width // 2 - border, 
+                     self.SCREEN_HEIGHT // 2 + 80 - border,
+                     bar_width + border * 2, bar_height + border * 2))
         
         # Progress
-        pygame.draw.rect(self.screen, (0, 255, 0), 
-                      (self.SCREEN_WIDTH // 2 - bar_width // 2, 
-                       self.SCREEN_HEIGHT // 2 + 80,
-                       int(bar_width * progress), bar_height))
+        screen.fill((0, 255, 0), 
+                    (self.SCREEN_WIDTH // 2 - bar_width // 2, 
+                     self.SCREEN_HEIGHT // 2 + 80,
+                     int(bar_width * progress), bar_height))
         
     def run(self):
+        # Pick up images artists add or edit while the game is running
+        asset_loader.watch()
+        accumulator = 0.0
         while self.running:
+            # Real time since the last frame drives how many ticks to simulate
+            accumulator += self.clock.tick(self.RENDER_FPS) / 1000
             self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
             
+            steps = 0
+            while accumulator >= self.FIXED_DT and steps < self.MAX_STEPS_PER_FRAME:
+                self.step()
+                accumulator -= self.FIXED_DT
+                steps += 1
+            
+            # Too far behind - drop the backlog instead of slowing every later frame
+            if steps == self.MAX_STEPS_PER_FRAME:
+                accumulator = min(accumulator, self.FIXED_DT)
+            
+            # Images decoded in the background are added between frames
+            asset_loader.update()
+            self.draw(accumulator / self.FIXED_DT)
+            
+        if self.save_manager:
+            self.save_manager.shutdown()
+        if sprite_factory.tracking:
+            sprite_factory.report()
         pygame.quit()
         sys.exit()
 
+    def pool_stats(self):
+        """Created, reused, in-use and free counts of every object pool"""
+        return {name: pool.stats() for name, pool in self.pools.items()}
+
+    def autosave(self):
+        """Autosave (only the changes are written) and schedule the next one"""
+        self.save_manager.autosave()
+        self.timers.schedule(self.save_manager.autosave_interval, self.autosave)
+        
+    def load_game(self):
+        """Restore the last autosave, returning False if there is none"""
+        state = self.save_manager.load()
+        if state is None:
+            return False
+            
+        self.current_level = state["level"]
+        asset_loader.prefetch_level(self.current_level)
+        self.world.release()
+        self.world = World(self, self.current_level)
+        self.world.restore(state["world"])
+        self.player.restore(state["player"], state["inventory"])
+        self.camera_x = max(0, min(self.player.x - self.SCREEN_WIDTH // 2, self.WORLD_WIDTH - self.SCREEN_WIDTH))
+        self.save_previous_state()
+        
+        # Start a new save chain from the restored state
+        self.save_manager.save_base()
+        self.notification_system.add_notification("Save loaded", 120)
+        return True
+        
     def handle_player_death(self):
         # Set death screen active
         self.death_screen_active = True
-        self.respawn_timer = 0
+        self.respawn_timer = self.timers.schedule(self.respawn_delay, self.respawn_player)
         
         # Reduce player experience (lose 30% of current experience)
         exp_loss = int(self.player.experience * 0.3)
@@ -391,33 +548,29 @@ class Game:
         
         # Reset player position to center of screen
         self.player.x = self.SCREEN_WIDTH // 2
-        ground_height = self.SCREEN_HEIGHT - 100
-        self.player.y = ground_height - self.player.height
+        self.player.y = self.world.terrain.surface_y(self.player.x, self.player.width) - self.player.height
         
         # Reset camera
         self.camera_x = self.player.x - self.SCREEN_WIDTH // 2
+        self.save_previous_state()  # Don't interpolate across the teleport
         
         # Show notification
         self.notification_system.add_notification("Respawned!")
         
-    def draw_death_screen(self):
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((200, 0, 0, 100))  # Red tint
-        self.screen.blit(overlay, (0, 0))
+    def draw_death_screen(self, screen):
+        # Semi-transparent overlay and text are cached by the overlay manager
+        screen.blit(self.overlays.tint((200, 0, 0, 100)), (0, 0))  # Red tint
         
         # Draw death message
-        font = pygame.font.Font(None, 64)
-        text = font.render("YOU DIED!", True, (255, 255, 255))
+        text = self.overlays.text("YOU DIED!", 64)
         text_rect = text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 - 30))
-        self.screen.blit(text, text_rect)
+        screen.blit(text, text_rect)
         
         # Draw respawn countdown
-        seconds_left = (self.respawn_delay - self.respawn_timer) // 60 + 1
-        respawn_font = pygame.font.Font(None, 36)
-        respawn_text = respawn_font.render(f"Respawning in {seconds_left}...", True, (255, 255, 255))
+        seconds_left = self.timers.remaining(self.respawn_timer) // 60 + 1
+        respawn_text = self.overlays.text(f"Respawning in {seconds_left}...", 36)
         respawn_rect = respawn_text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 30))
-        self.screen.blit(respawn_text, respawn_rect)
+        screen.blit(respawn_text, respawn_rect)
 
 class Player:
     def __init__(self, game):
@@ -430,6 +583,8 @@ class Player:
         # Correct ground level position - ensure player is properly on ground level like trees and rocks
         ground_height = game.SCREEN_HEIGHT - 100  # This is where grass blocks are
         self.y = ground_height - self.height  # Position character so feet touch the ground
+        self.prev_x = self.x  # Position at the previous tick, for interpolated drawing
+        self.prev_y = self.y
         
         self.vel_y = 0
         self.jumping = False
@@ -437,16 +592,16 @@ class Player:
         self.is_moving = False
         self.swimming = False  # Track if player is swimming
         
-        # Add notification cooldown timer
-        self.last_interaction_notification = 0  # Frame counter for notification cooldown
+        # Add notification cooldown
+        self.can_notify_interaction = True
         self.notification_cooldown = 120  # 2 seconds at 60fps
         
         # Tools initialization
         self.tools = {
-            "axe": Axe(),
-            "pickaxe": Pickaxe(),
-            "sword": Sword(),
-            "hammer": Hammer()
+            "axe": Axe(game.timers),
+            "pickaxe": Pickaxe(game.timers),
+            "sword": Sword(game.timers),
+            "hammer": Hammer(game.timers)
         }
         self.tool_sprites = {
             "axe": AxeSprite(),
@@ -459,11 +614,12 @@ class Player:
             "wood": 0,
             "stone": 0,
             "ore": 0,
-            "food": []  # List to store food items
+            "food": FoodInventory()  # Counts by type, eaten oldest first
         }
         self.building_system = BuildingSystem()
         self.show_inventory = False
         self.selected_slot = 0
+        self.inventory_slot_size = 64
         self.inventory_slots = [
             {"name": "axe", "icon": "🪓"},
             {"name": "pickaxe", "icon": "⛏️"},
@@ -471,7 +627,8 @@ class Player:
         ]
         self.sound_manager = SoundManager()
         self.is_swinging = False
-        self.swing_timer = 0
+        self.swing_timer = None
+        self.swing_duration = 10  # Swing animation duration in ticks
         
         # Health system
         self.max_health = 100
@@ -481,14 +638,17 @@ class Player:
         self.experience = 0
         self.level = 1
         self.exp_to_next_level = 100  # Base XP needed for level 2
-        self.invincibility_frames = 0 # Initialize invincibility frames
+        self.total_experience = 0  # All XP ever earned, unaffected by level ups and death
+        self.invincible = False  # Briefly true after taking a hit
+        self.invincibility_duration = 30
         
     def move(self, dx):
         # Movement speed depends on if swimming or not
         if self.swimming:
             dx *= 0.7  # Slower movement in water
             
-        self.x += dx
+        # Walls stop the player, single-tile ledges are stepped up
+        self.x, self.y, _, _ = self.game.world.terrain.move_body(self.x, self.y, self.width, self.height, dx, 0)
         
         # Set movement state
         self.is_moving = dx != 0
@@ -505,7 +665,8 @@ class Player:
             self.x = self.game.WORLD_WIDTH - self.width
             
     def jump(self):
-        if not self.jumping:
+        # Strokes can be repeated in water so the player can swim up from the lake floor
+        if not self.jumping or self.swimming:
             if self.swimming:
                 # Gentler "jump" in water - more like swimming upward
                 self.vel_y = self.game.JUMP_FORCE * 0.5
@@ -534,34 +695,39 @@ class Player:
             # Regular gravity on land
             self.vel_y += self.game.GRAVITY
             
-        # Update position
-        self.y += self.vel_y
-        
-        # Ground collision - ensure player stands on the ground level
-        ground_height = self.game.SCREEN_HEIGHT - 100  # This is where grass blocks are
-        
-        if self.y + self.height > ground_height:
-            self.y = ground_height - self.height
+        # Update position, stopping at the terrain below or above
+        self.x, self.y, _, hit_terrain = self.game.world.terrain.move_body(
+            self.x, self.y, self.width, self.height, 0, self.vel_y)
+        if hit_terrain:
+            if self.vel_y > 0:
+                self.jumping = False
             self.vel_y = 0
-            self.jumping = False
             
-        # Update current tool
-        self.tools[self.current_tool].update()
+        # Advance character animation
+        self.character.animate(self.is_moving, self.swimming)
+    
+    def start_swing(self):
+        """Start the swing animation, ended by the timer wheel"""
+        if self.swing_timer:
+            self.swing_timer.cancel()
+        self.is_swinging = True
+        self.swing_timer = self.game.timers.schedule(self.swing_duration, self.end_swing)
+        
+    def end_swing(self):
+        self.is_swinging = False
         
-        # Update swing animation
-        if self.is_swinging:
-            self.swing_timer += 1
-            if self.swing_timer >= 10:  # Swing animation duration
-                self.is_swinging = False
-                self.swing_timer = 0
-                
-        # Update invincibility frames if player was hit
-        if self.invincibility_frames > 0:
-            self.invincibility_frames -= 1
+    def end_invincibility(self):
+        self.invincible = False
+        
+    def notify_nothing_to_interact(self):
+        # Only show notification if cooldown has expired
+        if self.can_notify_interaction:
+            self.game.notification_system.add_notification("Nothing to interact with nearby")
+            self.can_notify_interaction = False
+            self.game.timers.schedule(self.notification_cooldown, self.reset_interaction_notification)
             
-        # Update notification cooldown
-        if self.last_interaction_notification > 0:
-            self.last_interaction_notification -= 1
+    def reset_interaction_notification(self):
+        self.can_notify_interaction = True
     
     def check_water_collision(self):
         """Check if player is in water and update swimming state"""
@@ -591,12 +757,18 @@ class Player:
             self.switch_tool(self.inventory_slots[slot_index]["name"])
             self.game.notification_system.add_notification(f"Selected {self.inventory_slots[slot_index]['name'].capitalize()}")
             
-    def draw(self, screen, camera_x):
-        # Draw character with camera offset
-        screen_x = self.x - camera_x
+    def draw(self, screen, camera_x, alpha=1.0):
+        # Draw character with camera offset, interpolated between the last two ticks
+        screen_x = self.prev_x + (self.x - self.prev_x) * alpha - camera_x
+        screen_y = self.prev_y + (self.y - self.prev_y) * alpha
         
-        # Use swimming state for character animation
-        self.character.draw(screen, screen_x, self.y, self.facing_right, self.is_moving, self.swimming)
+        # A custom assets/character image replaces the drawn animation
+        image = asset_loader.get_character_sprite()
+        if image:
+            screen.blit(image if self.facing_right else sprite_factory.flipped(image), (screen_x, screen_y))
+        else:
+            # Use swimming state for character animation
+            self.character.draw(screen, screen_x, screen_y, self.facing_right, self.is_moving, self.swimming)
         
         # If swimming, don't show tools
         if not self.swimming:
@@ -604,30 +776,17 @@ class Player:
             if self.building_system.building_mode:
                 self.tool_sprites["hammer"].draw(screen, 
                                               screen_x + (40 if self.facing_right else -40),
-                                              self.y + 20,
+                                              screen_y + 20,
                                               self.tools["hammer"].animation_frame * 5,
                                               self.facing_right,
                                               self.is_swinging)
             else:
                 self.tool_sprites[self.current_tool].draw(screen,
                                                         screen_x + (40 if self.facing_right else -40),
-                                                        self.y + 20,
+                                                        screen_y + 20,
                                                         self.tools[self.current_tool].animation_frame * 5,
                                                         self.facing_right,
                                                         self.is_swinging)
-        
-        # Draw resource inventory (fixed position on screen, not affected by camera)
-        self.draw_resource_inventory(screen)
-        
-        # Draw health bar
-        self.draw_health_bar(screen)
-        
-        # Draw experience bar
-        self.draw_experience_bar(screen)
-        
-        # Draw tool inventory if open
-        if self.show_inventory:
-            self.draw_tool_inventory(screen)
             
     def get_closest_interactive_object(self, world):
         player_center_x = self.x + self.width // 2
@@ -654,8 +813,7 @@ class Player:
         if self.building_system.building_mode:
             if self.tools["hammer"].use():
                 self.sound_manager.play("hammer_swing")
-                self.is_swinging = True
-                self.swing_timer = 0
+                self.start_swing()
                 
                 if self.building_system.build(self.inventory, self.building_system.current_blueprint):
                     # Create building near the player
@@ -666,17 +824,13 @@ class Player:
                     self.game.notification_system.add_notification("Not enough resources!")
         else:
             if not clicked_object:
-                # Only show notification if cooldown has expired
-                if self.last_interaction_notification <= 0:
-                    self.game.notification_system.add_notification("Nothing to interact with nearby")
-                    self.last_interaction_notification = self.notification_cooldown
+                self.notify_nothing_to_interact()
                 return
                 
             if self.tools[self.current_tool].use():
                 # Play tool sound
                 self.sound_manager.play(f"{self.current_tool}_swing")
-                self.is_swinging = True
-                self.swing_timer = 0
+                self.start_swing()
                 
                 if self.current_tool == "axe" and clicked_object["type"] == "tree":
                     self.inventory["wood"] += 1
@@ -688,7 +842,7 @@ class Player:
                     self.game.notification_system.add_notification("Collected wood")
                     
                     # Chance to spawn a crab
-                    if random.random() < 0.3:  # 30% chance
+                    if random.random() < self.game.TREE_CRAB_CHANCE:
                         world.spawn_crab(clicked_object["rect"].centerx, clicked_object["rect"].centery)
                         self.game.notification_system.add_notification("A crab appeared!")
                         
@@ -702,7 +856,7 @@ class Player:
                     self.game.notification_system.add_notification("Collected stone")
                     
                     # Chance to spawn a crab
-                    if random.random() < 0.4:  # 40% chance
+                    if random.random() < self.game.STONE_CRAB_CHANCE:
                         world.spawn_crab(clicked_object["rect"].centerx, clicked_object["rect"].centery)
                         self.game.notification_system.add_notification("A crab appeared!")
                         
@@ -731,7 +885,7 @@ class Player:
         
         # Draw food icons if any
         if food_count > 0:
-            for i, food_item in enumerate(self.inventory["food"][:3]):  # Show up to 3 food items
+            for i, food_item in enumerate(self.inventory["food"].first(3)):  # Show up to 3 food items
                 food_item.draw(screen, 110 + i * 20, food_y + 7)
     
     def draw_health_bar(self, screen):
@@ -790,41 +944,29 @@ class Player:
         text_rect = text.get_rect(bottomright=(x + bar_width, y - 2))
         screen.blit(text, text_rect)
         
+    def inventory_slot_position(self, index):
+        """Top-left screen position of a tool inventory slot"""
+        start_x = self.game.SCREEN_WIDTH // 2 - (len(self.inventory_slots) * self.inventory_slot_size) // 2
+        start_y = self.game.SCREEN_HEIGHT // 2 - self.inventory_slot_size // 2
+        return start_x + index * self.inventory_slot_size, start_y
+        
+    def draw_inventory_tool(self, surface, index):
+        tool_name = self.inventory_slots[index]["name"]
+        if tool_name in self.tool_sprites:
+            x, y = self.inventory_slot_position(index)
+            self.tool_sprites[tool_name].draw_inventory(surface, 
+                                                      x + (self.inventory_slot_size - 32)//2,
+                                                      y + (self.inventory_slot_size - 32)//2)
+        
     def draw_tool_inventory(self, screen):
-        # Create semi-transparent background
-        inventory_surface = pygame.Surface((self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT), pygame.SRCALPHA)
-        inventory_surface.fill(self.game.INVENTORY_BG)
-        screen.blit(inventory_surface, (0, 0))
-        
-        # Draw inventory slots
-        slot_size = 64
-        start_x = self.game.SCREEN_WIDTH // 2 - (len(self.inventory_slots) * slot_size) // 2
-        start_y = self.game.SCREEN_HEIGHT // 2 - slot_size // 2
-        
-        for i, slot in enumerate(self.inventory_slots):
-            x = start_x + i * slot_size
-            y = start_y
-            
-            # Draw slot background
-            pygame.draw.rect(screen, (100, 100, 100), (x, y, slot_size, slot_size))
-            pygame.draw.rect(screen, (0, 0, 0), (x, y, slot_size, slot_size), 2)
-            
-            # Draw selected highlight
-            if i == self.selected_slot:
-                pygame.draw.rect(screen, self.game.SELECTED_ITEM, (x, y, slot_size, slot_size))
-            
-            # Draw tool sprite
-            tool_name = slot["name"]
-            if tool_name in self.tool_sprites:
-                self.tool_sprites[tool_name].draw_inventory(screen, 
-                                                          x + (slot_size - 32)//2,
-                                                          y + (slot_size - 32)//2)
-            
-            # Draw tool name
-            name_font = pygame.font.Font(None, 24)
-            name_text = name_font.render(slot["name"], True, (0, 0, 0))
-            name_rect = name_text.get_rect(center=(x + slot_size//2, y + slot_size + 20))
-            screen.blit(name_text, name_rect)
+        # Tint, slots, icons and names are pre-baked by the overlay manager
+        screen.blit(self.game.overlays.inventory_background(self), (0, 0))
+        
+        # Only the selected highlight changes, redraw it with the tool on top
+        x, y = self.inventory_slot_position(self.selected_slot)
+        # Opaque, as pygame.draw.rect drew it on the screen
+        screen.fill(self.game.SELECTED_ITEM[:3], (x, y, self.inventory_slot_size, self.inventory_slot_size))
+        self.draw_inventory_tool(screen, self.selected_slot)
             
     def switch_tool(self, tool_name):
         if tool_name in self.tools:
@@ -834,7 +976,7 @@ class Player:
         # Check if player has food
         if len(self.inventory["food"]) > 0:
             # Get the first food item
-            food = self.inventory["food"].pop(0)
+            food = self.inventory["food"].pop()
             
             # Add health
             self.health = min(self.max_health, self.health + food.healing)
@@ -853,6 +995,7 @@ class Player:
     def add_experience(self, amount):
         # Add experience points to player
         self.experience += amount
+        self.total_experience += amount
         
         # Check if player should level up
         if self.experience >= self.exp_to_next_level:
@@ -867,7 +1010,7 @@ class Player:
         
         # Reset experience and increase next level requirement (increasing difficulty)
         self.experience = self.experience - self.exp_to_next_level
-        self.exp_to_next_level = int(self.exp_to_next_level * 1.5)  # Each level requires 50% more XP
+        self.exp_to_next_level = int(self.exp_to_next_level * self.game.XP_GROWTH)  # Each level requires more XP
         
         # Increase max health as bonus
         old_max_health = self.max_health
@@ -881,32 +1024,50 @@ class Player:
         self.game.notification_system.add_notification(f"Level Up! You are now level {self.level}")
         self.game.notification_system.add_notification(f"Max Health +10 ({old_max_health} → {self.max_health})")
         self.game.notification_system.add_notification(f"Sword Damage +2")
+
+    def snapshot(self):
+        """Return the player's persistent stats as plain data for saving"""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "health": self.health,
+            "max_health": self.max_health,
+            "experience": self.experience,
+            "level": self.level,
+            "exp_to_next_level": self.exp_to_next_level,
+            "total_experience": self.total_experience,
+            "current_tool": self.current_tool
+        }
+
+    def inventory_snapshot(self):
+        """Return the inventory as plain data, with food stored by type"""
+        inventory = {item: count for item, count in self.inventory.items() if item != "food"}
+        inventory["food"] = self.inventory["food"].types()
+        return inventory
+
+    def restore(self, stats, inventory):
+        """Restore stats and inventory from saved data"""
+        for key, value in stats.items():
+            setattr(self, key, value)
+
+        for item, value in inventory.items():
+            if item == "food":
+                self.inventory["food"] = FoodInventory(value)
+            else:
+                self.inventory[item] = value
+
+    def take_hit(self, enemy_obj, damage):
+        """Take an enemy's attack, followed by a few invincibility frames"""
+        self.health -= damage
+        
+        if self.health < 0:
+            self.health = 0
             
-    def check_enemy_collisions(self, world):
-        # Check if player collides with any enemies - USE WORLD COORDINATES
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.game.notification_system.add_notification(f"Ouch! {enemy_name(enemy_obj)} attacked you for {damage} damage!")
         
-        for enemy in world.enemies[:]: # Iterate over a copy
-            enemy_obj = enemy["enemy_obj"] # Get the actual enemy object
-            # Use enemy's world coordinates for collision check
-            enemy_rect = pygame.Rect(enemy["x"], enemy["y"],
-                                   enemy_obj.width, enemy_obj.height)
-
-            # Check for simple rectangle collision first
-            if player_rect.colliderect(enemy_rect):
-                 # Take damage unless player is in invincibility frames
-                 if self.invincibility_frames <= 0:
-                    damage = enemy_obj.damage # Use enemy's specific damage
-                    self.health -= damage
-                    
-                    if self.health < 0:
-                        self.health = 0
-                        
-                    enemy_name = "King Crab" if isinstance(enemy_obj, KingCrab) else "Crab"
-                    self.game.notification_system.add_notification(f"Ouch! {enemy_name} attacked you for {damage} damage!")
-                    
-                    self.invincibility_frames = 30 
-                    self.sound_manager.play("block_break") 
+        self.invincible = True
+        self.game.timers.schedule(self.invincibility_duration, self.end_invincibility)
+        self.sound_manager.play("block_break") 
             
     def perform_attack(self, world):
         """Swings the equipped tool (currently only sword logic implemented) 
@@ -914,8 +1075,7 @@ class Player:
         # Check cooldown and tool type
         if self.current_tool == "sword" and self.tools["sword"].use():
             self.sound_manager.play("sword_swing")
-            self.is_swinging = True
-            self.swing_timer = 0
+            self.start_swing()
 
             player_center_x = self.x + self.width // 2
             player_center_y = self.y + self.height // 2
@@ -970,11 +1130,10 @@ class Player:
             enemy_center_x = enemy["x"] + enemy_obj.width // 2
             enemy_center_y = enemy["y"] + enemy_obj.height // 2
             
-            enemy_name = "King Crab" if isinstance(enemy_obj, KingCrab) else "Crab"
             world.remove_enemy(enemy)
             world.particle_system.create_block_break(
                 enemy_center_x, enemy_center_y, (200, 0, 0))  # Red crab particles
-            self.game.notification_system.add_notification(f"Defeated the {enemy_name}!")
+            self.game.notification_system.add_notification(f"Defeated the {enemy_name(enemy_obj)}!")
             
             # Add special victory message for King Crab
             if isinstance(enemy_obj, KingCrab):
@@ -984,15 +1143,13 @@ class Player:
             # Update the health in the dictionary to match the object's health
             enemy["health"] = enemy_obj.health
             
-            enemy_name = "King Crab" if isinstance(enemy_obj, KingCrab) else "Crab"
-            self.game.notification_system.add_notification(f"Hit {enemy_name}! {enemy_obj.health} HP left")
+            self.game.notification_system.add_notification(f"Hit {enemy_name(enemy_obj)}! {enemy_obj.health} HP left")
 
 class World:
     def __init__(self, game, level=1):
         self.game = game
         self.tiles = []
         self.trees = []
-        self.clouds = []
         self.crabs = []  # List to store crabs (level 1)
         self.dinosaurs = []  # List to store dinosaurs (level 2+)
         self.water_tiles = []  # List to store water tiles (level 2+)
@@ -1002,31 +1159,45 @@ class World:
         self.tree_tiles = []
         self.resources = []
         self.fish = []  # List to store fish (level 2+)
+        self.school = None  # Boids schooling for the lake fish (level 2+)
         self.special_areas = []
         self.enemies = []  # General enemies list
         self.buildings = []  # Buildings and structures
-        self.particle_system = ParticleSystem()
-        
-        # Load cloud sprites
-        self.cloud_sprites = []
-        cloud_img1 = pygame.Surface((60, 30), pygame.SRCALPHA)
-        pygame.draw.ellipse(cloud_img1, (255, 255, 255, 180), (0, 0, 60, 30))
-        self.cloud_sprites.append(cloud_img1)
+        self.particle_system = ParticleSystem(game.pools["particle"])
+        # Time-slices enemy decisions, by a fixed count when the game must be reproducible
+        self.ai = AIScheduler(game.AI_BUDGET_MS, game.AI_DECISIONS_PER_TICK if game.deterministic else None)
+        self.sight = {}  # Enemy id -> whether it sees the player, for sight_tick
+        self.sight_tick = None
         
-        cloud_img2 = pygame.Surface((80, 40), pygame.SRCALPHA)
-        pygame.draw.ellipse(cloud_img2, (255, 255, 255, 150), (0, 0, 80, 40))
-        self.cloud_sprites.append(cloud_img2)
-        
-        cloud_img3 = pygame.Surface((100, 50), pygame.SRCALPHA)
-        pygame.draw.ellipse(cloud_img3, (255, 255, 255, 130), (0, 0, 100, 50))
-        self.cloud_sprites.append(cloud_img3)
+        # Sky, far mountains and clouds behind the world
+        self.background = ParallaxBackground((game.SCREEN_WIDTH, game.SCREEN_HEIGHT), level)
+        self.tree_images = {}  # (width, height) -> (image, padding) for tree tiles
+        self.water_images = {}  # Blue value -> water tile for the wave animation
         
         self.enemies_spawned = 0  # Track how many enemies we've spawned
         self.king_crab_spawned = False  # Flag to prevent multiple king crab spawns
         self.king_crab_defeated = False  # Flag to track if king crab was defeated
-        
+
+        # Change tracking for incremental autosaves
+        self.next_enemy_id = 0
+        self.removed_tile_ids = []
+        self.spawned_enemies = []
+        self.removed_enemy_ids = []
+
         self.generate_world(level)
-    
+
+        # Give every tile a stable id so saves can refer to removed tiles
+        for tile_id, tile in enumerate(self.tiles):
+            tile["id"] = tile_id
+
+        self.rebuild_terrain()
+
+    def rebuild_terrain(self):
+        """Mesh the ground blocks; everything else is drawn tile by tile"""
+        self.terrain = Terrain(self.tiles, self.game.TILE_SIZE)
+        self.flow_field = FlowField(self.terrain)
+        self.feature_tiles = [tile for tile in self.tiles if not is_terrain_tile(tile, self.game.TILE_SIZE)]
+
     def generate_world(self, level):
         """Generate world based on current level"""
         if level == 1:
@@ -1077,9 +1248,6 @@ class World:
             
         self.initial_resource_count = resource_count
         print(f"Initial resource count: {self.initial_resource_count}")
-        
-        # Generate clouds as in original code
-        self.generate_clouds()
     
     def generate_dinosaur_jungle(self):
         """Generate a jungle world with dinosaurs"""
@@ -1182,14 +1350,10 @@ class World:
             }
             self.tiles.append(tile)
         
-        # Add some fish to the water
-        for _ in range(8):
-            fish_x = random.randint(lake_x, lake_x + lake_width - 1) * self.game.TILE_SIZE + random.randint(0, self.game.TILE_SIZE)
-            fish_y = random.randint(lake_y, lake_y + lake_depth - 1) * self.game.TILE_SIZE + random.randint(0, self.game.TILE_SIZE)
-            
-            # Use the Fish class from this file (game.py)
-            fish = Fish(self.game, fish_x, fish_y)
-            self.resources.append(fish)
+        # Fill the lake with a school of fish
+        self.school = FishSchool(self.water_tiles, self.game.TILE_SIZE)
+        for _ in range(len(self.water_tiles) // self.game.WATER_TILES_PER_FISH):
+            self.add_fish()
         
         # Initialize resource count
         resource_count = 0
@@ -1222,10 +1386,10 @@ class World:
         for _ in range(5):
             x = random.randint(10, world_width - 10) * self.game.TILE_SIZE
             y = 0  # Will be placed on ground in the Dinosaur class
-            dinosaur_obj = Dinosaur()  # Create the dinosaur sprite
+            dinosaur_obj = self.game.pools["dinosaur"].acquire()  # Reuse or create the dinosaur sprite
             
             # Add dinosaur with the same structure as other enemies
-            self.enemies.append({
+            self.add_enemy({
                 "enemy_obj": dinosaur_obj,
                 "x": x,
                 "y": y,
@@ -1271,33 +1435,6 @@ class World:
         self.initial_resource_count = resource_count
         print(f"Initial resource count: {self.initial_resource_count}")
     
-    def generate_clouds(self):
-        """Generate clouds for any level"""
-        if self.cloud_sprites:
-            for _ in range(8):
-                cloud_x = random.randint(0, self.game.WORLD_WIDTH)
-                cloud_y = random.randint(20, 150)
-                
-                cloud_sprite = random.choice(self.cloud_sprites)
-                flip_x = random.choice([True, False])
-                flip_y = random.choice([True, False])
-                
-                self.clouds.append({
-                    "rect": pygame.Rect(cloud_x, cloud_y, cloud_sprite.get_width(), cloud_sprite.get_height()), 
-                    "sprite_index": self.cloud_sprites.index(cloud_sprite),
-                    "flip_x": flip_x,
-                    "flip_y": flip_y
-                })
-        else:
-            # Fallback to simple cloud rects if sprites failed to load
-            print("Warning: Cloud sprites not loaded, using fallback rectangles.")
-            for _ in range(8):
-                cloud_x = random.randint(0, self.game.WORLD_WIDTH)
-                cloud_y = random.randint(20, 150)
-                cloud_width = random.randint(80, 160)
-                cloud_height = random.randint(30, 60)
-                self.clouds.append({"rect": pygame.Rect(cloud_x, cloud_y, cloud_width, cloud_height)})
-                
     def spawn_fish(self, x, y):
         """Spawn a fish in the lake"""
         fish = Fish()  # We'll need to create this class
@@ -1331,7 +1468,7 @@ class World:
         facing_right = random.choice([True, False])
         
         # Add to enemies list directly with consistent format
-        self.enemies.append({
+        self.add_enemy({
             "enemy_obj": dinosaur,
             "x": dino_x,
             "y": dino_y,
@@ -1345,9 +1482,44 @@ class World:
         # Increment enemy counter
         self.enemies_spawned += 1
 
-    def draw(self, screen, camera_x, camera_y=0):
-        # Draw tiles with camera offset
-        for tile in self.tiles:
+    def tree_image(self, width, height):
+        """Trunk and leaves of a tree tile, padded so the leaves fit, and that padding"""
+        key = (width, height)
+        if key not in self.tree_images:
+            leaf_radius = width * 0.6
+            pad = int(leaf_radius) + 1
+            image = pygame.Surface((width + pad * 2, height + pad * 2), pygame.SRCALPHA)
+            # Draw tree trunk
+            trunk_width = 16
+            trunk_height = height * 0.6
+            trunk_x = pad + (width - trunk_width) // 2
+            trunk_y = pad + height - trunk_height
+            pygame.draw.rect(image, (139, 69, 19), (trunk_x, trunk_y, trunk_width, trunk_height))
+            # Draw tree leaves
+            pygame.draw.circle(image, (34, 139, 34), (pad + width // 2, pad + height // 3), leaf_radius)
+            self.tree_images[key] = (sprite_factory.finalize(image), pad)
+        return self.tree_images[key]
+
+    def water_image(self):
+        """Water tile for the current animation frame"""
+        # Animate water color slightly based on simulation time
+        blue_val = 164 + int(10 * math.sin(self.game.render_time * 2))
+        if blue_val not in self.water_images:
+            water_surface = pygame.Surface((self.game.TILE_SIZE, self.game.TILE_SIZE), pygame.SRCALPHA)
+            water_surface.fill((64, blue_val, 223, 180))  # Blue with alpha
+            self.water_images[blue_val] = sprite_factory.finalize(water_surface)
+        return self.water_images[blue_val]
+
+    def draw(self, queue, camera_x, camera_y=0, alpha=1.0):
+        """Queue the world's blits onto the layers of a RenderQueue"""
+        # Ground blocks are drawn as merged rectangles
+        self.terrain.draw(queue.layer(render_queue.TERRAIN), camera_x, camera_y)
+
+        # Draw the remaining tiles with camera offset
+        tile_colors = {"grass": (100, 200, 100), "dirt": (139, 69, 19), "stone": (128, 128, 128)}
+        # Images from assets/world replace the drawn trees and stones once loaded
+        custom_images = {name: asset_loader.get_world_sprite(name) for name in ("tree", "stone")}
+        for tile in self.feature_tiles:
             # Handle both old-style rect tiles and new-style x,y tiles
             if "x" in tile:
                 screen_x = tile["x"] - camera_x
@@ -1363,27 +1535,27 @@ class World:
             # Only draw if on screen
             if (screen_x > -tile_width and screen_x < self.game.SCREEN_WIDTH and
                 screen_y > -tile_height and screen_y < self.game.SCREEN_HEIGHT):
-                if tile["type"] == "grass":
-                    pygame.draw.rect(screen, (100, 200, 100), (screen_x, screen_y, tile_width, tile_height))
-                elif tile["type"] == "dirt":
-                    pygame.draw.rect(screen, (139, 69, 19), (screen_x, screen_y, tile_width, tile_height))
-                elif tile["type"] == "stone":
-                    pygame.draw.rect(screen, (128, 128, 128), (screen_x, screen_y, tile_width, tile_height))
+                image = custom_images.get(tile["type"])
+                if image:
+                    # Centred on the tile, standing on its bottom edge
+                    queue.add(render_queue.TILES, image, (screen_x + (tile_width - image.get_width()) // 2,
+                                                          screen_y + tile_height - image.get_height()))
+                elif tile["type"] in tile_colors:
+                    queue.fill(render_queue.TILES, tile_colors[tile["type"]], (screen_x, screen_y, tile_width, tile_height))
                 elif tile["type"] == "tree":
-                    # Draw tree trunk
-                    trunk_width = 16
-                    trunk_height = tile_height * 0.6
-                    trunk_x = screen_x + (tile_width - trunk_width) // 2
-                    trunk_y = screen_y + tile_height - trunk_height
-                    pygame.draw.rect(screen, (139, 69, 19), (trunk_x, trunk_y, trunk_width, trunk_height))
-                    
-                    # Draw tree leaves
-                    leaf_radius = tile_width * 0.6
-                    leaf_x = screen_x + tile_width // 2
-                    leaf_y = screen_y + tile_height // 3
-                    pygame.draw.circle(screen, (34, 139, 34), (leaf_x, leaf_y), leaf_radius)
+                    image, pad = self.tree_image(tile_width, tile_height)
+                    queue.add(render_queue.TILES, image, (screen_x - pad, screen_y - pad))
+        
+        # Draw the fish near the view, under the water
+        if self.school:
+            x = self.school.position[:, 0]
+            for i in numpy.flatnonzero((x > camera_x - self.game.TILE_SIZE) &
+                                       (x < camera_x + self.game.SCREEN_WIDTH + self.game.TILE_SIZE)):
+                fish = self.school.fish[i]
+                fish.draw(queue.layer(render_queue.FISH), fish.x - camera_x, fish.y - camera_y)
         
         # Draw water tiles with blue color and transparency
+        water_surface = self.water_image()
         for water in self.water_tiles:
             if "x" in water:
                 screen_x = water["x"] - camera_x
@@ -1394,14 +1566,10 @@ class World:
             
             if (screen_x > -self.game.TILE_SIZE and screen_x < self.game.SCREEN_WIDTH and
                 screen_y > -self.game.TILE_SIZE and screen_y < self.game.SCREEN_HEIGHT):
-                # Draw water with transparency and wave effect
-                water_surface = pygame.Surface((self.game.TILE_SIZE, self.game.TILE_SIZE), pygame.SRCALPHA)
-                # Animate water color slightly based on time
-                blue_val = 164 + int(10 * math.sin(pygame.time.get_ticks() / 500))
-                water_surface.fill((64, blue_val, 223, 180))  # Blue with alpha
-                screen.blit(water_surface, (screen_x, screen_y))
+                queue.add(render_queue.WATER, water_surface, (screen_x, screen_y))
         
         # Draw all resources
+        resource_colors = {"wood": (139, 69, 19), "stone": (128, 128, 128), "gold": (255, 215, 0)}
         for resource in self.resources:
             # Check if resource is an object or a dictionary
             if isinstance(resource, dict):
@@ -1412,14 +1580,11 @@ class World:
                 # Only draw if on screen
                 if (screen_x > -self.game.TILE_SIZE and screen_x < self.game.SCREEN_WIDTH and
                     screen_y > -self.game.TILE_SIZE and screen_y < self.game.SCREEN_HEIGHT):
-                    if resource["type"] == "wood":
-                        pygame.draw.rect(screen, (139, 69, 19), (screen_x, screen_y, self.game.TILE_SIZE, self.game.TILE_SIZE))
-                    elif resource["type"] == "stone":
-                        pygame.draw.rect(screen, (128, 128, 128), (screen_x, screen_y, self.game.TILE_SIZE, self.game.TILE_SIZE))
-                    elif resource["type"] == "gold":
-                        pygame.draw.rect(screen, (255, 215, 0), (screen_x, screen_y, self.game.TILE_SIZE, self.game.TILE_SIZE))
-            else:
-                # Draw object resources - this path is likely never used now
+                    if resource["type"] in resource_colors:
+                        queue.fill(render_queue.RESOURCES, resource_colors[resource["type"]],
+                                   (screen_x, screen_y, self.game.TILE_SIZE, self.game.TILE_SIZE))
+            elif not isinstance(resource, Fish):  # Fish are drawn with their school, under the water
+                # Draw object resources
                 screen_x = resource.x - camera_x
                 screen_y = resource.y - camera_y
                 
@@ -1427,12 +1592,16 @@ class World:
                 if (screen_x > -resource.width and screen_x < self.game.SCREEN_WIDTH and
                     screen_y > -resource.height and screen_y < self.game.SCREEN_HEIGHT):
                     # Call the object's draw method with the correct parameters
-                    resource.draw(screen, screen_x, screen_y)
+                    resource.draw(queue.layer(render_queue.RESOURCES), screen_x, screen_y)
                     
         # Draw all enemies with camera offset
+        enemy_layer = queue.layer(render_queue.ENEMIES)
         for enemy in self.enemies:
-            # Calculate screen position
-            screen_x = enemy["x"] - camera_x
+            # Calculate screen position, interpolated between the last two ticks
+            prev_x = enemy.get("prev_x", enemy["x"])
+            prev_y = enemy.get("prev_y", enemy["y"])
+            screen_x = prev_x + (enemy["x"] - prev_x) * alpha - camera_x
+            screen_y = prev_y + (enemy["y"] - prev_y) * alpha
             
             # Get enemy size based on the type
             width = 0
@@ -1445,7 +1614,7 @@ class World:
             # Only draw if on screen
             if screen_x + width > 0 and screen_x < self.game.SCREEN_WIDTH:
                 # Draw the enemy
-                enemy["enemy_obj"].draw(screen, screen_x, enemy["y"], enemy["facing_right"])
+                enemy["enemy_obj"].draw(enemy_layer, screen_x, screen_y, enemy["facing_right"])
                 
                 # Display health bar for enemy
                 if "health" in enemy and "max_health" in enemy:
@@ -1455,75 +1624,75 @@ class World:
                     health_width = 30
                     health_height = 4
                     health_x = screen_x + (width / 2) - (health_width / 2)
-                    health_y = enemy["y"] - 10
+                    health_y = screen_y - 10
                     
                     # Background (red)
-                    pygame.draw.rect(screen, (255, 0, 0), (health_x, health_y, health_width, health_height))
+                    queue.fill(render_queue.HEALTH_BARS, (255, 0, 0), (health_x, health_y, health_width, health_height))
                     
                     # Foreground (green) - scaled by health percentage
                     health_percent = health / max_health
-                    pygame.draw.rect(screen, (0, 255, 0), 
-                                    (health_x, health_y, health_width * health_percent, health_height))
-        
-        # Draw clouds
-        for cloud in self.clouds:
-            # Cloud follows screen, not world (parallax effect)
-            # Handle x in rect or directly in cloud
-            if "x" in cloud:
-                cloud_x = cloud["x"] - (camera_x * 0.1)  # Clouds move at 1/10 the speed
-                cloud_y = cloud["y"]
-            else:
-                cloud_x = cloud["rect"].x - (camera_x * 0.1)
-                cloud_y = cloud["rect"].y
-                
-            # Draw the cloud sprite
-            sprite_index = cloud.get("sprite_index", 0)
-            if self.cloud_sprites and sprite_index < len(self.cloud_sprites):
-                screen.blit(self.cloud_sprites[sprite_index], (cloud_x, cloud_y))
+                    queue.fill(render_queue.HEALTH_BARS, (0, 255, 0),
+                               (health_x, health_y, health_width * health_percent, health_height))
+        
+        # Block-break debris and sparks
+        self.particle_system.draw(queue.layer(render_queue.PARTICLES), camera_x)
         
     def update(self):
         self.particle_system.update()
         
-        # Update fish movement if in level 2+
-        if self.game.current_level >= 2:
-            for fish in self.resources[:]:  # Use copy for safe removal
-                if isinstance(fish, Fish):  # Only process Fish objects
-                    fish.update()
+        # Update the fish school if the lake is close enough to simulate
+        if self.school:
+            steps = self.game.lod.steps(self.school.left, self.school.width)
+            if steps:
+                self.school.step(steps)
+                # Only fish that may be drawn need their objects updated
+                margin = self.game.TILE_SIZE
+                self.school.sync(self.game.camera_x - margin, self.game.camera_x + self.game.SCREEN_WIDTH + margin)
+            
+            # Check if fish have been eaten by player
+            player = self.game.player
+            if player.swimming:
+                for fish in self.school.touching(pygame.Rect(player.x, player.y, player.width, player.height)):
+                    # Give player health and remove fish
+                    player.health = min(player.max_health, player.health + fish.healing)
+                    self.game.notification_system.add_notification(f"Ate fish! +{fish.healing} Health")
+                    self.resources.remove(fish)
+                    self.school.remove(fish)
+                    self.game.pools["fish"].release(fish)
                     
-                    # Check if fish has been eaten by player
-                    if self.game.player.swimming and self.check_fish_collision(fish):
-                        # Give player health and remove fish
-                        self.game.player.health = min(self.game.player.max_health, 
-                                                self.game.player.health + fish.healing)
-                        self.game.notification_system.add_notification(f"Ate fish! +{fish.healing} Health")
-                        self.resources.remove(fish)
-                        
-                        # Spawn a new fish to replace it
-                        lake_start_x = 100
-                        lake_width = self.game.WORLD_WIDTH // 4
-                        fish_x = lake_start_x + random.randint(0, lake_width - 20)
-                        fish_y = self.game.SCREEN_HEIGHT - 100 + random.randint(10, 70)
-                        new_fish = Fish(self.game, fish_x, fish_y)
-                        self.resources.append(new_fish)
-        
-        # Update enemies (crabs or dinosaurs)
+                    # Spawn a new fish somewhere in the lake to replace it
+                    self.add_fish()
+        
+        # Point the shared pursuit field at the player
+        player = self.game.player
+        self.flow_field.update(self.game.tick_count, player.x, player.width, player.y + player.height)
+        
+        # Update enemies (crabs or dinosaurs), off-screen ones at a lower rate
+        enemy_steps = []
+        active_enemies = []
         for enemy in self.enemies:
-            # Update crab enemy
-            enemy["enemy_obj"].update()
-            
-            # Simple movement AI
-            if random.random() < 0.02:  # 2% chance to change direction
-                enemy["vel_x"] = random.choice([-1, 0, 1])
-                
-            # Update position
-            enemy["x"] += enemy["vel_x"]
+            steps = self.game.lod.steps(enemy["x"], enemy["enemy_obj"].width, enemy["id"])
+            enemy_steps.append(steps)
+            if steps:
+                # Update crab enemy
+                enemy["enemy_obj"].update()
+                active_enemies.append(enemy)
+        
+        # Decisions are spread over ticks, attacks and movement below run every tick
+        self.ai.run(active_enemies, self.decide)
+        
+        for enemy in active_enemies:
+            self.attack_player(enemy)
             
             # Update facing direction
             if enemy["vel_x"] > 0:
                 enemy["facing_right"] = True
             elif enemy["vel_x"] < 0:
                 enemy["facing_right"] = False
-                
+        
+        self.move_enemies(enemy_steps)
+        
+        for enemy in self.enemies:
             # Apply world boundaries
             if enemy["x"] < 0:
                 enemy["x"] = 0
@@ -1531,20 +1700,104 @@ class World:
             elif enemy["x"] > self.game.WORLD_WIDTH - enemy["enemy_obj"].width:
                 enemy["x"] = self.game.WORLD_WIDTH - enemy["enemy_obj"].width
                 enemy["vel_x"] = -abs(enemy["vel_x"])  # Bounce off edge
-                
-            # Apply gravity
-            enemy["vel_y"] += self.game.GRAVITY * 0.5  # Half gravity effect
-            enemy["y"] += enemy["vel_y"]
-            
-            # Ground collision
-            ground_height = self.game.SCREEN_HEIGHT - 100
-            if enemy["y"] + enemy["enemy_obj"].height > ground_height:
-                enemy["y"] = ground_height - enemy["enemy_obj"].height
-                enemy["vel_y"] = 0
+
+    def decide(self, enemy):
+        """Choose an enemy's direction"""
+        player = self.game.player
+        enemy_obj = enemy["enemy_obj"]
+        tick = self.game.tick_count
+        elapsed = tick - enemy.get("decided_at", tick - 1)  # Ticks since this enemy last decided
+        enemy["decided_at"] = tick
+        
+        # Enemies that see the player keep chasing for a while after losing sight
+        if self.can_see_player(enemy):
+            enemy["aggro_until"] = tick + self.game.AGGRO_MEMORY
+        aggro = tick < enemy.get("aggro_until", 0)
+        
+        # Chase the player when aggro and a short path exists, otherwise wander
+        direction, distance = self.flow_field.steer(enemy["x"], enemy_obj.width, enemy["y"] + enemy_obj.height)
+        chasing = aggro and 0 <= distance <= self.game.ENEMY_CHASE_RANGE
+        if chasing and distance == 0:
+            # Same cell as the player, close in directly
+            offset = (player.x + player.width / 2) - (enemy["x"] + enemy_obj.width / 2)
+            enemy["vel_x"] = (offset > 0) - (offset < 0)
+        elif chasing:
+            enemy["vel_x"] = direction
+        elif random.random() < 1 - 0.98 ** elapsed:  # 2% chance per tick to change direction
+            enemy["vel_x"] = random.choice([-1, 0, 1])
+            
+    def attack_player(self, enemy):
+        """Attack when touching the player and the enemy's cooldown allows"""
+        player = self.game.player
+        enemy_obj = enemy["enemy_obj"]
+        if not player.invincible and enemy_obj.can_attack():
+            player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
+            enemy_rect = pygame.Rect(enemy["x"], enemy["y"], enemy_obj.width, enemy_obj.height)
+            if player_rect.colliderect(enemy_rect):
+                player.take_hit(enemy_obj, enemy_obj.attack())
+
+    def can_see_player(self, enemy):
+        """Aggro query: whether an enemy has the player in range and in line of sight"""
+        tick = self.game.tick_count
+        if self.sight_tick != tick:
+            self.sight = self.enemy_sight()
+            self.sight_tick = tick
+        return self.sight.get(enemy["id"], False)
+
+    def enemy_sight(self):
+        """Cast every in-range enemy's ray to the player through the terrain in one batch"""
+        player = self.game.player
+        target_x = player.x + player.width / 2
+        target_y = player.y + player.height / 2
+        sight = {}
+        in_range = []
+        for enemy in self.enemies:
+            enemy_obj = enemy["enemy_obj"]
+            eye_x = enemy["x"] + enemy_obj.width / 2
+            eye_y = enemy["y"] + enemy_obj.height / 2
+            if math.hypot(target_x - eye_x, target_y - eye_y) <= self.game.ENEMY_SIGHT_RANGE:
+                in_range.append((enemy["id"], eye_x, eye_y))
+            else:
+                sight[enemy["id"]] = False
+        
+        if in_range:
+            ids, eye_x, eye_y = zip(*in_range)
+            count = len(ids)
+            clear = self.terrain.raycast(numpy.array(eye_x), numpy.array(eye_y),
+                                         numpy.full(count, target_x), numpy.full(count, target_y))
+            sight.update(zip(ids, clear.tolist()))
+        return sight
+
+    def move_enemies(self, enemy_steps):
+        """Apply velocity and gravity to every enemy, swept against the terrain in one batch.
+
+        enemy_steps holds how many ticks each enemy advances; 0 leaves it in place.
+        """
+        enemies = [enemy for enemy, steps in zip(self.enemies, enemy_steps) if steps]
+        if not enemies:
+            return
+        steps = numpy.array([steps for steps in enemy_steps if steps], dtype=float)
+        x = numpy.array([enemy["x"] for enemy in enemies], dtype=float)
+        y = numpy.array([enemy["y"] for enemy in enemies], dtype=float)
+        width = numpy.array([enemy["enemy_obj"].width for enemy in enemies])
+        height = numpy.array([enemy["enemy_obj"].height for enemy in enemies])
+        vel_x = numpy.array([enemy["vel_x"] for enemy in enemies], dtype=float)
+        vel_y = numpy.array([enemy["vel_y"] for enemy in enemies], dtype=float)
+        vel_y += self.game.GRAVITY * 0.5 * steps  # Half gravity effect
+        
+        x, y, hit_wall = self.terrain.move_x(x, y, width, height, vel_x * steps)
+        y, hit_ground = self.terrain.move_y(x, y, width, height, vel_y * steps)
+        
+        for i, enemy in enumerate(enemies):
+            enemy["x"] = float(x[i])
+            enemy["y"] = float(y[i])
+            enemy["vel_y"] = 0 if hit_ground[i] else float(vel_y[i])
+            if hit_wall[i]:
+                enemy["vel_x"] = -enemy["vel_x"]  # Turn around at walls too tall to climb
 
     def spawn_crab(self, x, y):
-        # Create new crab enemy
-        crab = Crab()
+        # Create new crab enemy, reusing a pooled one if possible
+        crab = self.game.pools["crab"].acquire()
         
         # Position the crab at the given location
         crab_x = x - crab.width // 2
@@ -1554,7 +1807,7 @@ class World:
         facing_right = random.choice([True, False])
         
         # Add to enemies list
-        self.enemies.append({
+        self.add_enemy({
             "enemy_obj": crab,
             "x": crab_x,
             "y": crab_y,
@@ -1565,6 +1818,13 @@ class World:
             "max_health": crab.max_health
         })
         
+    def add_enemy(self, enemy):
+        """Add an enemy to the world and record it for the next autosave"""
+        enemy["id"] = self.next_enemy_id
+        self.next_enemy_id += 1
+        self.enemies.append(enemy)
+        self.spawned_enemies.append(enemy)
+        
     def remove_enemy(self, enemy):
         if enemy in self.enemies:
             # Check if it was the King Crab
@@ -1572,19 +1832,41 @@ class World:
                 self.king_crab_defeated = True
                 
             self.enemies.remove(enemy)
+            self.removed_enemy_ids.append(enemy["id"])
+            self.game.pools[self.enemy_type(enemy["enemy_obj"])].release(enemy["enemy_obj"])
 
-    def check_fish_collision(self, fish):
-        """Check if player has collided with a fish while swimming"""
-        player = self.game.player
-        player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
-        fish_rect = pygame.Rect(fish.x, fish.y, fish.width, fish.height)
-        
-        return player_rect.colliderect(fish_rect)
+    def release(self):
+        """Return every pooled object to its pool before the world is dropped"""
+        pools = self.game.pools
+        for enemy in self.enemies:
+            pools[self.enemy_type(enemy["enemy_obj"])].release(enemy["enemy_obj"])
+        self.enemies = []
+        if self.school:
+            for fish in self.school.fish:
+                self.resources.remove(fish)
+                pools["fish"].release(fish)
+            self.school = None
+        for particle in self.particle_system.particles:
+            self.particle_system.pool.release(particle)
+        self.particle_system.particles = []
+
+    def add_fish(self):
+        """Add a fish at a random spot in the lake and to its school"""
+        x, y = self.school.random_point()
+        fish = self.game.pools["fish"].acquire(x, y)
+        fish.reset(x - fish.width / 2, y - fish.height / 2)
+        self.resources.append(fish)
+        self.school.add(fish)
 
     def remove_tile(self, tile):
         if tile in self.tiles:
             tile_type = tile["type"]
             self.tiles.remove(tile)
+            self.removed_tile_ids.append(tile["id"])
+            if is_terrain_tile(tile, self.game.TILE_SIZE):
+                self.terrain.remove_tile(tile)
+            else:
+                self.feature_tiles.remove(tile)
             # Decrement resource count only if it was a tree or stone
             if tile_type in ["tree", "stone"]:
                 self.initial_resource_count -= 1
@@ -1596,14 +1878,14 @@ class World:
     def spawn_king_crab(self):
         if not self.king_crab_spawned:
             self.king_crab_spawned = True
-            king_crab = KingCrab()
+            king_crab = self.game.pools["king_crab"].acquire()
             
             # Spawn near center of the world, on the ground
             spawn_x = self.game.WORLD_WIDTH // 2 - king_crab.width // 2
             ground_height = self.game.SCREEN_HEIGHT - 100
             spawn_y = ground_height - king_crab.height
             
-            self.enemies.append({
+            self.add_enemy({
                 "enemy_obj": king_crab, # Use "enemy_obj" key for consistency
                 "x": spawn_x,
                 "y": spawn_y,
@@ -1620,6 +1902,108 @@ class World:
             self.game.notification_system.add_notification("The KING CRAB has appeared!", 300)
             # Maybe play a boss sound? self.game.sound_manager.play("boss_spawn")
 
+    def drain_changes(self):
+        """Return and reset everything that changed since the last call"""
+        changes = {
+            "removed_tiles": self.removed_tile_ids,
+            "spawned_enemies": [self.enemy_snapshot(enemy) for enemy in self.spawned_enemies],
+            "removed_enemies": self.removed_enemy_ids
+        }
+        self.removed_tile_ids = []
+        self.spawned_enemies = []
+        self.removed_enemy_ids = []
+        return changes
+
+    def enemy_type(self, enemy_obj):
+        """Name used for an enemy's class in saves and pools"""
+        if isinstance(enemy_obj, KingCrab):
+            return "king_crab"
+        elif isinstance(enemy_obj, Dinosaur):
+            return "dinosaur"
+        return "crab"
+
+    def enemy_snapshot(self, enemy):
+        enemy_obj = enemy["enemy_obj"]
+        return {
+            "id": enemy["id"],
+            "type": self.enemy_type(enemy_obj),
+            "x": enemy["x"],
+            "y": enemy["y"],
+            "vel_x": enemy["vel_x"],
+            "facing_right": enemy["facing_right"],
+            "health": enemy_obj.health
+        }
+
+    def flags_snapshot(self):
+        return {
+            "initial_resource_count": self.initial_resource_count,
+            "enemies_spawned": self.enemies_spawned,
+            "king_crab_spawned": self.king_crab_spawned,
+            "king_crab_defeated": self.king_crab_defeated,
+            "next_enemy_id": self.next_enemy_id
+        }
+
+    def snapshot(self):
+        """Return the full world state as plain data for a base save"""
+        tiles = []
+        for tile in self.tiles:
+            saved = {key: value for key, value in tile.items() if key != "rect"}
+            saved["rect"] = list(tile["rect"])
+            tiles.append(saved)
+        return {
+            "tiles": tiles,
+            "water_tiles": [list(water["rect"]) for water in self.water_tiles],
+            "resources": [
+                {"x": r["x"], "y": r["y"], "type": r["type"], "health": r["health"], "rect": list(r["rect"])}
+                for r in self.resources if isinstance(r, dict)
+            ],
+            "enemies": [self.enemy_snapshot(enemy) for enemy in self.enemies],
+            "flags": self.flags_snapshot()
+        }
+
+    def restore(self, state):
+        """Replace the generated world contents with saved data"""
+        self.tiles = []
+        for saved in state["tiles"]:
+            tile = dict(saved)
+            tile["rect"] = pygame.Rect(saved["rect"])
+            self.tiles.append(tile)
+        self.rebuild_terrain()
+
+        self.water_tiles = []
+        for rect in state["water_tiles"]:
+            self.water_tiles.append({"rect": pygame.Rect(rect), "x": rect[0], "y": rect[1]})
+
+        # Fish are kept from generation, saved resource nodes replace the rest
+        self.resources = [r for r in self.resources if not isinstance(r, dict)]
+        for saved in state["resources"]:
+            resource = dict(saved)
+            resource["rect"] = pygame.Rect(saved["rect"])
+            self.resources.append(resource)
+
+        for enemy in self.enemies:
+            self.game.pools[self.enemy_type(enemy["enemy_obj"])].release(enemy["enemy_obj"])
+        self.enemies = []
+        for saved in state["enemies"]:
+            enemy_obj = self.game.pools[saved["type"]].acquire()
+            enemy_obj.health = saved["health"]
+            self.enemies.append({
+                "enemy_obj": enemy_obj,
+                "id": saved["id"],
+                "x": saved["x"],
+                "y": saved["y"],
+                "vel_x": saved["vel_x"],
+                "vel_y": 0,
+                "facing_right": saved["facing_right"],
+                "health": enemy_obj.health,
+                "max_health": enemy_obj.max_health
+            })
+
+        for key, value in state["flags"].items():
+            setattr(self, key, value)
+
+        self.drain_changes()
+
 class PrincessNPC:
     def __init__(self, game):
         self.game = game
@@ -1631,86 +2015,104 @@ class PrincessNPC:
         ground_height = game.SCREEN_HEIGHT - 100
         self.x = random.randint(0, game.WORLD_WIDTH - self.width)
         self.y = ground_height - self.height
+        self.prev_x = self.x  # Position at the previous tick, for interpolated drawing
         
         # Movement properties
         self.speed = 1  # Slower than player
         self.facing_right = random.choice([True, False])
-        self.move_timer = 0
         self.move_duration = random.randint(120, 300)  # 2-5 seconds at 60fps
-        self.rest_timer = 0
         self.rest_duration = random.randint(120, 240)  # 2-4 seconds
         self.is_moving = False
         
         # Food creation properties
-        self.food_timer = 0
         self.food_cooldown = 600  # 10 seconds at 60fps
         self.is_cooking = False
-        self.cooking_timer = 0
+        self.cooking_chance = 0.01  # Chance per tick of starting to cook while resting
         self.cooking_duration = 180  # 3 seconds
+        self.cook_start_timer = None
         
         # Food items that can be created
         self.food_types = ["apple", "cake", "cookie"]
         
-    def update(self, world):
-        # Handle princess movement
-        if self.is_moving:
-            # Move princess
-            if self.facing_right:
-                self.x += self.speed
-                # Check if reached world boundary
-                if self.x > self.game.WORLD_WIDTH - self.width:
-                    self.x = self.game.WORLD_WIDTH - self.width
-                    self.facing_right = False
-            else:
-                self.x -= self.speed
-                # Check if reached world boundary
-                if self.x < 0:
-                    self.x = 0
-                    self.facing_right = True
-                    
-            # Update move timer
-            self.move_timer += 1
-            if self.move_timer >= self.move_duration:
-                self.move_timer = 0
-                self.is_moving = False
-                self.rest_timer = 0
-        else:
-            # Princess is resting, possibly cooking
-            self.rest_timer += 1
+        # Cooking indicator, rendered once
+        bubble_radius = 8
+        self.bubble = pygame.Surface((bubble_radius * 2 + 1, bubble_radius * 2 + 1), pygame.SRCALPHA)
+        # Draw white bubble
+        pygame.draw.circle(self.bubble, (255, 255, 255), (bubble_radius, bubble_radius), bubble_radius)
+        pygame.draw.circle(self.bubble, (0, 0, 0), (bubble_radius, bubble_radius), bubble_radius, 1)
+        # Draw food icon inside bubble
+        # For simplicity, just draw a small colored circle representing food
+        food_color = (255, 0, 0)  # Red for food
+        pygame.draw.circle(self.bubble, food_color, (bubble_radius, bubble_radius), bubble_radius // 2)
+        self.bubble = sprite_factory.finalize(self.bubble)
+        
+        # The move/rest/cook cycle runs on the timer wheel
+        self.timers = game.timers
+        self.start_resting()
+        self.timers.schedule(self.food_cooldown, self.food_check)
+        
+    def start_resting(self):
+        self.is_moving = False
+        self.princess.animate(False)
+        self.timers.schedule(self.rest_duration, self.start_moving)
+        
+        # Rolling the per-tick cooking chance until it hits is the same as
+        # drawing a geometric delay once
+        delay = int(math.log(1.0 - random.random()) / math.log(1.0 - self.cooking_chance)) + 1
+        if delay < self.rest_duration:
+            self.cook_start_timer = self.timers.schedule(delay, self.start_cooking)
+            
+    def start_moving(self):
+        if self.cook_start_timer:
+            self.cook_start_timer.cancel()
+        self.is_moving = True
+        self.move_duration = random.randint(120, 300)
+        # 50% chance to change direction
+        if random.random() < 0.5:
+            self.facing_right = not self.facing_right
+        self.timers.schedule(self.move_duration, self.start_resting)
+        
+    def start_cooking(self):
+        if not self.is_cooking:
+            self.is_cooking = True
+            self.timers.schedule(self.cooking_duration, self.finish_cooking)
+            
+    def finish_cooking(self):
+        self.cook_food()
+        self.is_cooking = False
+        
+    def food_check(self):
+        # Create food if not cooking already
+        if random.random() < 0.5:  # 50% chance
+            self.start_cooking()
+        self.timers.schedule(self.food_cooldown, self.food_check)
+        
+    def update(self, world, steps=1):
+        # Only movement needs per-tick work, timers handle everything else.
+        # steps is the number of ticks to advance, 0 while she is far off-screen.
+        if not self.is_moving or not steps:
+            return
             
-            # Check if should start cooking
-            if not self.is_cooking and random.random() < 0.01:  # 1% chance each frame
-                self.is_cooking = True
-                self.cooking_timer = 0
+        # Move princess
+        if self.facing_right:
+            self.x += self.speed * steps
+            # Check if reached world boundary
+            if self.x > self.game.WORLD_WIDTH - self.width:
+                self.x = self.game.WORLD_WIDTH - self.width
+                self.facing_right = False
+        else:
+            self.x -= self.speed * steps
+            # Check if reached world boundary
+            if self.x < 0:
+                self.x = 0
+                self.facing_right = True
                 
-            # Handle cooking
-            if self.is_cooking:
-                self.cooking_timer += 1
-                if self.cooking_timer >= self.cooking_duration:
-                    self.cook_food()
-                    self.is_cooking = False
-            
-            # Check if rest period is over
-            if self.rest_timer >= self.rest_duration:
-                self.is_moving = True
-                self.move_timer = 0
-                self.move_duration = random.randint(120, 300)
-                # 50% chance to change direction
-                if random.random() < 0.5:
-                    self.facing_right = not self.facing_right
-                    
-        # Food timer
-        self.food_timer += 1
-        if self.food_timer >= self.food_cooldown:
-            self.food_timer = 0
-            # Create food if not cooking already
-            if not self.is_cooking and random.random() < 0.5:  # 50% chance
-                self.is_cooking = True
-                self.cooking_timer = 0
-        
-    def draw(self, screen, camera_x):
-        # Calculate screen position
-        screen_x = self.x - camera_x
+        # Advance walking animation
+        self.princess.animate(self.is_moving)
+        
+    def draw(self, screen, camera_x, alpha=1.0):
+        # Calculate screen position, interpolated between the last two ticks
+        screen_x = self.prev_x + (self.x - self.prev_x) * alpha - camera_x
         
         # Only draw if on screen
         if screen_x + self.width > 0 and screen_x < self.game.SCREEN_WIDTH:
@@ -1719,27 +2121,17 @@ class PrincessNPC:
             
             # If cooking, draw a cooking indicator
             if self.is_cooking:
-                # Draw cooking bubble
-                bubble_radius = 8
+                bubble_radius = self.bubble.get_width() // 2
                 bubble_x = screen_x + (self.width if self.facing_right else 0)
                 bubble_y = self.y - bubble_radius * 2
-                
-                # Draw white bubble
-                pygame.draw.circle(screen, (255, 255, 255), (bubble_x, bubble_y), bubble_radius)
-                pygame.draw.circle(screen, (0, 0, 0), (bubble_x, bubble_y), bubble_radius, 1)
-                
-                # Draw food icon inside bubble
-                # For simplicity, just draw a small colored circle representing food
-                food_color = (255, 0, 0)  # Red for food
-                pygame.draw.circle(screen, food_color, (bubble_x, bubble_y), bubble_radius // 2)
+                screen.blit(self.bubble, (bubble_x - bubble_radius, bubble_y - bubble_radius))
     
     def cook_food(self):
         # Create a random food item
         food_type = random.choice(self.food_types)
-        food = Food(food_type)
         
         # Add food to player's inventory
-        self.game.player.inventory["food"].append(food)
+        self.game.player.inventory["food"].add(food_type)
         
         # Show notification
         self.game.notification_system.add_notification(f"Princess made {food_type} for you!")
@@ -1781,30 +2173,20 @@ class Fish:
         
         # Eye
         pygame.draw.rect(self.surface, self.eye_color, (10, 5, 2, 2))
+        self.surface = sprite_factory.finalize(self.surface)
+        self.flipped_surface = sprite_factory.flipped(self.surface)
+        
+        self.reset(x, y)
         
-        # Animation
+    def reset(self, x, y):
+        """Place the fish, also used when it is reused from a pool"""
+        self.x = x
+        self.y = y
+        self.rect.topleft = (x, y)
+        
+        # Starting heading, movement is driven by the World's FishSchool
         self.facing_right = random.choice([True, False])
         self.speed = random.uniform(0.2, 0.5)
-        self.movement_timer = 0
-        self.movement_change = random.randint(60, 120)
-        
-    def update(self):
-        # Simple fish movement - back and forth in water
-        self.movement_timer += 1
-        if self.movement_timer >= self.movement_change:
-            self.movement_timer = 0
-            self.movement_change = random.randint(60, 120)
-            self.facing_right = not self.facing_right
-            
-        # Move fish
-        if self.facing_right:
-            self.x += self.speed
-        else:
-            self.x -= self.speed
-            
-        # Update rect
-        self.rect.x = self.x
-        self.rect.y = self.y
         
     def draw(self, screen, x, y):
         # Only draw if on screen
@@ -1812,11 +2194,7 @@ class Fish:
             y > -self.height and y < self.game.SCREEN_HEIGHT):
             
             # Flip surface if facing left
-            if self.facing_right:
-                screen.blit(self.surface, (x, y))
-            else:
-                flipped = pygame.transform.flip(self.surface, True, False)
-                screen.blit(flipped, (x, y))
+            screen.blit(self.surface if self.facing_right else self.flipped_surface, (x, y))
                 
     def collect(self, player):
         # Heal player when fish is collected
@@ -0,0 +1,236 @@
+import os
+import random
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy
+
+class GameEnv:
+    """A single headless game session with a reset/step interface for bots.
+
+    config is a dict of Game attributes to override after every reset, e.g.
+    {"TREE_CRAB_CHANCE": 0.5, "XP_GROWTH": 1.3} for balance testing.
+    """
+    # Discrete actions
+    NOOP = 0
+    LEFT = 1
+    RIGHT = 2
+    JUMP = 3
+    INTERACT = 4
+    ATTACK = 5
+    EAT = 6
+    NUM_ACTIONS = 7
+
+    # Observation layout (one float32 per entry)
+    OBSERVATION_FIELDS = [
+        "player_x", "player_y", "player_vel_y", "health", "max_health",
+        "experience", "player_level", "wood", "stone", "food",
+        "current_level", "enemy_count", "nearest_enemy_dx", "nearest_enemy_dy",
+        "nearest_object_dx", "nearest_object_dy"
+    ]
+    OBSERVATION_SIZE = len(OBSERVATION_FIELDS)
+
+    def __init__(self, config=None, ticks_per_step=1, max_episode_ticks=36000):
+        # Headless: no window and no audio device
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+        self.config = config or {}
+        self.ticks_per_step = ticks_per_step
+        self.max_episode_ticks = max_episode_ticks  # 10 minutes at 60 ticks per second
+        self.game = None
+        self.score = 0
+
+    def reset(self, seed=None, observation=None):
+        """Start a new session and return its first observation"""
+        from game import Game  # Imported late so the SDL environment is set first
+
+        random.seed(seed)
+        self.game = Game(autosave=False, deterministic=True)  # Rollouts must not depend on machine speed
+        for name, value in self.config.items():
+            setattr(self.game, name, value)
+        self.score = self._score()
+        return self.observe(observation)
+
+    def step(self, action, observation=None):
+        """Apply an action, advance the simulation and return (observation, reward, done)"""
+        game = self.game
+        player = game.player
+
+        if action == self.LEFT:
+            player.move(-game.PLAYER_SPEED)
+        elif action == self.RIGHT:
+            player.move(game.PLAYER_SPEED)
+        elif action == self.JUMP:
+            player.jump()
+        elif action == self.INTERACT:
+            closest_object = player.get_closest_interactive_object(game.world)
+            if closest_object:
+                player.interact(game.world, closest_object)
+        elif action == self.ATTACK:
+            player.switch_tool("sword")
+            player.perform_attack(game.world)
+        elif action == self.EAT:
+            player.eat_food()
+
+        for _ in range(self.ticks_per_step):
+            game.step()
+
+        score = self._score()
+        reward = score - self.score
+        self.score = score
+
+        done = (game.death_screen_active or game.level_transition_active or
+                game.tick_count >= self.max_episode_ticks)
+        return self.observe(observation), reward, done
+
+    def _score(self):
+        # XP plus collected resources, minus missing health
+        player = self.game.player
+        inventory = player.inventory
+        collected = inventory["wood"] + inventory["stone"] + inventory["ore"]
+        return player.total_experience + collected - (player.max_health - player.health) * 0.5
+
+    def observe(self, observation=None):
+        """Write the observation into the given float32 array (or a new one)"""
+        if observation is None:
+            observation = numpy.zeros(self.OBSERVATION_SIZE, dtype=numpy.float32)
+
+        game = self.game
+        player = game.player
+        world = game.world
+        center_x = player.x + player.width / 2
+        center_y = player.y + player.height / 2
+
+        nearest_enemy = None
+        nearest_distance = float("inf")
+        for enemy in world.enemies:
+            distance = abs(enemy["x"] - center_x)
+            if distance < nearest_distance:
+                nearest_distance = distance
+                nearest_enemy = enemy
+
+        observation[0] = player.x
+        observation[1] = player.y
+        observation[2] = player.vel_y
+        observation[3] = player.health
+        observation[4] = player.max_health
+        observation[5] = player.experience
+        observation[6] = player.level
+        observation[7] = player.inventory["wood"]
+        observation[8] = player.inventory["stone"]
+        observation[9] = len(player.inventory["food"])
+        observation[10] = game.current_level
+        observation[11] = len(world.enemies)
+        if nearest_enemy:
+            observation[12] = nearest_enemy["x"] - center_x
+            observation[13] = nearest_enemy["y"] - center_y
+        else:
+            observation[12:14] = 0
+
+        closest_object = player.get_closest_interactive_object(world)
+        if closest_object:
+            observation[14] = closest_object["rect"].centerx - center_x
+            observation[15] = closest_object["rect"].centery - center_y
+        else:
+            observation[14:16] = 0
+        return observation
+
+def _worker(conn, env_indices, num_envs, buffer_names, config, ticks_per_step, max_episode_ticks):
+    """Runs a slice of the environments in a child process"""
+    buffers = [shared_memory.SharedMemory(name=name) for name in buffer_names]
+    observations = numpy.ndarray((num_envs, GameEnv.OBSERVATION_SIZE), dtype=numpy.float32, buffer=buffers[0].buf)
+    rewards = numpy.ndarray(num_envs, dtype=numpy.float32, buffer=buffers[1].buf)
+    dones = numpy.ndarray(num_envs, dtype=numpy.bool_, buffer=buffers[2].buf)
+    actions = numpy.ndarray(num_envs, dtype=numpy.int32, buffer=buffers[3].buf)
+
+    envs = {i: GameEnv(config, ticks_per_step, max_episode_ticks) for i in env_indices}
+    seeds = {}
+
+    while True:
+        command, data = conn.recv()
+        if command == "reset":
+            for i, env in envs.items():
+                seeds[i] = data[i]
+                env.reset(seeds[i], observations[i])
+        elif command == "step":
+            for i, env in envs.items():
+                _, rewards[i], dones[i] = env.step(int(actions[i]), observations[i])
+                if dones[i]:
+                    # Auto-reset with a seed no other environment will use
+                    seeds[i] += num_envs
+                    env.reset(seeds[i], observations[i])
+        elif command == "close":
+            break
+        conn.send(None)
+
+    del observations, rewards, dones, actions
+    for buffer in buffers:
+        buffer.close()
+    conn.send(None)
+
+class VecGameEnv:
+    """Runs num_envs headless sessions across a pool of worker processes.
+
+    Observations, rewards, dones and actions live in shared memory, so a step
+    only sends a short command to each worker. Finished sessions reset
+    automatically and the returned observation is the first of the new session.
+    """
+    def __init__(self, num_envs, num_workers=None, config=None, ticks_per_step=1, max_episode_ticks=36000):
+        self.num_envs = num_envs
+        num_workers = min(num_workers or os.cpu_count() or 1, num_envs)
+
+        # Shared buffers: observations, rewards, dones, actions
+        sizes = [
+            num_envs * GameEnv.OBSERVATION_SIZE * 4,
+            num_envs * 4,
+            num_envs,
+            num_envs * 4
+        ]
+        self.buffers = [shared_memory.SharedMemory(create=True, size=size) for size in sizes]
+        self.observations = numpy.ndarray((num_envs, GameEnv.OBSERVATION_SIZE), dtype=numpy.float32, buffer=self.buffers[0].buf)
+        self.rewards = numpy.ndarray(num_envs, dtype=numpy.float32, buffer=self.buffers[1].buf)
+        self.dones = numpy.ndarray(num_envs, dtype=numpy.bool_, buffer=self.buffers[2].buf)
+        self.actions = numpy.ndarray(num_envs, dtype=numpy.int32, buffer=self.buffers[3].buf)
+        buffer_names = [buffer.name for buffer in self.buffers]
+
+        self.connections = []
+        self.processes = []
+        for worker in range(num_workers):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            env_indices = list(range(worker, num_envs, num_workers))
+            process = multiprocessing.Process(
+                target=_worker,
+                args=(child_conn, env_indices, num_envs, buffer_names, config, ticks_per_step, max_episode_ticks),
+                daemon=True)
+            process.start()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    def _broadcast(self, command, data=None):
+        for conn in self.connections:
+            conn.send((command, data))
+        for conn in self.connections:
+            conn.recv()
+
+    def reset(self, seed=0):
+        """Reset every session (env i uses seed + i) and return the observations"""
+        self._broadcast("reset", [seed + i for i in range(self.num_envs)])
+        return self.observations
+
+    def step(self, actions):
+        """Apply one action per session and return (observations, rewards, dones).
+
+        The returned arrays are views of shared memory that the next step overwrites.
+        """
+        self.actions[:] = actions
+        self._broadcast("step")
+        return self.observations, self.rewards, self.dones
+
+    def close(self):
+        self._broadcast("close")
+        for process in self.processes:
+            process.join()
+        del self.observations, self.rewards, self.dones, self.actions
+        for buffer in self.buffers:
+            buffer.close()
+            buffer.unlink()
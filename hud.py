@@ -0,0 +1,50 @@
+import pygame
+from sprite_factory import sprite_factory
+
+class HUD:
+    """Caches the HUD widgets in one overlay surface.
+
+    The overlay is only redrawn when a field it shows changes, so the usual
+    per-frame cost is a single blit.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.overlay = pygame.Surface(game.screen.get_size(), pygame.SRCALPHA)
+        self.state = None  # Observed fields the overlay was last drawn with
+
+    def observed_state(self):
+        game = self.game
+        player = game.player
+        inventory = player.inventory
+        return (
+            inventory["wood"], inventory["stone"], inventory["ore"],
+            len(inventory["food"]), tuple(food.type for food in inventory["food"].first(3)),
+            player.health, player.max_health,
+            player.experience, player.exp_to_next_level, player.level,
+            player.current_tool, player.building_system.building_mode,
+            player.show_inventory, game.level_transition_active, game.current_level
+        )
+
+    def invalidate(self):
+        self.state = None
+
+    def draw(self, screen):
+        state = self.observed_state()
+        if state != self.state:
+            self.state = state
+            self.redraw()
+        screen.blit(self.overlay, (0, 0))
+
+    def redraw(self):
+        game = self.game
+        player = game.player
+        # A new surface each time, so texture displays upload it again
+        self.overlay = pygame.Surface(game.screen.get_size(), pygame.SRCALPHA)
+
+        player.draw_resource_inventory(self.overlay)
+        player.draw_health_bar(self.overlay)
+        player.draw_experience_bar(self.overlay)
+
+        if not player.show_inventory and not game.level_transition_active:
+            game.draw_controls(self.overlay)
+        self.overlay = sprite_factory.finalize(self.overlay)
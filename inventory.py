@@ -0,0 +1,58 @@
+from collections import deque
+from sprites import Food
+
+class FoodInventory:
+    """The player's food, stored as counts by type.
+
+    All food of one type is identical, so one shared Food per type provides
+    the sprite and healing value for every item of that type. The order food
+    arrived in is kept as runs of [type, count] so the oldest is eaten first
+    while memory only grows with the number of type changes.
+    """
+    shared = {}  # Food type -> the Food shared by every item of that type
+
+    def __init__(self, types=()):
+        self.counts = {}
+        self.runs = deque()
+        for food_type in types:
+            self.add(food_type)
+
+    @classmethod
+    def food(cls, food_type):
+        if food_type not in cls.shared:
+            cls.shared[food_type] = Food(food_type)
+        return cls.shared[food_type]
+
+    def __len__(self):
+        return sum(self.counts.values())
+
+    def add(self, food_type):
+        self.counts[food_type] = self.counts.get(food_type, 0) + 1
+        if self.runs and self.runs[-1][0] == food_type:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([food_type, 1])
+
+    def pop(self):
+        """Remove the oldest item and return its shared Food, or None if empty"""
+        if not self.runs:
+            return None
+        run = self.runs[0]
+        run[1] -= 1
+        if run[1] == 0:
+            self.runs.popleft()
+        self.counts[run[0]] -= 1
+        return self.food(run[0])
+
+    def first(self, count):
+        """Shared Food of the oldest count items, in eating order"""
+        foods = []
+        for food_type, run_count in self.runs:
+            foods.extend([self.food(food_type)] * min(run_count, count - len(foods)))
+            if len(foods) == count:
+                break
+        return foods
+
+    def types(self):
+        """Every item's type in eating order, for saving"""
+        return [food_type for food_type, run_count in self.runs for _ in range(run_count)]
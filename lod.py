@@ -0,0 +1,42 @@
+# Simulation tiers, by distance from the visible area
+FULL = 0
+REDUCED = 1
+DORMANT = 2
+
+class SimulationLOD:
+    """Decides how often entities are simulated based on distance from the view.
+
+    Entities within full_margin pixels of the screen update every tick. Those
+    within reduced_margin update every reduced_interval ticks, taking one step
+    that many ticks long, staggered so they don't all land on the same tick.
+    Anything further away is dormant until the camera comes closer again.
+    """
+    def __init__(self, game, full_margin=200, reduced_margin=800, reduced_interval=4):
+        self.game = game
+        self.full_margin = full_margin
+        self.reduced_margin = reduced_margin
+        self.reduced_interval = reduced_interval
+        self.counts = [0, 0, 0]  # Entities seen in each tier this tick
+
+    def begin_tick(self):
+        self.counts = [0, 0, 0]
+
+    def tier(self, x, width):
+        view_left = self.game.camera_x
+        view_right = view_left + self.game.SCREEN_WIDTH
+        distance = max(view_left - (x + width), x - view_right, 0)
+        if distance <= self.full_margin:
+            return FULL
+        if distance <= self.reduced_margin:
+            return REDUCED
+        return DORMANT
+
+    def steps(self, x, width, slot=0):
+        """Number of ticks an entity at x should simulate this tick (0 to skip it)"""
+        tier = self.tier(x, width)
+        self.counts[tier] += 1
+        if tier == FULL:
+            return 1
+        if tier == REDUCED and (self.game.tick_count + slot) % self.reduced_interval == 0:
+            return self.reduced_interval
+        return 0
@@ -6,6 +6,7 @@ from sprites import Character
 from tool_sprites import AxeSprite, PickaxeSprite, HammerSprite
 from particles import ParticleSystem
 from sound_manager import SoundManager
+from timers import TimerWheel
 
 # Initialize Pygame
 pygame.init()
@@ -31,6 +32,7 @@ SELECTED_ITEM = (255, 255, 255, 100)
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Chase Run Swim Jump")
 clock = pygame.time.Clock()
+timers = TimerWheel()
 
 class Player:
     def __init__(self):
@@ -43,9 +45,9 @@ class Player:
         self.jumping = False
         self.facing_right = True
         self.tools = {
-            "axe": Axe(),
-            "pickaxe": Pickaxe(),
-            "hammer": Hammer()
+            "axe": Axe(timers),
+            "pickaxe": Pickaxe(timers),
+            "hammer": Hammer(timers)
         }
         self.tool_sprites = {
             "axe": AxeSprite(),
@@ -98,9 +100,6 @@ class Player:
         if self.x > SCREEN_WIDTH - self.width:
             self.x = SCREEN_WIDTH - self.width
             
-        # Update current tool
-        self.tools[self.current_tool].update()
-        
         # Update swing animation
         if self.is_swinging:
             self.swing_timer += 1
@@ -380,6 +379,7 @@ def main():
                 player.move(PLAYER_SPEED)
             
         # Update
+        timers.advance()
         player.update()
         world.update()
         
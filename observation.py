@@ -0,0 +1,154 @@
+import numpy
+import pygame
+from sprites import KingCrab, Dinosaur
+
+# Ids used in the tile grid
+TILE_EMPTY = 0
+TILE_TYPES = {"grass": 1, "dirt": 2, "stone": 3, "tree": 4}
+TILE_WATER = 5
+
+# Ids used in the enemy records
+ENEMY_CRAB = 0
+ENEMY_KING_CRAB = 1
+ENEMY_DINOSAUR = 2
+
+PLAYER_DTYPE = numpy.dtype([
+    ("x", numpy.float32), ("y", numpy.float32), ("vel_y", numpy.float32),
+    ("facing_right", numpy.bool_), ("swimming", numpy.bool_), ("jumping", numpy.bool_),
+    ("health", numpy.float32), ("max_health", numpy.float32),
+    ("experience", numpy.float32), ("level", numpy.int32), ("current_level", numpy.int32)
+])
+
+ENEMY_DTYPE = numpy.dtype([
+    ("active", numpy.bool_), ("type", numpy.int8),
+    ("x", numpy.float32), ("y", numpy.float32), ("vel_x", numpy.float32),
+    ("facing_right", numpy.bool_), ("health", numpy.float32)
+])
+
+class ObservationExporter:
+    """Exposes the rendered frame and the game state as NumPy arrays.
+
+    All arrays are allocated once and refreshed in place by refresh(), which
+    should be called after Game.draw(). Pixel arrays are indexed [x, y] like
+    pygame.surfarray.
+    """
+    def __init__(self, game, max_enemies=64, downsample=2, grayscale=False):
+        self.game = game
+        self.downsample = downsample
+        self.grayscale = grayscale
+
+        width, height = game.screen.get_size()
+        self.small = numpy.zeros((width // downsample, height // downsample, 3), dtype=numpy.uint8)
+        self.gray = numpy.zeros((width // downsample, height // downsample), dtype=numpy.float32)
+        self._channel = numpy.zeros_like(self.gray)  # Scratch space for grayscale
+
+        self.player = numpy.zeros((), dtype=PLAYER_DTYPE)
+        self.enemies = numpy.zeros(max_enemies, dtype=ENEMY_DTYPE)
+        self.enemy_count = 0
+        # Per-field views of the enemy records, written element by element
+        self._enemy_fields = [self.enemies[name] for name in ENEMY_DTYPE.names]
+
+        self.tile_grid = None
+        self._grid_world = None
+        self._grid_tile_count = -1
+
+    def frame_view(self):
+        """Return a zero-copy (width, height, 3) view of the screen.
+
+        The view locks the screen surface, so delete it before the next draw.
+        """
+        return pygame.surfarray.pixels3d(self.game.screen)
+
+    def refresh(self):
+        """Refresh all exported arrays from the current frame and state"""
+        self._refresh_pixels()
+        self._refresh_player()
+        self._refresh_enemies()
+        self._refresh_tile_grid()
+
+    def _refresh_pixels(self):
+        pixels = self.frame_view()
+        # Nearest-neighbour downsampling is just a strided view of the screen
+        step = self.downsample
+        numpy.copyto(self.small, pixels[:self.small.shape[0] * step:step, :self.small.shape[1] * step:step])
+        del pixels  # Unlock the screen
+
+        if self.grayscale:
+            # ITU-R 601 luma, accumulated without temporary arrays
+            numpy.multiply(self.small[..., 0], 0.299, out=self.gray)
+            numpy.multiply(self.small[..., 1], 0.587, out=self._channel)
+            self.gray += self._channel
+            numpy.multiply(self.small[..., 2], 0.114, out=self._channel)
+            self.gray += self._channel
+
+    def _refresh_player(self):
+        game = self.game
+        player = game.player
+        state = self.player
+        state["x"] = player.x
+        state["y"] = player.y
+        state["vel_y"] = player.vel_y
+        state["facing_right"] = player.facing_right
+        state["swimming"] = player.swimming
+        state["jumping"] = player.jumping
+        state["health"] = player.health
+        state["max_health"] = player.max_health
+        state["experience"] = player.experience
+        state["level"] = player.level
+        state["current_level"] = game.current_level
+
+    def _refresh_enemies(self):
+        enemies = self.game.world.enemies
+        count = min(len(enemies), len(self.enemies))
+        active, types, xs, ys, vel_xs, facing, health = self._enemy_fields
+        for i in range(count):
+            enemy = enemies[i]
+            enemy_obj = enemy["enemy_obj"]
+            if isinstance(enemy_obj, KingCrab):
+                types[i] = ENEMY_KING_CRAB
+            elif isinstance(enemy_obj, Dinosaur):
+                types[i] = ENEMY_DINOSAUR
+            else:
+                types[i] = ENEMY_CRAB
+            active[i] = True
+            xs[i] = enemy["x"]
+            ys[i] = enemy["y"]
+            vel_xs[i] = enemy["vel_x"]
+            facing[i] = enemy["facing_right"]
+            health[i] = enemy_obj.health
+        # Clear slots left over from enemies that are gone
+        if count < self.enemy_count:
+            active[count:self.enemy_count] = False
+        self.enemy_count = count
+
+    def _refresh_tile_grid(self):
+        # Tiles only change on level load and when one is removed
+        world = self.game.world
+        if world is self._grid_world and len(world.tiles) == self._grid_tile_count:
+            return
+
+        tile_size = self.game.TILE_SIZE
+        all_rects = [tile["rect"] for tile in world.tiles] + [water["rect"] for water in world.water_tiles]
+        columns = max([rect.right for rect in all_rects] + [self.game.WORLD_WIDTH]) // tile_size + 1
+        rows = max([rect.bottom for rect in all_rects] + [self.game.SCREEN_HEIGHT]) // tile_size + 1
+
+        if self.tile_grid is None or self.tile_grid.shape != (columns, rows):
+            self.tile_grid = numpy.zeros((columns, rows), dtype=numpy.uint8)
+        else:
+            self.tile_grid.fill(TILE_EMPTY)
+
+        for water in world.water_tiles:
+            self._fill_rect(water["rect"], TILE_WATER)
+        for tile in world.tiles:
+            self._fill_rect(tile["rect"], TILE_TYPES.get(tile["type"], TILE_EMPTY))
+
+        self._grid_world = world
+        self._grid_tile_count = len(world.tiles)
+
+    def _fill_rect(self, rect, tile_id):
+        tile_size = self.game.TILE_SIZE
+        left = max(0, rect.left // tile_size)
+        top = max(0, rect.top // tile_size)
+        right = (rect.right - 1) // tile_size + 1
+        bottom = (rect.bottom - 1) // tile_size + 1
+        self.tile_grid[left:right, top:bottom] = tile_id
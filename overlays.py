@@ -0,0 +1,61 @@
+import pygame
+from sprite_factory import sprite_factory
+
+class OverlayManager:
+    """Builds full-screen overlay pieces once and caches them.
+
+    Tints are cached per screen size and colour and text per string, so
+    overlay screens only redraw their dynamic parts each frame.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.fonts = {}
+        self.tints = {}
+        self.texts = {}
+        self.inventory_backgrounds = {}
+
+    def font(self, size):
+        if size not in self.fonts:
+            self.fonts[size] = pygame.font.Font(None, size)
+        return self.fonts[size]
+
+    def tint(self, color):
+        """Screen-sized surface filled with an RGBA colour"""
+        key = (self.game.screen.get_size(), color)
+        if key not in self.tints:
+            overlay = pygame.Surface(key[0], pygame.SRCALPHA)
+            overlay.fill(color)
+            self.tints[key] = sprite_factory.finalize(overlay)
+        return self.tints[key]
+
+    def text(self, text, size, color=(255, 255, 255)):
+        key = (text, size, color)
+        if key not in self.texts:
+            self.texts[key] = sprite_factory.finalize(self.font(size).render(text, True, color))
+        return self.texts[key]
+
+    def inventory_background(self, player):
+        """Tint, empty slots, tool icons and names of the tool inventory screen"""
+        key = (self.game.screen.get_size(), tuple(slot["name"] for slot in player.inventory_slots))
+        if key in self.inventory_backgrounds:
+            return self.inventory_backgrounds[key]
+
+        background = self.tint(self.game.INVENTORY_BG).copy()
+        slot_size = player.inventory_slot_size
+        for i, slot in enumerate(player.inventory_slots):
+            x, y = player.inventory_slot_position(i)
+
+            # Draw slot background
+            pygame.draw.rect(background, (100, 100, 100), (x, y, slot_size, slot_size))
+            pygame.draw.rect(background, (0, 0, 0), (x, y, slot_size, slot_size), 2)
+
+            # Draw tool sprite
+            player.draw_inventory_tool(background, i)
+
+            # Draw tool name
+            name_text = self.text(slot["name"], 24, (0, 0, 0))
+            name_rect = name_text.get_rect(center=(x + slot_size // 2, y + slot_size + 20))
+            background.blit(name_text, name_rect)
+
+        self.inventory_backgrounds[key] = background
+        return background
@@ -1,9 +1,16 @@
 import pygame
 import random
 import math
+from pools import ObjectPool
+from sprite_factory import sprite_factory
 
 class Particle:
+    images = {}  # Rendered images by (type, color, size, alpha), shared by all particles
+
     def __init__(self, x, y, color, particle_type="block"):
+        self.reset(x, y, color, particle_type)
+        
+    def reset(self, x, y, color, particle_type="block"):
         self.x = x
         self.y = y
         self.color = color
@@ -23,47 +30,49 @@ class Particle:
         self.lifetime -= 1
         self.alpha = int((self.lifetime / 30) * 255)
         
-    def draw(self, screen):
-        if self.type == "block":
+    def image(self):
+        key = (self.type, self.color, self.size, self.alpha)
+        if key not in Particle.images:
             surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(surface, (*self.color, self.alpha), (0, 0, self.size, self.size))
-            screen.blit(surface, (self.x, self.y))
-        elif self.type == "spark":
-            surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(surface, (255, 255, 255, self.alpha), 
-                             (self.size//2, self.size//2), self.size//2)
-            screen.blit(surface, (self.x, self.y))
+            if self.type == "spark":
+                pygame.draw.circle(surface, (255, 255, 255, self.alpha),
+                                 (self.size//2, self.size//2), self.size//2)
+            else:
+                pygame.draw.rect(surface, (*self.color, self.alpha), (0, 0, self.size, self.size))
+            Particle.images[key] = sprite_factory.finalize(surface)
+        return Particle.images[key]
+
+    def draw(self, screen):
+        screen.blit(self.image(), (self.x, self.y))
 
     def draw_with_camera(self, screen, camera_x):
         # Draw with camera offset
         screen_x = self.x - camera_x
         if screen_x < -10 or screen_x > screen.get_width() + 10:
             return  # Off-screen culling
-            
-        if self.type == "block":
-            surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(surface, (*self.color, self.alpha), (0, 0, self.size, self.size))
-            screen.blit(surface, (screen_x, self.y))
-        elif self.type == "spark":
-            surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(surface, (255, 255, 255, self.alpha), 
-                             (self.size//2, self.size//2), self.size//2)
-            screen.blit(surface, (screen_x, self.y))
+        screen.blit(self.image(), (screen_x, self.y))
 
 class ParticleSystem:
-    def __init__(self):
+    def __init__(self, pool=None):
         self.particles = []
+        self.pool = pool if pool else ObjectPool(Particle)  # Dead particles are reused
         
     def create_block_break(self, x, y, color):
         for _ in range(8):
-            self.particles.append(Particle(x, y, color, "block"))
+            self.particles.append(self.pool.acquire(x, y, color, "block"))
             
     def create_spark(self, x, y):
         for _ in range(4):
-            self.particles.append(Particle(x, y, (255, 255, 255), "spark"))
+            self.particles.append(self.pool.acquire(x, y, (255, 255, 255), "spark"))
             
     def update(self):
-        self.particles = [p for p in self.particles if p.lifetime > 0]
+        alive = []
+        for particle in self.particles:
+            if particle.lifetime > 0:
+                alive.append(particle)
+            else:
+                self.pool.release(particle)
+        self.particles = alive
         for particle in self.particles:
             particle.update()
             
@@ -0,0 +1,34 @@
+class ObjectPool:
+    """Reuses instances of one class instead of constructing new ones.
+
+    acquire() hands out a released instance, reset with the given arguments,
+    or builds a new one from factory(*args) when none are free. Pooled
+    classes provide a reset() method taking the same arguments, which keeps
+    their sprites so those are rendered only once per instance.
+    """
+    def __init__(self, factory, max_free=256):
+        self.factory = factory
+        self.max_free = max_free  # Released instances beyond this are left to the GC
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+
+    def acquire(self, *args):
+        if self.free:
+            instance = self.free.pop()
+            instance.reset(*args)
+            self.reused += 1
+        else:
+            instance = self.factory(*args)
+            self.created += 1
+        self.in_use += 1
+        return instance
+
+    def release(self, instance):
+        self.in_use -= 1
+        if len(self.free) < self.max_free:
+            self.free.append(instance)
+
+    def stats(self):
+        return {"created": self.created, "reused": self.reused, "in_use": self.in_use, "free": len(self.free)}
@@ -0,0 +1,160 @@
+import math
+import weakref
+import pygame
+from sprite_factory import sprite_factory
+
+# Layers of the world pass, drawn in increasing order
+BACKGROUND = 0
+TERRAIN = 10
+TILES = 20
+FISH = 30
+WATER = 40
+RESOURCES = 50
+ENEMIES = 60
+HEALTH_BARS = 70
+PRINCESS = 80
+PLAYER = 90
+PARTICLES = 100
+
+# The HUD, overlays and other screen-space drawing go in their own unscaled queue
+SCREEN = 0
+
+class QueueLayer:
+    """Stand-in for the screen that queues blits on one layer.
+
+    It has the parts of the Surface interface the draw code uses, so
+    existing draw(screen, ...) methods can draw into the queue unchanged.
+    """
+    def __init__(self, queue, layer):
+        self.queue = queue
+        self.layer = layer
+
+    def blit(self, surface, dest, area=None):
+        self.queue.add(self.layer, surface, dest, area)
+
+    def fill(self, color, rect):
+        self.queue.fill(self.layer, color, rect)
+
+    def get_size(self):
+        return self.queue.size
+
+    def get_width(self):
+        return self.queue.size[0]
+
+    def get_height(self):
+        return self.queue.size[1]
+
+    def get_rect(self):
+        return pygame.Rect((0, 0), self.queue.size)
+
+class RenderQueue:
+    """Collects the blits of a frame and submits each layer with one Surface.blits call.
+
+    Draw code adds (surface, dest) or (surface, dest, area) items to a layer
+    instead of blitting, and flush() draws the layers in order. Solid
+    rectangles are blits of a cached target-sized surface of their colour
+    cropped with area, so they batch with everything else.
+
+    Draw code always works in size pixels. When target_size is smaller the
+    positions are scaled to it and each surface is scaled once and cached
+    for as long as it is alive, so the layers are drawn at the lower
+    resolution.
+
+    flush_textures() replays the same items through an SDL renderer:
+    blits become Renderer.blit calls of cached textures and solid
+    rectangles become fill_rect calls.
+    """
+    def __init__(self, size, target_size=None):
+        self.size = tuple(size)
+        self.target_size = tuple(target_size or size)
+        self.scale_x = self.target_size[0] / self.size[0]
+        self.scale_y = self.target_size[1] / self.size[1]
+        self.scaling = self.target_size != self.size
+        self.layers = {}
+        self.views = {}
+        self.solids = {}  # Colour -> target-sized surface filled with it
+        self.solid_colors = {}  # Id of a solid surface -> its colour, for flush_textures
+        self.scaled = weakref.WeakKeyDictionary()  # Surface -> copy at the target scale
+
+    def layer(self, layer):
+        """Screen-like view that queues onto layer"""
+        if layer not in self.views:
+            self.views[layer] = QueueLayer(self, layer)
+        return self.views[layer]
+
+    def add(self, layer, surface, dest, area=None):
+        if self.scaling:
+            surface, dest, area = self.scale(surface, dest, area)
+        self.queue(layer, surface, dest, area)
+
+    def queue(self, layer, surface, dest, area=None):
+        """Add an item that is already in target pixels"""
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.append((surface, dest) if area is None else (surface, dest, area))
+
+    def scale(self, surface, dest, area=None):
+        """surface, dest and area in target pixels"""
+        scaled = self.scaled.get(surface)
+        if scaled is None:
+            width = max(1, round(surface.get_width() * self.scale_x))
+            height = max(1, round(surface.get_height() * self.scale_y))
+            scaled = pygame.transform.scale(surface, (width, height))
+            if surface in sprite_factory.finalized:
+                scaled = sprite_factory.finalize(scaled)  # Keeps RLE and the finalized mark
+            self.scaled[surface] = scaled
+        dest = (math.floor(dest[0] * self.scale_x), math.floor(dest[1] * self.scale_y))
+        if area is not None:
+            area = self.scale_rect(area)
+        return scaled, dest, area
+
+    def scale_rect(self, rect):
+        """rect in target pixels, from its scaled corners so neighbours stay seamless"""
+        rect = pygame.Rect(rect)
+        left = math.floor(rect.left * self.scale_x)
+        top = math.floor(rect.top * self.scale_y)
+        return pygame.Rect(left, top, math.floor(rect.right * self.scale_x) - left,
+                           math.floor(rect.bottom * self.scale_y) - top)
+
+    def solid(self, color):
+        if color not in self.solids:
+            flags = pygame.SRCALPHA if len(color) == 4 else 0
+            surface = pygame.Surface(self.target_size, flags)
+            surface.fill(color)
+            self.solids[color] = sprite_factory.finalize(surface)
+            self.solid_colors[id(self.solids[color])] = color
+        return self.solids[color]
+
+    def fill(self, layer, color, rect):
+        rect = pygame.Rect(rect).clip((0, 0), self.size)
+        if self.scaling:
+            rect = self.scale_rect(rect)
+        if rect.width and rect.height:
+            self.queue(layer, self.solid(tuple(color)), rect.topleft, (0, 0, rect.width, rect.height))
+
+    def flush(self, screen):
+        for layer in sorted(self.layers):
+            if sprite_factory.tracking:
+                for item in self.layers[layer]:
+                    sprite_factory.check(item[0])
+            screen.blits(self.layers[layer], doreturn=False)
+        self.layers.clear()
+
+    def flush_textures(self, renderer, texture):
+        """Draw the layers through renderer; texture(surface) gives the cached texture of a surface"""
+        for layer in sorted(self.layers):
+            for item in self.layers[layer]:
+                surface, dest = item[0], item[1]
+                area = pygame.Rect(item[2]) if len(item) == 3 else pygame.Rect((0, 0), surface.get_size())
+                dest_rect = pygame.Rect(dest[0], dest[1], area.width, area.height)
+                color = self.solid_colors.get(id(surface))
+                if color is not None:
+                    renderer.draw_blend_mode = 1 if len(color) == 4 else 0  # SDL_BLENDMODE_BLEND or NONE
+                    renderer.draw_color = pygame.Color(color)
+                    renderer.fill_rect(dest_rect)
+                    continue
+                if sprite_factory.tracking:
+                    sprite_factory.check(surface)
+                renderer.blit(texture(surface), dest_rect, area)
+        self.layers.clear()
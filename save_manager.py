@@ -0,0 +1,180 @@
+import json
+import os
+import queue
+import threading
+
+class SaveManager:
+    """Autosaves the game as a base snapshot plus append-only delta records.
+
+    The frame loop only gathers what changed since the last autosave. File
+    writes, delta replay and compaction all happen on a background thread.
+    """
+    def __init__(self, game, save_dir="saves", autosave_interval=1800, compact_after=20):
+        self.game = game
+        self.save_dir = save_dir
+        self.base_path = os.path.join(save_dir, "base.json")
+        self.delta_path = os.path.join(save_dir, "deltas.jsonl")
+        self.autosave_interval = autosave_interval  # 30 seconds at 60fps
+        self.compact_after = compact_after  # Delta records before a new base is written
+
+        self.seq = 0  # Sequence number of the last record handed to the writer
+        self.base_pending = True  # Next save must be a full snapshot
+        self.last_inventory = {}
+
+        # Writer thread state (only touched by the writer thread)
+        self._state = None
+        self._tiles = {}
+        self._enemies = {}
+        self._deltas_since_base = 0
+
+        self._jobs = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+    def has_save(self):
+        return os.path.exists(self.base_path)
+
+    def autosave(self):
+        """Queue a save. Costs time proportional to what changed since the last one."""
+        if self.base_pending:
+            self.save_base()
+            return
+
+        player = self.game.player
+        world = self.game.world
+        changes = world.drain_changes()
+
+        # Inventory is tiny, so diffing it against the last save is cheaper than
+        # hooking every place that mutates it
+        inventory = player.inventory_snapshot()
+        changed_inventory = {item: value for item, value in inventory.items()
+                             if self.last_inventory.get(item) != value}
+        self.last_inventory = inventory
+
+        self.seq += 1
+        self._jobs.put(("delta", {
+            "seq": self.seq,
+            "level": self.game.current_level,
+            "removed_tiles": changes["removed_tiles"],
+            "spawned_enemies": changes["spawned_enemies"],
+            "removed_enemies": changes["removed_enemies"],
+            "world_flags": world.flags_snapshot(),
+            "player": player.snapshot(),
+            "inventory": changed_inventory
+        }))
+
+    def save_base(self):
+        """Queue a full snapshot. Used for the first save and after level changes."""
+        player = self.game.player
+        world = self.game.world
+        world.drain_changes()  # Everything pending is part of the snapshot
+        self.last_inventory = player.inventory_snapshot()
+
+        self.seq += 1
+        self.base_pending = False
+        self._jobs.put(("base", {
+            "seq": self.seq,
+            "level": self.game.current_level,
+            "world": world.snapshot(),
+            "player": player.snapshot(),
+            "inventory": dict(self.last_inventory)
+        }))
+
+    def shutdown(self):
+        """Write a final delta and wait for the writer to finish."""
+        self.autosave()
+        self._jobs.put(("stop", None))
+        self._writer.join()
+
+    def load(self):
+        """Return the saved state with all newer deltas replayed, or None."""
+        try:
+            with open(self.base_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        tiles = {tile["id"]: tile for tile in state["world"]["tiles"]}
+        enemies = {enemy["id"]: enemy for enemy in state["world"]["enemies"]}
+
+        if os.path.exists(self.delta_path):
+            with open(self.delta_path) as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                    except ValueError:
+                        break  # Torn write at the end of the log
+                    # Deltas older than the base were already compacted into it
+                    if delta["seq"] > state["seq"]:
+                        self._apply_delta(state, tiles, enemies, delta)
+
+        state["world"]["tiles"] = list(tiles.values())
+        state["world"]["enemies"] = list(enemies.values())
+        return state
+
+    def _apply_delta(self, state, tiles, enemies, delta):
+        for tile_id in delta["removed_tiles"]:
+            tiles.pop(tile_id, None)
+        for enemy in delta["spawned_enemies"]:
+            enemies[enemy["id"]] = enemy
+        for enemy_id in delta["removed_enemies"]:
+            enemies.pop(enemy_id, None)
+
+        state["seq"] = delta["seq"]
+        state["world"]["flags"] = delta["world_flags"]
+        state["player"] = delta["player"]
+        state["inventory"].update(delta["inventory"])
+
+    def _writer_loop(self):
+        while True:
+            kind, record = self._jobs.get()
+            if kind == "stop":
+                break
+            try:
+                if kind == "base":
+                    self._write_base(record)
+                else:
+                    self._write_delta(record)
+            except OSError as e:
+                print(f"Autosave failed: {e}")
+
+    def _write_base(self, state):
+        self._state = state
+        self._tiles = {tile["id"]: tile for tile in state["world"]["tiles"]}
+        self._enemies = {enemy["id"]: enemy for enemy in state["world"]["enemies"]}
+        self._compact()
+
+    def _write_delta(self, delta):
+        if self._state is None:
+            return
+
+        # Append first so the record is durable even if compaction never runs
+        os.makedirs(self.save_dir, exist_ok=True)
+        with open(self.delta_path, "a") as f:
+            f.write(json.dumps(delta) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._apply_delta(self._state, self._tiles, self._enemies, delta)
+        self._deltas_since_base += 1
+        if self._deltas_since_base >= self.compact_after:
+            self._compact()
+
+    def _compact(self):
+        """Fold all deltas into a fresh base snapshot and truncate the log."""
+        self._state["world"]["tiles"] = list(self._tiles.values())
+        self._state["world"]["enemies"] = list(self._enemies.values())
+
+        os.makedirs(self.save_dir, exist_ok=True)
+        self._write_atomic(self.base_path, json.dumps(self._state))
+        # Stale deltas are skipped by seq on load, so a crash here is harmless
+        self._write_atomic(self.delta_path, "")
+        self._deltas_since_base = 0
+
+    def _write_atomic(self, path, text):
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
@@ -0,0 +1,177 @@
+import random
+import numpy
+
+class FishSchool:
+    """Boids schooling for the fish of one body of water.
+
+    Fish positions (centres) and velocities live in NumPy arrays and the
+    whole school is stepped at once. Neighbours are found through a uniform
+    grid of neighbour_radius cells, so each fish only looks at the fish in
+    the 3x3 cells around it. A water mask built from the water tiles keeps
+    every fish in the water. Only fish near the view are copied back to
+    their Fish objects for drawing.
+    """
+    SEPARATION = 0.05
+    ALIGNMENT = 0.05
+    COHESION = 0.001
+    WANDER = 0.01
+    LOOKAHEAD = 12  # Pixels ahead a fish checks for the shore
+
+    def __init__(self, water_tiles, tile_size, neighbor_radius=32, separation_radius=16,
+                 min_speed=0.2, max_speed=0.8):
+        self.tile_size = tile_size
+        self.neighbor_radius = neighbor_radius
+        self.separation_radius = separation_radius
+        self.min_speed = min_speed
+        self.max_speed = max_speed
+
+        # Water mask over the bounding box of the water tiles
+        cells = [(water["rect"].x // tile_size, water["rect"].y // tile_size) for water in water_tiles]
+        self.first_column = min(column for column, _ in cells)
+        self.first_row = min(row for _, row in cells)
+        columns = max(column for column, _ in cells) - self.first_column + 1
+        rows = max(row for _, row in cells) - self.first_row + 1
+        self.mask = numpy.zeros((columns, rows), dtype=bool)
+        for column, row in cells:
+            self.mask[column - self.first_column, row - self.first_row] = True
+        self.left = self.first_column * tile_size
+        self.width = columns * tile_size
+
+        # Drawn from random so a seeded game schools its fish the same way every run
+        self.rng = numpy.random.default_rng(random.getrandbits(64))
+
+        self.fish = []
+        self.position = numpy.zeros((0, 2))
+        self.velocity = numpy.zeros((0, 2))
+
+    def in_water(self, x, y):
+        """Whether each point is inside the water mask"""
+        columns = numpy.floor(x / self.tile_size).astype(int) - self.first_column
+        rows = numpy.floor(y / self.tile_size).astype(int) - self.first_row
+        inside = (columns >= 0) & (columns < self.mask.shape[0]) & (rows >= 0) & (rows < self.mask.shape[1])
+        result = numpy.zeros(len(columns), dtype=bool)
+        result[inside] = self.mask[columns[inside], rows[inside]]
+        return result
+
+    def random_point(self):
+        """Random point in a random water cell"""
+        columns, rows = numpy.nonzero(self.mask)
+        index = random.randrange(len(columns))
+        return ((self.first_column + columns[index] + random.random()) * self.tile_size,
+                (self.first_row + rows[index] + random.random()) * self.tile_size)
+
+    def add(self, fish):
+        direction = 1 if fish.facing_right else -1
+        self.fish.append(fish)
+        self.position = numpy.vstack([self.position, [fish.x + fish.width / 2, fish.y + fish.height / 2]])
+        self.velocity = numpy.vstack([self.velocity, [direction * fish.speed, 0.0]])
+
+    def remove(self, fish):
+        index = self.fish.index(fish)
+        del self.fish[index]
+        self.position = numpy.delete(self.position, index, axis=0)
+        self.velocity = numpy.delete(self.velocity, index, axis=0)
+
+    def touching(self, rect):
+        """Fish whose body overlaps a pygame.Rect"""
+        if not self.fish:
+            return []
+        width = self.fish[0].width
+        height = self.fish[0].height
+        x = self.position[:, 0] - width / 2
+        y = self.position[:, 1] - height / 2
+        hits = (x < rect.right) & (x + width > rect.left) & (y < rect.bottom) & (y + height > rect.top)
+        return [self.fish[i] for i in numpy.flatnonzero(hits)]
+
+    def neighbor_pairs(self):
+        """Index pairs (i, j) of fish within neighbor_radius, from the uniform grid"""
+        position = self.position
+        count = len(position)
+        cells = numpy.floor(position / self.neighbor_radius).astype(int)
+        cells -= cells.min(axis=0) - 1  # Keep neighbouring cell keys positive
+        stride = cells[:, 1].max() + 2
+        keys = cells[:, 0] * stride + cells[:, 1]
+        order = numpy.argsort(keys)
+        sorted_keys = keys[order]
+
+        firsts = []
+        seconds = []
+        for offset_x in (-1, 0, 1):
+            for offset_y in (-1, 0, 1):
+                target = keys + offset_x * stride + offset_y
+                start = numpy.searchsorted(sorted_keys, target, "left")
+                counts = numpy.searchsorted(sorted_keys, target, "right") - start
+                total = counts.sum()
+                if not total:
+                    continue
+                # Expand every fish into one pair per fish in the target cell
+                firsts.append(numpy.repeat(numpy.arange(count), counts))
+                within = numpy.arange(total) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+                seconds.append(order[numpy.repeat(start, counts) + within])
+        first = numpy.concatenate(firsts)
+        second = numpy.concatenate(seconds)
+
+        offset = position[second] - position[first]
+        distance_sq = (offset ** 2).sum(axis=1)
+        near = (first != second) & (distance_sq < self.neighbor_radius ** 2)
+        return first[near], second[near], offset[near], distance_sq[near]
+
+    def step(self, steps=1):
+        """Advance the school by steps ticks"""
+        count = len(self.fish)
+        if not count:
+            return
+        position = self.position
+        velocity = self.velocity
+        first, second, offset, distance_sq = self.neighbor_pairs()
+
+        neighbors = numpy.bincount(first, minlength=count)
+        has_neighbors = neighbors > 0
+        safe_neighbors = numpy.maximum(neighbors, 1)[:, None]
+        acceleration = self.rng.uniform(-self.WANDER, self.WANDER, (count, 2))
+
+        # Cohesion toward and alignment with the neighbours' average
+        for axis in (0, 1):
+            center = numpy.bincount(first, weights=offset[:, axis], minlength=count) / safe_neighbors[:, 0]
+            heading = numpy.bincount(first, weights=velocity[second, axis], minlength=count) / safe_neighbors[:, 0]
+            acceleration[:, axis] += has_neighbors * (self.COHESION * center +
+                                                      self.ALIGNMENT * (heading - velocity[:, axis]))
+
+        # Separation from fish that are too close
+        close = distance_sq < self.separation_radius ** 2
+        push = -offset[close] / numpy.maximum(distance_sq[close], 1.0)[:, None]
+        for axis in (0, 1):
+            acceleration[:, axis] += self.SEPARATION * numpy.bincount(first[close], weights=push[:, axis],
+                                                                      minlength=count)
+
+        velocity += acceleration * steps
+        speed = numpy.maximum(numpy.hypot(velocity[:, 0], velocity[:, 1]), 1e-6)
+        velocity *= (numpy.clip(speed, self.min_speed, self.max_speed) / speed)[:, None]
+
+        # Turn away before reaching the shore
+        x, y = position[:, 0], position[:, 1]
+        velocity[~self.in_water(x + velocity[:, 0] * self.LOOKAHEAD, y), 0] *= -1
+        velocity[~self.in_water(x, y + velocity[:, 1] * self.LOOKAHEAD), 1] *= -1
+
+        # Move one axis at a time and bounce off anything that isn't water
+        new_x = x + velocity[:, 0] * steps
+        blocked = ~self.in_water(new_x, y)
+        new_x[blocked] = x[blocked]
+        velocity[blocked, 0] *= -1
+        new_y = y + velocity[:, 1] * steps
+        blocked = ~self.in_water(new_x, new_y)
+        new_y[blocked] = y[blocked]
+        velocity[blocked, 1] *= -1
+        position[:, 0] = new_x
+        position[:, 1] = new_y
+
+    def sync(self, left, right):
+        """Copy positions and headings to the Fish objects between x = left and right"""
+        x = self.position[:, 0]
+        for i in numpy.flatnonzero((x >= left) & (x <= right)):
+            fish = self.fish[i]
+            fish.x = self.position[i, 0] - fish.width / 2
+            fish.y = self.position[i, 1] - fish.height / 2
+            fish.facing_right = self.velocity[i, 0] >= 0
+            fish.rect.x = fish.x
+            fish.rect.y = fish.y
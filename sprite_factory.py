@@ -0,0 +1,81 @@
+import os
+import weakref
+import pygame
+
+class SpriteFactory:
+    """Finalizes procedurally drawn surfaces for fast blitting.
+
+    finalize() converts a surface to the display's pixel format once it is
+    drawn: convert() when it is fully opaque, convert_alpha() otherwise,
+    and RLE acceleration when a large part of it is fully transparent.
+    Flipped frames are made once and finalized too. Without a display
+    surface (the texture backend has none) surfaces are converted to the
+    format of the surface given to use_format() instead. With the
+    GAME_DEBUG_SURFACES environment variable set, the render queues pass
+    every blit of the world and screen-space passes to check(), which
+    counts the surfaces that never went through finalize(), and report()
+    lists them.
+    """
+    RLE_TRANSPARENCY = 0.3  # Fraction of fully transparent pixels that makes RLE worthwhile
+
+    def __init__(self):
+        self.finalized = weakref.WeakSet()
+        self.flips = weakref.WeakKeyDictionary()
+        self.tracking = bool(os.environ.get("GAME_DEBUG_SURFACES"))
+        self.unconverted = {}  # (width, height, bits, per-pixel alpha) -> queued blits this run
+        self.opaque_format = None  # Surfaces to convert to when there is no display surface
+        self.alpha_format = None
+
+    def use_format(self, surface):
+        """Convert to surface's format (and 32-bit per-pixel alpha) when there is no display surface"""
+        self.opaque_format = surface
+        self.alpha_format = pygame.Surface((1, 1), pygame.SRCALPHA, 32)
+
+    def finalize(self, surface):
+        """surface in the display format, or surface itself if there is no display yet"""
+        display = pygame.display.get_surface() is not None
+        if surface in self.finalized or not (display or self.opaque_format):
+            return surface
+        opaque = True
+        transparent = 0.0
+        if surface.get_flags() & pygame.SRCALPHA and surface.get_width() and surface.get_height():
+            alpha = pygame.surfarray.array_alpha(surface)
+            opaque = bool((alpha == 255).all())
+            transparent = (alpha == 0).mean()
+        if opaque:
+            result = surface.convert() if display else surface.convert(self.opaque_format)
+        else:
+            result = surface.convert_alpha() if display else surface.convert(self.alpha_format)
+            if transparent >= self.RLE_TRANSPARENCY:
+                result.set_alpha(255, pygame.RLEACCEL)
+        self.finalized.add(result)
+        return result
+
+    def finalize_all(self, surfaces):
+        return [self.finalize(surface) for surface in surfaces]
+
+    def flipped(self, surface):
+        """surface mirrored horizontally, made once per surface"""
+        if surface not in self.flips:
+            self.flips[surface] = self.finalize(pygame.transform.flip(surface, True, False))
+        return self.flips[surface]
+
+    def check(self, surface):
+        """Count a queued blit of surface if it was never finalized"""
+        if surface not in self.finalized:
+            key = (surface.get_width(), surface.get_height(), surface.get_bitsize(),
+                   bool(surface.get_flags() & pygame.SRCALPHA))
+            self.unconverted[key] = self.unconverted.get(key, 0) + 1
+
+    def report(self):
+        """Print the unconverted surfaces the render queue blitted, most blitted first"""
+        if not self.unconverted:
+            print("No unconverted surfaces were blitted by the render queue")
+            return
+        print("Unconverted surfaces blitted by the render queue (width x height, bits, per-pixel alpha: blits):")
+        for key, count in sorted(self.unconverted.items(), key=lambda item: -item[1]):
+            width, height, bits, alpha = key
+            print(f"  {width}x{height}, {bits} bit, {'alpha' if alpha else 'opaque'}: {count}")
+
+# Create a global instance
+sprite_factory = SpriteFactory()
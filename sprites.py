@@ -2,6 +2,7 @@ import pygame
 import os
 import math
 import random
+from sprite_factory import sprite_factory
 
 class SpriteSheet:
     def __init__(self, image, frame_width, frame_height, frames, animation_speed):
@@ -318,18 +319,23 @@ class Character:
         self.swimming_frames.append(swim_frame1)
         self.swimming_frames.append(swim_frame2)
         
+        # Frames in the display format, ready for fast blits
+        self.walking_frames = sprite_factory.finalize_all(self.walking_frames)
+        self.swimming_frames = sprite_factory.finalize_all(self.swimming_frames)
+        
         # Animation properties
         self.current_frame = 0
         self.animation_timer = 0
         self.animation_speed = 12
         
-    def draw(self, screen, x, y, facing_right=True, is_moving=False, is_swimming=False):
-        # Update animation
+    def animate(self, is_moving=False, is_swimming=False):
+        # Advance animation by one simulation tick
         self.animation_timer += 1
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
             self.current_frame = (self.current_frame + 1) % (2 if is_moving or is_swimming else 1)
         
+    def draw(self, screen, x, y, facing_right=True, is_moving=False, is_swimming=False):
         # Select appropriate frame based on movement and swimming state
         if is_swimming:
             # Use swimming animation
@@ -341,7 +347,7 @@ class Character:
         
         # Flip frame if facing left
         if not facing_right:
-            frame = pygame.transform.flip(frame, True, False)
+            frame = sprite_factory.flipped(frame)
             
         # Draw character
         screen.blit(frame, (x, y))
@@ -535,8 +541,9 @@ class Princess:
             temp_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             temp_surface.blit(frame, (0, 0))
             self.walking_frames[i] = temp_surface
+        self.walking_frames = sprite_factory.finalize_all(self.walking_frames)
         
-    def draw(self, screen, x, y, facing_right=True, is_moving=False):
+    def animate(self, is_moving=False):
         # Only update animation timer and frames if the princess is moving
         if is_moving:
             self.animation_timer += 1
@@ -547,11 +554,12 @@ class Princess:
             # When not moving, always show the standing frame (first frame)
             self.current_frame = 0
             
+    def draw(self, screen, x, y, facing_right=True, is_moving=False):
         frame = self.walking_frames[self.current_frame]
         if facing_right:
             screen.blit(frame, (x, y))
         else:
-            flipped = pygame.transform.flip(frame, True, False)
+            flipped = sprite_factory.flipped(frame)
             screen.blit(flipped, (x, y))
 
 class Food:
@@ -656,6 +664,8 @@ class Food:
             pygame.draw.rect(self.surface, (60, 40, 20), (10, 5, 1, 1))
             pygame.draw.rect(self.surface, (60, 40, 20), (7, 10, 1, 1))
             
+        self.surface = sprite_factory.finalize(self.surface)
+            
     def draw(self, screen, x, y):
         screen.blit(self.surface, (x, y))
 
@@ -684,7 +694,7 @@ class Crab:
         self.eye_color = (0, 0, 0)
         
         # Generate the actual sprite frames (can be done in a separate method for clarity)
-        self.walking_frames = self._create_frames()
+        self.walking_frames = sprite_factory.finalize_all(self._create_frames())
         
         # Animation properties
         self.current_frame = 0
@@ -787,17 +797,12 @@ class Crab:
             pygame.draw.rect(surface, claw_col, (11 * pixel_size, 2 * pixel_size, pixel_size, pixel_size)) # Shifted up
 
     def draw(self, screen, x, y, facing_right=True):
-        self.animation_timer += 1
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.walking_frames)
-            
         # If rainbow, update hue and potentially redraw frames (more costly) or use shader (complex)
         # Simple approach: Update hue and redraw current frame if needed (can be slow)
         # Better approach: Use pre-rendered frames or shaders if performance is an issue.
         # Current implementation redraws the frame logic inside _create_frames using current colors.
         if self.is_rainbow:
-             self.rainbow_hue = (self.rainbow_hue + 2) % 360 # Cycle hue speed
+             # Hue is cycled in update()
              # OPTIONAL: Regenerate frames each draw call for perfect colors (performance hit!)
              # self.walking_frames = self._create_frames() 
              
@@ -822,8 +827,11 @@ class Crab:
         
         if facing_right:
             screen.blit(frame, (x, y))
+        elif self.is_rainbow:
+            # A fresh frame every draw, not worth caching
+            screen.blit(pygame.transform.flip(frame, True, False), (x, y))
         else:
-            flipped = pygame.transform.flip(frame, True, False)
+            flipped = sprite_factory.flipped(frame)
             screen.blit(flipped, (x, y))
             
     def can_attack(self):
@@ -839,6 +847,21 @@ class Crab:
         if self.current_cooldown > 0:
             self.current_cooldown -= 1
             
+        # Advance animation by one simulation tick
+        self.animation_timer += 1
+        if self.animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            self.current_frame = (self.current_frame + 1) % len(self.walking_frames)
+        if self.is_rainbow:
+            self.rainbow_hue = (self.rainbow_hue + 2) % 360 # Cycle hue speed
+            
+    def reset(self):
+        """Return to full health for reuse from a pool, keeping the sprite frames"""
+        self.health = self.max_health
+        self.current_cooldown = 0
+        self.current_frame = 0
+        self.animation_timer = 0
+        
     def take_damage(self, amount):
         self.health -= amount
         return self.health <= 0
@@ -892,7 +915,7 @@ class KingCrab:
                        (9 * pixel_size, 3 * pixel_size, 2 * pixel_size, pixel_size))
         
         # Store frames (just one for now, add animation later if needed)
-        self.walking_frames = [self.surface.copy()]
+        self.walking_frames = sprite_factory.finalize_all([self.surface.copy()])
         
         # Animation properties (basic)
         self.current_frame = 0
@@ -908,17 +931,11 @@ class KingCrab:
         self.current_cooldown = 0
         
     def draw(self, screen, x, y, facing_right=True):
-        # Simple animation (if more frames added)
-        self.animation_timer += 1
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.walking_frames)
-            
         frame = self.walking_frames[self.current_frame]
         if facing_right:
             screen.blit(frame, (x, y))
         else:
-            flipped = pygame.transform.flip(frame, True, False)
+            flipped = sprite_factory.flipped(frame)
             screen.blit(flipped, (x, y))
             
     def can_attack(self):
@@ -934,6 +951,19 @@ class KingCrab:
         if self.current_cooldown > 0:
             self.current_cooldown -= 1
             
+        # Simple animation (if more frames added)
+        self.animation_timer += 1
+        if self.animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            self.current_frame = (self.current_frame + 1) % len(self.walking_frames)
+            
+    def reset(self):
+        """Return to full health for reuse from a pool, keeping the sprite frames"""
+        self.health = self.max_health
+        self.current_cooldown = 0
+        self.current_frame = 0
+        self.animation_timer = 0
+        
     def take_damage(self, amount):
         self.health -= amount
         return self.health <= 0 # Return True if defeated 
@@ -1014,6 +1044,7 @@ class Fish:
                                (0 * pixel_size, y * pixel_size, pixel_size, pixel_size))
                 
         self.walking_frames.append(frame2)
+        self.walking_frames = sprite_factory.finalize_all(self.walking_frames)
         
         # Animation properties
         self.current_frame = 0
@@ -1033,7 +1064,7 @@ class Fish:
         if facing_right:
             screen.blit(frame, (x, y))
         else:
-            flipped = pygame.transform.flip(frame, True, False)
+            flipped = sprite_factory.flipped(frame)
             screen.blit(flipped, (x, y))
     
     def update(self):
@@ -1135,6 +1166,7 @@ class Dinosaur:
                                 pixel_size, pixel_size))
                 
         self.walking_frames.append(frame2)
+        self.walking_frames = sprite_factory.finalize_all(self.walking_frames)
         
         # Animation properties
         self.current_frame = 0
@@ -1150,16 +1182,11 @@ class Dinosaur:
         self.current_cooldown = 0
         
     def draw(self, screen, x, y, facing_right=True):
-        self.animation_timer += 1
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.walking_frames)
-            
         frame = self.walking_frames[self.current_frame]
         if facing_right:
             screen.blit(frame, (x, y))
         else:
-            flipped = pygame.transform.flip(frame, True, False)
+            flipped = sprite_factory.flipped(frame)
             screen.blit(flipped, (x, y))
             
     def can_attack(self):
@@ -1175,6 +1202,19 @@ class Dinosaur:
         if self.current_cooldown > 0:
             self.current_cooldown -= 1
             
+        # Advance animation by one simulation tick
+        self.animation_timer += 1
+        if self.animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            self.current_frame = (self.current_frame + 1) % len(self.walking_frames)
+            
+    def reset(self):
+        """Return to full health for reuse from a pool, keeping the sprite frames"""
+        self.health = self.max_health
+        self.current_cooldown = 0
+        self.current_frame = 0
+        self.animation_timer = 0
+        
     def take_damage(self, amount):
         self.health -= amount
         return self.health <= 0
@@ -0,0 +1,255 @@
+import math
+import numpy
+import pygame
+
+# Ids used in the terrain grid (0 is empty)
+TERRAIN_TYPES = {"grass": 1, "dirt": 2, "stone": 3}
+TERRAIN_COLORS = {1: (100, 200, 100), 2: (139, 69, 19), 3: (128, 128, 128)}
+
+def is_terrain_tile(tile, tile_size):
+    """Grid-aligned ground blocks. Trees and level 1 rocks carry a variant and stand free."""
+    return (tile["type"] in TERRAIN_TYPES and "variant" not in tile and
+            tile["rect"].width == tile_size and tile["rect"].height == tile_size)
+
+class Terrain:
+    """Tile-id grid of the ground blocks plus greedy-meshed rectangles over it.
+
+    Each column is split into vertical runs of one tile type, then identical
+    runs in neighbouring columns are merged, so flat ground becomes a handful
+    of rectangles. Changing a cell only re-meshes the columns it affects.
+
+    The grid is also the collision and line-of-sight map. Bodies are swept
+    one axis at a time against only the cells their leading edge crosses, and
+    rays are walked cell by cell, both for arrays of bodies or rays at once.
+    Below the grid counts as solid, beside and above it as empty.
+    """
+    def __init__(self, tiles, tile_size, step_height=None):
+        self.tile_size = tile_size
+        self.step_height = tile_size if step_height is None else step_height  # Ledges walked up without jumping
+        terrain_tiles = [tile for tile in tiles if is_terrain_tile(tile, tile_size)]
+
+        # All terrain in a level shares one alignment, which need not be 0
+        if terrain_tiles:
+            self.origin_x = terrain_tiles[0]["rect"].x % tile_size
+            self.origin_y = terrain_tiles[0]["rect"].y % tile_size
+            columns = max(self.cell_of(tile["rect"])[0] for tile in terrain_tiles) + 1
+            rows = max(self.cell_of(tile["rect"])[1] for tile in terrain_tiles) + 1
+        else:
+            self.origin_x = self.origin_y = 0
+            columns = rows = 1
+
+        self.grid = numpy.zeros((columns, rows), dtype=numpy.uint8)
+        # The jungle lake bed is laid over existing stone, so cells can hold two tiles
+        self.counts = numpy.zeros((columns, rows), dtype=numpy.uint8)
+        for tile in terrain_tiles:
+            column, row = self.cell_of(tile["rect"])
+            self.grid[column, row] = TERRAIN_TYPES[tile["type"]]
+            self.counts[column, row] += 1
+
+        self.rects = []  # (type id, first column, last column + 1, top row, bottom row + 1)
+        self.version = 0  # Bumped whenever a cell changes
+        self.remesh(0, columns - 1)
+
+    @property
+    def columns(self):
+        return self.grid.shape[0]
+
+    @property
+    def rows(self):
+        return self.grid.shape[1]
+
+    def cell_of(self, rect):
+        return ((rect.x - self.origin_x) // self.tile_size,
+                (rect.y - self.origin_y) // self.tile_size)
+
+    def world_rect(self, mesh_rect):
+        """World-space pygame.Rect of a meshed rectangle"""
+        _, first, last, top, bottom = mesh_rect
+        return pygame.Rect(self.origin_x + first * self.tile_size, self.origin_y + top * self.tile_size,
+                           (last - first) * self.tile_size, (bottom - top) * self.tile_size)
+
+    def remove_tile(self, tile):
+        """Clear a terrain tile's cell and re-mesh around it"""
+        column, row = self.cell_of(tile["rect"])
+        self.counts[column, row] -= 1
+        if self.counts[column, row] == 0:
+            self.grid[column, row] = 0
+            self.version += 1
+            self.remesh(column, column)
+
+    def surface_y(self, x, width):
+        """Top of the highest ground under a body spanning x..x+width, for placing it"""
+        first = max(0, int((x - self.origin_x) // self.tile_size))
+        last = min(self.columns - 1, int(math.ceil((x + width - self.origin_x) / self.tile_size)) - 1)
+        tops = [int(numpy.argmax(self.grid[column] > 0)) for column in range(first, last + 1) if self.grid[column].any()]
+        row = min(tops) if tops else self.rows
+        return self.origin_y + row * self.tile_size
+
+    def solid(self, columns, rows):
+        """Whether each (column, row) cell is solid, for integer arrays"""
+        inside = (columns >= 0) & (columns < self.columns) & (rows >= 0) & (rows < self.rows)
+        result = rows >= self.rows
+        result[inside] = self.grid[columns[inside], rows[inside]] > 0
+        return result
+
+    def cell_span(self, start, size, origin):
+        """First and last cell index covered by start..start+size"""
+        first = numpy.floor((start - origin) / self.tile_size).astype(int)
+        last = numpy.ceil((start + size - origin) / self.tile_size).astype(int) - 1
+        return first, last
+
+    def sweep(self, position, size, delta, cross_position, cross_size, origin, cross_origin, horizontal):
+        """Move bodies along one axis until their leading edge meets a solid cell.
+
+        Returns the new positions and a mask of the bodies that were stopped.
+        """
+        tile_size = self.tile_size
+        forward = delta > 0
+        # Cells are entered when the leading edge passes their near side
+        edge = numpy.where(forward, position + size, position)
+        near_offset = numpy.where(forward, 0, tile_size)
+        first = numpy.where(forward, numpy.ceil((edge - origin) / tile_size),
+                            numpy.floor((edge - origin) / tile_size) - 1).astype(int)
+        last = numpy.where(forward, numpy.ceil((edge + delta - origin) / tile_size) - 1,
+                           numpy.floor((edge + delta - origin) / tile_size)).astype(int)
+        step = numpy.where(forward, 1, -1)
+        crossed = numpy.maximum(0, (last - first) * step + 1)
+        crossed[delta == 0] = 0
+        cross_first, cross_last = self.cell_span(cross_position, cross_size, cross_origin)
+
+        new_position = position + delta
+        hit = numpy.zeros(len(position), dtype=bool)
+        # Loop over the few cells crossed and spanned, vectorized over bodies
+        for k in range(int(crossed.max()) if len(crossed) else 0):
+            line = first + k * step
+            pending = (k < crossed) & ~hit
+            if not pending.any():
+                break
+            blocked = numpy.zeros(len(position), dtype=bool)
+            for j in range(int((cross_last - cross_first).max()) + 1):
+                across = cross_first + j
+                cells = (line, across) if horizontal else (across, line)
+                blocked |= pending & (across <= cross_last) & self.solid(*cells)
+            stop = origin + line * tile_size + near_offset
+            new_position = numpy.where(blocked, numpy.where(forward, stop - size, stop), new_position)
+            hit |= blocked
+        return new_position, hit
+
+    def move_x(self, x, y, width, height, dx):
+        """Sweep bodies horizontally, stepping up ledges no taller than step_height"""
+        new_x, hit = self.sweep(x, width, dx, y, height, self.origin_x, self.origin_y, True)
+        new_y = y
+        if hit.any() and self.step_height:
+            # Retry the blocked bodies lifted by a step, then set them back down
+            lifted_y, _ = self.sweep(y[hit], height[hit], numpy.full(hit.sum(), -float(self.step_height)),
+                                     x[hit], width[hit], self.origin_y, self.origin_x, False)
+            stepped_x, stepped_hit = self.sweep(x[hit], width[hit], dx[hit], lifted_y, height[hit],
+                                                self.origin_x, self.origin_y, True)
+            climbed = numpy.abs(stepped_x - x[hit]) > numpy.abs(new_x[hit] - x[hit])
+            landed_y, _ = self.sweep(lifted_y, height[hit], y[hit] - lifted_y, stepped_x, width[hit],
+                                     self.origin_y, self.origin_x, False)
+            new_x = new_x.copy()
+            new_y = y.copy()
+            indices = numpy.flatnonzero(hit)[climbed]
+            new_x[indices] = stepped_x[climbed]
+            new_y[indices] = landed_y[climbed]
+            hit[indices] = stepped_hit[climbed]
+        return new_x, new_y, hit
+
+    def move_y(self, x, y, width, height, dy):
+        """Sweep bodies vertically; the mask marks bodies that landed or hit a ceiling"""
+        return self.sweep(y, height, dy, x, width, self.origin_y, self.origin_x, False)
+
+    def raycast(self, x0, y0, x1, y1):
+        """Whether each segment from (x0, y0) to (x1, y1) crosses no solid cell.
+
+        A vectorized DDA: every ray steps to the next cell boundary it meets,
+        so a ray costs one grid read per cell it passes through.
+        """
+        tile_size = self.tile_size
+        start_x = (x0 - self.origin_x) / tile_size
+        start_y = (y0 - self.origin_y) / tile_size
+        delta_x = (x1 - self.origin_x) / tile_size - start_x
+        delta_y = (y1 - self.origin_y) / tile_size - start_y
+        columns = numpy.floor(start_x).astype(int)
+        rows = numpy.floor(start_y).astype(int)
+        step_x = numpy.sign(delta_x).astype(int)
+        step_y = numpy.sign(delta_y).astype(int)
+        # Cells left to cross before reaching the end cell
+        remaining = (numpy.abs(numpy.floor(start_x + delta_x).astype(int) - columns) +
+                     numpy.abs(numpy.floor(start_y + delta_y).astype(int) - rows))
+
+        # Ray parameter (0 to 1) of the next vertical and horizontal cell boundary
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            t_delta_x = numpy.where(delta_x != 0, numpy.abs(1 / delta_x), numpy.inf)
+            t_delta_y = numpy.where(delta_y != 0, numpy.abs(1 / delta_y), numpy.inf)
+            t_max_x = numpy.where(delta_x > 0, (columns + 1 - start_x) / delta_x,
+                                  numpy.where(delta_x < 0, (start_x - columns) / -delta_x, numpy.inf))
+            t_max_y = numpy.where(delta_y > 0, (rows + 1 - start_y) / delta_y,
+                                  numpy.where(delta_y < 0, (start_y - rows) / -delta_y, numpy.inf))
+
+        clear = ~self.solid(columns, rows)
+        for _ in range(int(remaining.max()) if len(remaining) else 0):
+            active = clear & (remaining > 0)
+            if not active.any():
+                break
+            across = active & (t_max_x < t_max_y)
+            down = active & ~across
+            columns = numpy.where(across, columns + step_x, columns)
+            t_max_x = numpy.where(across, t_max_x + t_delta_x, t_max_x)
+            rows = numpy.where(down, rows + step_y, rows)
+            t_max_y = numpy.where(down, t_max_y + t_delta_y, t_max_y)
+            remaining -= active
+            clear &= ~(active & self.solid(columns, rows))
+        return clear
+
+    def move_body(self, x, y, width, height, dx, dy):
+        """Sweep a single body along x then y and return (x, y, hit_x, hit_y)"""
+        xs, ys, hit_x = self.move_x(numpy.array([x], dtype=float), numpy.array([y], dtype=float),
+                                    numpy.array([width]), numpy.array([height]), numpy.array([dx], dtype=float))
+        ys, hit_y = self.move_y(xs, ys, numpy.array([width]), numpy.array([height]), numpy.array([dy], dtype=float))
+        return float(xs[0]), float(ys[0]), bool(hit_x[0]), bool(hit_y[0])
+
+    def column_runs(self, column):
+        """Vertical runs of one tile type in a column, as (type, top, bottom)"""
+        cells = self.grid[column]
+        runs = []
+        # Run boundaries are wherever the type changes
+        edges = numpy.flatnonzero(numpy.diff(cells)) + 1
+        start = 0
+        for end in list(edges) + [len(cells)]:
+            if cells[start]:
+                runs.append((int(cells[start]), start, int(end)))
+            start = end
+        return runs
+
+    def remesh(self, first, last):
+        """Rebuild the rectangles covering columns first..last"""
+        # Rectangles crossing the region must be rebuilt too, which can widen it
+        while True:
+            touching = [rect for rect in self.rects if rect[1] <= last and rect[2] > first]
+            widened_first = min([first] + [rect[1] for rect in touching])
+            widened_last = max([last] + [rect[2] - 1 for rect in touching])
+            if (widened_first, widened_last) == (first, last):
+                break
+            first, last = widened_first, widened_last
+        self.rects = [rect for rect in self.rects if rect[2] <= first or rect[1] > last]
+
+        # Merge identical runs across neighbouring columns
+        open_runs = {}  # (type, top, bottom) -> first column
+        for column in range(first, last + 2):
+            runs = set(self.column_runs(column)) if column <= last else set()
+            for run, start in list(open_runs.items()):
+                if run not in runs:
+                    self.rects.append((run[0], start, column, run[1], run[2]))
+                    del open_runs[run]
+            for run in runs:
+                if run not in open_runs:
+                    open_runs[run] = column
+
+    def draw(self, screen, camera_x, camera_y=0):
+        screen_rect = screen.get_rect()
+        for mesh_rect in self.rects:
+            rect = self.world_rect(mesh_rect).move(-camera_x, -camera_y)
+            if rect.colliderect(screen_rect):
+                screen.fill(TERRAIN_COLORS[mesh_rect[0]], rect)
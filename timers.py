@@ -0,0 +1,76 @@
+class Timer:
+    """Handle for a scheduled callback, returned by TimerWheel.schedule"""
+    __slots__ = ("expires", "callback", "active")
+
+    def __init__(self, expires, callback):
+        self.expires = expires  # Tick at which the callback fires
+        self.callback = callback
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+class TimerWheel:
+    """Hierarchical timing wheel that fires callbacks at a target tick.
+
+    Level 0 has one slot per tick; each higher level has slots covering a
+    whole turn of the level below and is cascaded down as time reaches it.
+    Scheduling, cancelling and advancing are O(1) amortized, so waiting
+    objects cost nothing per tick.
+    """
+    def __init__(self, slot_bits=6, levels=4):
+        self.slot_bits = slot_bits
+        self.slot_mask = (1 << slot_bits) - 1
+        self.levels = levels
+        self.wheels = [[[] for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self.now = 0  # Current tick
+
+    def schedule(self, delay, callback):
+        """Call callback() after delay ticks (at least one) and return its Timer"""
+        timer = Timer(self.now + max(1, int(delay)), callback)
+        self._insert(timer)
+        return timer
+
+    def remaining(self, timer):
+        """Ticks left before timer fires, or 0 if it fired or was cancelled"""
+        if timer is None or not timer.active:
+            return 0
+        return max(0, timer.expires - self.now)
+
+    def _insert(self, timer):
+        delta = timer.expires - self.now
+        for level in range(self.levels):
+            # A level covers deltas up to one full turn of its slots
+            if delta < 1 << (self.slot_bits * (level + 1)) or level == self.levels - 1:
+                slot = (timer.expires >> (self.slot_bits * level)) & self.slot_mask
+                self.wheels[level][slot].append(timer)
+                return
+
+    def _cascade(self, level):
+        """Move timers from the current slot of level down to lower levels"""
+        slot = (self.now >> (self.slot_bits * level)) & self.slot_mask
+        timers = self.wheels[level][slot]
+        self.wheels[level][slot] = []
+        for timer in timers:
+            if timer.active:
+                self._insert(timer)
+        return slot
+
+    def advance(self):
+        """Advance one tick and fire every timer that is due"""
+        self.now += 1
+
+        # When a level wraps, pull the next slot of the level above down
+        level = 0
+        while level + 1 < self.levels and (self.now >> (self.slot_bits * level)) & self.slot_mask == 0:
+            level += 1
+            if self._cascade(level) != 0:
+                break
+
+        slot = self.now & self.slot_mask
+        due = self.wheels[0][slot]
+        self.wheels[0][slot] = []
+        for timer in due:
+            if timer.active:
+                timer.active = False
+                timer.callback()
@@ -1,7 +1,11 @@
 import pygame
 import math
+from sprite_factory import sprite_factory
+from asset_loader import asset_loader
 
 class ToolSprite:
+    name = None  # Custom images are loaded from assets/tools/<name>.png
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -12,8 +16,8 @@ class ToolSprite:
         if not facing_right:
             angle = -angle
             
-        # Create a copy of the surface for animation
-        anim_surface = self.surface.copy()
+        # Create a copy of the surface for animation, a custom image if there is one
+        anim_surface = self.image().copy()
         
         if is_swinging:
             # Add a trail effect when swinging (more pixelated for 16-bit style)
@@ -47,9 +51,21 @@ class ToolSprite:
         screen.blit(rotated, (x - rotated.get_width()//2, y - rotated.get_height()//2))
         
     def draw_inventory(self, screen, x, y):
-        screen.blit(self.inventory_surface, (x, y))
+        image = asset_loader.get_tool_sprite(self.name)
+        screen.blit(image or self.inventory_surface, (x, y))
+
+    def image(self):
+        """The loaded assets/tools image (picked up again when it is edited), else the drawn one"""
+        return asset_loader.get_tool_sprite(self.name) or self.surface
+
+    def finalize(self):
+        """Convert the finished surfaces to the display format"""
+        self.surface = sprite_factory.finalize(self.surface)
+        self.inventory_surface = sprite_factory.finalize(self.inventory_surface)
 
 class AxeSprite(ToolSprite):
+    name = "axe"
+    
     def __init__(self):
         super().__init__(32, 32)
         # Define pixel size for 16-bit look
@@ -93,8 +109,11 @@ class AxeSprite(ToolSprite):
                           (26, 12 + i * 2, pixel_size, pixel_size))
             pygame.draw.rect(self.inventory_surface, edge_color, 
                           (28, 12 + i * 2, pixel_size, pixel_size))
+        self.finalize()
 
 class PickaxeSprite(ToolSprite):
+    name = "pickaxe"
+    
     def __init__(self):
         super().__init__(32, 32)
         # Define pixel size for 16-bit look
@@ -141,13 +160,20 @@ class PickaxeSprite(ToolSprite):
                           (26, 12 + i * 4, pixel_size, pixel_size))
             pygame.draw.rect(self.inventory_surface, edge_color, 
                           (28, 12 + i * 4, pixel_size, pixel_size))
+        self.finalize()
 
 class SwordSprite:
     def __init__(self):
         self.width = 32
         self.height = 32
         
-    def draw(self, screen, x, y, angle=0, facing_right=True, is_swinging=False):
+        # The blade's highlight is on its right edge facing right and its left
+        # edge facing left; the left-facing sword is then mirrored
+        self.right = sprite_factory.finalize(self.create_surface(17))
+        self.left = sprite_factory.flipped(self.create_surface(15))
+        self.inventory_surface = sprite_factory.finalize(self.create_inventory_surface())
+        
+    def create_surface(self, highlight_x):
         # Create surface for sword
         sword_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
@@ -163,36 +189,28 @@ class SwordSprite:
         pygame.draw.rect(sword_surface, guard_color, (7, 14, 18, 4))
         
         # Draw blade
-        if facing_right:
-            # Draw blade pointing right
-            points = [(15, 2), (17, 2), (17, 14), (15, 14)]
-        else:
-            # Draw blade pointing left
-            points = [(15, 2), (17, 2), (17, 14), (15, 14)]
-            
+        points = [(15, 2), (17, 2), (17, 14), (15, 14)]
         pygame.draw.polygon(sword_surface, blade_color, points)
         
         # Draw blade edge/highlight
-        if facing_right:
-            pygame.draw.line(sword_surface, (255, 255, 255), (17, 2), (17, 14), 1)
-        else:
-            pygame.draw.line(sword_surface, (255, 255, 255), (15, 2), (15, 14), 1)
+        pygame.draw.line(sword_surface, (255, 255, 255), (highlight_x, 2), (highlight_x, 14), 1)
+        return sword_surface
+        
+    def draw(self, screen, x, y, angle=0, facing_right=True, is_swinging=False):
+        sword_surface = self.right if facing_right else self.left
         
         # Apply rotation for swing animation
         if is_swinging:
-            # Rotate based on angle for swing animation
+            # Rotate based on angle for swing animation; the left-facing sprite is
+            # already mirrored, so it turns the opposite way
             offset = 30 if facing_right else -30
             rotation_angle = offset - angle * (1 if facing_right else -1)
-            sword_surface = pygame.transform.rotate(sword_surface, rotation_angle)
-        
-        # Flip if facing left
-        if not facing_right:
-            sword_surface = pygame.transform.flip(sword_surface, True, False)
+            sword_surface = pygame.transform.rotate(sword_surface, rotation_angle if facing_right else -rotation_angle)
         
         # Draw to screen
         screen.blit(sword_surface, (x, y))
     
-    def draw_inventory(self, screen, x, y):
+    def create_inventory_surface(self):
         # Create a simpler version for inventory display
         inventory_surface = pygame.Surface((24, 24), pygame.SRCALPHA)
         
@@ -209,11 +227,14 @@ class SwordSprite:
         
         # Draw blade
         pygame.draw.rect(inventory_surface, blade_color, (10, 2, 4, 9))
+        return inventory_surface
         
-        # Draw to screen
-        screen.blit(inventory_surface, (x, y))
+    def draw_inventory(self, screen, x, y):
+        screen.blit(self.inventory_surface, (x, y))
 
 class HammerSprite(ToolSprite):
+    name = "hammer"
+    
     def __init__(self):
         super().__init__(32, 32)
         # Define pixel size for 16-bit look
@@ -264,4 +285,5 @@ class HammerSprite(ToolSprite):
         # Bottom part
         for x in range(4):
             pygame.draw.rect(self.inventory_surface, hammer_color, 
-                          (24 + x * pixel_size, 20, pixel_size, pixel_size)) 
\ No newline at end of file
+                          (24 + x * pixel_size, 20, pixel_size, pixel_size))
+        self.finalize()
@@ -2,33 +2,42 @@ import pygame
 import math
 
 class Tool:
-    def __init__(self, name, damage, cooldown):
+    def __init__(self, name, damage, cooldown, timers):
         self.name = name
         self.damage = damage
-        self.cooldown = cooldown
-        self.current_cooldown = 0
-        self.animation_frame = 0
+        self.cooldown = cooldown  # Ticks between uses
+        self.timers = timers  # Shared TimerWheel, used as the clock
+        self.ready_tick = 0  # Tick at which the tool can be used again
+        self.swing_frame = 0
         self.is_swinging = False
         
-    def update(self):
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
+    @property
+    def current_cooldown(self):
+        # Derived from the clock, so idle tools cost nothing per tick
+        return max(0, self.ready_tick - self.timers.now)
+        
+    @property
+    def animation_frame(self):
+        remaining = self.current_cooldown
+        if remaining > 0:
+            return int((self.cooldown - remaining) / self.cooldown * 5)
+        return 0
             
     def can_use(self):
         return self.current_cooldown == 0
         
     def use(self):
         if self.can_use():
-            self.current_cooldown = self.cooldown
+            self.ready_tick = self.timers.now + self.cooldown
             self.is_swinging = True
-            self.animation_frame = 0
+            self.swing_frame = 0
             return True
         return False
         
     def draw(self, screen, x, y, facing_right):
         # Draw tool animation
         if self.is_swinging:
-            angle = math.sin(self.animation_frame * 0.5) * 45
+            angle = math.sin(self.swing_frame * 0.5) * 45
             if not facing_right:
                 angle = -angle
                 
@@ -55,21 +64,13 @@ class Tool:
                             head_y - head_size//2,
                             head_size, head_size))
             
-            self.animation_frame += 1
-            if self.animation_frame >= 20:
+            self.swing_frame += 1
+            if self.swing_frame >= 20:
                 self.is_swinging = False
 
-class Axe(Tool):
-    def __init__(self):
-        super().__init__("axe", 2, 20)
-        
-class Pickaxe(Tool):
-    def __init__(self):
-        super().__init__("pickaxe", 2, 20)
-        
 class Hammer(Tool):
-    def __init__(self):
-        super().__init__("hammer", 1, 15)
+    def __init__(self, timers):
+        super().__init__("hammer", 1, 15, timers)
 
 class BuildingSystem:
     def __init__(self):
@@ -107,64 +108,18 @@ class BuildingSystem:
             inventory[material] -= amount
         return True
 
-class Axe:
-    def __init__(self):
-        self.cooldown = 30  # Frames between uses
-        self.current_cooldown = 0
-        self.animation_frame = 0
-        
-    def use(self):
-        if self.current_cooldown <= 0:
-            self.current_cooldown = self.cooldown
-            return True
-        return False
-        
-    def update(self):
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
-            self.animation_frame = int((self.cooldown - self.current_cooldown) / self.cooldown * 5)
-        else:
-            self.animation_frame = 0
+class Axe(Tool):
+    def __init__(self, timers):
+        super().__init__("axe", 2, 30, timers)  # 30 ticks between uses
 
-class Pickaxe:
-    def __init__(self):
-        self.cooldown = 45  # Frames between uses (slower than axe)
-        self.current_cooldown = 0
-        self.animation_frame = 0
-        
-    def use(self):
-        if self.current_cooldown <= 0:
-            self.current_cooldown = self.cooldown
-            return True
-        return False
-        
-    def update(self):
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
-            self.animation_frame = int((self.cooldown - self.current_cooldown) / self.cooldown * 5)
-        else:
-            self.animation_frame = 0
+class Pickaxe(Tool):
+    def __init__(self, timers):
+        super().__init__("pickaxe", 2, 45, timers)  # Slower than axe
 
-class Sword:
-    def __init__(self):
-        self.cooldown = 20  # Frames between uses (faster than axe)
-        self.current_cooldown = 0
-        self.animation_frame = 0
-        self.damage = 15  # Base damage higher than basic tools
-        
-    def use(self):
-        if self.current_cooldown <= 0:
-            self.current_cooldown = self.cooldown
-            return True
-        return False
-        
-    def update(self):
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
-            self.animation_frame = int((self.cooldown - self.current_cooldown) / self.cooldown * 5)
-        else:
-            self.animation_frame = 0
+class Sword(Tool):
+    def __init__(self, timers):
+        super().__init__("sword", 15, 20, timers)  # Faster than axe, higher base damage
             
     def get_damage(self, player_level):
         # Increase damage based on player level
-        return self.damage + (player_level * 2)  # +2 damage per level 
\ No newline at end of file
+        return self.damage + (player_level * 2)  # +2 damage per level 
@@ -1,7 +1,9 @@
 import pygame
+from collections import deque
+from sprite_factory import sprite_factory
 
 class Tooltip:
-    def __init__(self):
+    def __init__(self, timers):
         self.tooltips = {
             "movement": "WASD/Arrows: Move",
             "jump": "Space: Jump",
@@ -13,66 +15,106 @@ class Tooltip:
             "inventory_select": "Space/Enter: Select Tool"
         }
         self.font = pygame.font.Font(None, 24)
+        self.timers = timers
         self.show_help = True
+        self.panel = None  # Tooltip panel and help line, rendered on first draw
+        self.help_text = None
         self.help_timeout = 300  # Show help for 5 seconds (60 fps * 5)
-        self.help_timer = self.help_timeout
+        self.help_timer = self.timers.schedule(self.help_timeout, self.hide_help)
         
-    def update(self):
-        if self.help_timer > 0:
-            self.help_timer -= 1
-        else:
-            self.show_help = False
+    def hide_help(self):
+        self.show_help = False
             
     def toggle_help(self):
         self.show_help = not self.show_help
+        self.help_timer.cancel()
         if self.show_help:
-            self.help_timer = self.help_timeout
+            self.help_timer = self.timers.schedule(self.help_timeout, self.hide_help)
             
     def draw(self, screen):
         if self.show_help:
-            # Create semi-transparent background for tooltips
-            tooltip_surface = pygame.Surface((300, 240), pygame.SRCALPHA)
-            tooltip_surface.fill((0, 0, 0, 150))
-            
-            # Draw tooltips
-            y_offset = 10
-            for name, text in self.tooltips.items():
-                tooltip_text = self.font.render(text, True, (255, 255, 255))
-                tooltip_surface.blit(tooltip_text, (10, y_offset))
-                y_offset += 30
+            if self.panel is None:
+                self.render_panel()
                 
             # Draw to screen
-            screen.blit(tooltip_surface, (10, 50))
+            screen.blit(self.panel, (10, 50))
             
             # Draw help toggle instructions
-            help_text = self.font.render("Press H to hide/show help", True, (255, 255, 255))
-            screen.blit(help_text, (10, 300))
+            screen.blit(self.help_text, (10, 300))
+            
+    def render_panel(self):
+        """Render the tooltips once, drawing only needs to blit them"""
+        # Create semi-transparent background for tooltips
+        tooltip_surface = pygame.Surface((300, 240), pygame.SRCALPHA)
+        tooltip_surface.fill((0, 0, 0, 150))
+        
+        # Draw tooltips
+        y_offset = 10
+        for name, text in self.tooltips.items():
+            tooltip_text = self.font.render(text, True, (255, 255, 255))
+            tooltip_surface.blit(tooltip_text, (10, y_offset))
+            y_offset += 30
+        self.panel = sprite_factory.finalize(tooltip_surface)
+        self.help_text = sprite_factory.finalize(self.font.render("Press H to hide/show help", True, (255, 255, 255)))
 
 class NotificationSystem:
-    def __init__(self):
-        self.notifications = []
+    def __init__(self, timers, capacity=8):
+        # Bounded ring buffer, the oldest toast is dropped when it is full
+        self.notifications = deque()
+        self.capacity = capacity
+        self.by_text = {}  # Active notification for each message, for coalescing
         self.font = pygame.font.Font(None, 24)
+        self.timers = timers
         
     def add_notification(self, text, duration=90):  # 1.5 seconds at 60fps
-        self.notifications.append({"text": text, "duration": duration})
+        notification = self.by_text.get(text)
+        if notification:
+            # Repeated message - bump its counter and restart its timer
+            notification["count"] += 1
+            notification["timer"].cancel()
+        else:
+            if len(self.notifications) >= self.capacity:
+                self.expire(self.notifications[0])
+            notification = {"text": text, "count": 1}
+            self.notifications.append(notification)
+            self.by_text[text] = notification
+            
+        # Expire through the timer wheel instead of counting down every frame
+        notification["timer"] = self.timers.schedule(duration, lambda: self.expire(notification))
+        notification["alpha"] = None
+        self.render_toast(notification)
         
-    def update(self):
-        # Update notification timers and remove expired ones
-        self.notifications = [n for n in self.notifications if n["duration"] > 0]
-        for notification in self.notifications:
-            notification["duration"] -= 1
+    def render_toast(self, notification):
+        """Render the toast once, drawing only needs to blit it"""
+        text = notification["text"]
+        if notification["count"] > 1:
+            text = f"{text} x{notification['count']}"
+        notification_text = self.font.render(text, True, (255, 255, 255))
+        width, height = notification_text.get_size()
+        
+        # Background sits 5px up and left of the text
+        toast = pygame.Surface((width + 5, height + 5), pygame.SRCALPHA)
+        toast.fill((0, 0, 0, 150), (0, 0, width, height))
+        toast.blit(notification_text, (5, 5))
+        notification["surface"] = sprite_factory.finalize(toast)
+        
+    def expire(self, notification):
+        notification["timer"].cancel()
+        self.notifications.remove(notification)
+        del self.by_text[notification["text"]]
             
     def draw(self, screen):
         y_offset = 50  # Start at the top
         for notification in self.notifications:
-            alpha = min(255, notification["duration"] * 3)
-            notification_text = self.font.render(notification["text"], True, (255, 255, 255))
-            text_surface = pygame.Surface(notification_text.get_size(), pygame.SRCALPHA)
-            text_surface.fill((0, 0, 0, min(150, alpha)))
+            # Fade out with surface alpha instead of re-rendering
+            alpha = min(255, self.timers.remaining(notification["timer"]) * 3)
+            toast = notification["surface"]
+            if alpha != notification["alpha"]:
+                toast.set_alpha(alpha)
+                notification["alpha"] = alpha
             
             # Position on the right side of the screen with some padding
-            x_position = screen.get_width() - notification_text.get_width() - 20
+            x_position = screen.get_width() - toast.get_width() - 15
             
-            screen.blit(text_surface, (x_position - 5, y_offset - 5))
-            screen.blit(notification_text, (x_position, y_offset))
-            y_offset += 40 
\ No newline at end of file
+            screen.blit(toast, (x_position - 5, y_offset - 5))
+            y_offset += 40 